@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional, Union
+
+
+@contextmanager
+def atomic_open(path: Union[str, Path], mode: str = "wb", encoding: Optional[str] = None) -> Iterator[IO]:
+    """Write to a temp file next to ``path``; it replaces ``path`` only if the block completes.
+
+    Readers see the old file or the new one, never a partial write.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as handle:
+            yield handle
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def write_atomic(path: Union[str, Path], payload: bytes) -> None:
+    with atomic_open(path) as handle:
+        handle.write(payload)
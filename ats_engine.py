@@ -1,14 +1,9 @@
 from typing import List, Dict, Any
 
-# 🔥 MUST match jd_parser aliases
-SKILL_NORMALIZATION = {
-    "aws": "amazon web services",
-    "k8s": "kubernetes",
-    "github action": "github actions",
-    "gh actions": "github actions",
-    "js": "javascript",
-    "tf": "terraform",
-}
+from skill_taxonomy import get_taxonomy
+
+# shared with jd_parser via the skill taxonomy
+SKILL_NORMALIZATION: Dict[str, str] = get_taxonomy().normalization
 
 
 class ATSEngine:
@@ -1,4 +1,16 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+
+def skill_scores(
+    required_total: int,
+    required_matched: int,
+    preferred_total: int,
+    preferred_matched: int,
+) -> Tuple[float, float, float]:
+    """Unrounded ``(required, preferred, final)`` scores from overlap counts."""
+    req_score = (required_matched / required_total) * 100 if required_total else 100.0
+    pref_score = (preferred_matched / preferred_total) * 100 if preferred_total else 100.0
+    return req_score, pref_score, (0.7 * req_score) + (0.3 * pref_score)
 
 
 class WeightedSkillMatcher:
@@ -13,43 +25,26 @@ class WeightedSkillMatcher:
         self.preferred = set(s.lower() for s in preferred_skills)
         self.candidate = set(s.lower() for s in candidate_skills)
 
-    # =============================
-    # Required score (heavy weight)
-    # =============================
-    def _required_score(self) -> float:
-        if not self.required:
-            return 100.0
-
-        matched = self.required.intersection(self.candidate)
-        return (len(matched) / len(self.required)) * 100
-
-    # =============================
-    # Preferred score (lighter)
-    # =============================
-    def _preferred_score(self) -> float:
-        if not self.preferred:
-            return 100.0
-
-        matched = self.preferred.intersection(self.candidate)
-        return (len(matched) / len(self.preferred)) * 100
-
     # =============================
     # Final weighted skill score
     # =============================
     def compute(self) -> Dict[str, Any]:
-        req_score = self._required_score()
-        pref_score = self._preferred_score()
-
-        final_skill_score = (0.7 * req_score) + (0.3 * pref_score)
+        req_score, pref_score, final_skill_score = skill_scores(
+            len(self.required),
+            len(self.required & self.candidate),
+            len(self.preferred),
+            len(self.preferred & self.candidate),
+        )
 
         return {
             "required_score": round(req_score, 2),
             "preferred_score": round(pref_score, 2),
             "final_skill_score": round(final_skill_score, 2),
-            "strength": self._label(final_skill_score),
+            "strength": self.label(final_skill_score),
         }
 
-    def _label(self, score: float) -> str:
+    @staticmethod
+    def label(score: float) -> str:
         if score >= 80:
             return "Strong Skill Fit"
         if score >= 60:
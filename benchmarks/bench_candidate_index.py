@@ -0,0 +1,116 @@
+"""CandidateIndex build, search and persistence at pool sizes up to 1M.
+
+Generates parsed candidates (skills drawn from the taxonomy, experience
+0-15 years or unknown), indexes them, and times ``search`` for a few JDs.
+The comparison is a linear scan that runs ``EligibilityEngine`` and the
+weighted engines on every candidate, which is what looping
+``evaluate_resume_against_jd`` over stored resumes costs after parsing.
+It is timed on a sample and extrapolated. Run from the repo root:
+
+    python benchmarks/bench_candidate_index.py --candidates 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from candidate_index import CandidateIndex
+from eligibility_engine import EligibilityEngine
+from scoring_service import parse_jd
+from skill_taxonomy import get_taxonomy
+
+JDS = {
+    "2 required": "Must have Python and Kubernetes. 4+ years of experience.",
+    "4 required": "Must have Python, Kubernetes, Terraform and AWS. 6+ years of experience.",
+    "1 required": "Required: Snowflake. Nice to have SQL.",
+}
+
+
+def _candidates(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    skills = list(get_taxonomy().skills)
+    # a few popular skills, a long tail of rarer ones
+    weights = [1.0 / (rank + 1) for rank in range(len(skills))]
+    rng.shuffle(skills)
+
+    pool = []
+    for _ in range(count):
+        chosen = set(rng.choices(skills, weights=weights, k=rng.randint(2, 8)))
+        experience = rng.randint(0, 15) if rng.random() < 0.85 else None
+        pool.append({"skills": sorted(chosen), "experience": experience})
+    return pool
+
+
+def _linear_scan(index: CandidateIndex, jd_data: Dict[str, Any], docs: List[int]) -> None:
+    for doc in docs:
+        profile = {"skills": index._skills[doc], "experience": index._experience[doc]}
+        if EligibilityEngine(jd_data, profile).evaluate()["eligible"]:
+            index.score(doc, jd_data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=1_000_000)
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--scan-sample", type=int, default=20_000, help="candidates timed for the linear scan")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pool = _candidates(rng, args.candidates)
+
+    index = CandidateIndex()
+    start = time.perf_counter()
+    for number, resume_data in enumerate(pool):
+        index.add(f"c{number}", resume_data, resume_data["skills"])
+    print(f"build            {args.candidates} candidates in {time.perf_counter() - start:.1f} s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "candidates.idx")
+        start = time.perf_counter()
+        index.save(path)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        index = CandidateIndex.load(path)
+        loaded = time.perf_counter() - start
+        size_mb = os.path.getsize(path) / 1e6
+    print(f"save / load      {saved:.1f} s / {loaded:.1f} s, {size_mb:.0f} MB")
+
+    start = time.perf_counter()
+    for number in rng.sample(range(args.candidates), 1000):
+        index.remove(f"c{number}")
+        index.add(f"c{number}", pool[number], pool[number]["skills"])
+    per_candidate_ms = (time.perf_counter() - start) / 1000 * 1000
+    print(f"remove + re-add  {per_candidate_ms:.3f} ms per candidate (1000 candidates)")
+
+    sample = list(index._names)[: args.scan_sample]
+    for name, jd_text in JDS.items():
+        jd_data = parse_jd(jd_text)
+
+        start = time.perf_counter()
+        survivors = len(index.eligible(jd_data))
+        results = index.search(jd_data, top_k=args.top_k)
+        search_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _linear_scan(index, jd_data, sample)
+        scan_seconds = (time.perf_counter() - start) * len(index) / len(sample)
+
+        best = results[0]["weighted_ats"]["final_ats_score"] if results else None
+        print(
+            f"{name:<18} survivors {survivors:>7}  search {search_seconds * 1000:8.1f} ms  "
+            f"linear scan ~{scan_seconds:6.1f} s  ({scan_seconds / search_seconds:.0f}x)  best {best}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""JDParser.classify_skills latency against JD size.
+
+Times the single-pass classifier next to the previous per-variant
+``.{0,80}<variant>.{0,80}`` regex implementation and checks that both agree
+on every generated JD. JDs include skill names and aliases inside other
+words ("mysql", "platform"), which the old regex counted as context
+anchors. Run from the repo root:
+
+    python benchmarks/bench_classify_skills.py
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from jd_parser import REQUIRED_HINTS, PREFERRED_HINTS, SKILL_ALIASES, JDParser
+from skill_taxonomy import get_taxonomy
+
+SIZES = [1_000, 4_000, 15_000, 60_000]
+
+FILLER = (
+    "we are looking for engineers who build reliable services across teams "
+    "and ship code every week with care for users and operations"
+).split()
+
+# words that contain a skill or alias without mentioning it
+IN_WORD = ["mysql", "nosql", "platform", "jsx", "awsome", "dockerized", "pythonic", "k8sops", "helmet"]
+
+
+def _legacy_classify(text: str) -> Dict[str, List[str]]:
+    parser = JDParser(text)
+    lower_text = parser.lower_text
+
+    required = set()
+    preferred = set()
+    for skill in parser.extract_skills():
+        variants = {skill} | set(SKILL_ALIASES.get(skill, []))
+        contexts: List[str] = []
+        for variant in sorted(variants):
+            pattern = r".{0,80}" + re.escape(variant) + r".{0,80}"
+            contexts.extend(re.findall(pattern, lower_text))
+        context = " ".join(contexts)
+
+        if any(hint in context for hint in REQUIRED_HINTS):
+            required.add(skill)
+        else:
+            preferred.add(skill)
+
+    return {"required_skills": sorted(required), "preferred_skills": sorted(preferred)}
+
+
+def _synthetic_jd(size: int, rng: random.Random) -> str:
+    terms = list(get_taxonomy().skills) + list(get_taxonomy().normalization)
+    hints = REQUIRED_HINTS + PREFERRED_HINTS
+
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.04:
+            token = rng.choice(terms)
+        elif roll < 0.05:
+            token = rng.choice(IN_WORD)
+        elif roll < 0.07:
+            token = rng.choice(hints)
+        else:
+            token = rng.choice(FILLER)
+        parts.append(token)
+        length += len(token) + 1
+    return " ".join(parts)
+
+
+def _ms_per_call(fn, texts: List[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return (time.perf_counter() - start) / len(texts) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=10, help="JDs per size")
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    print(f"{'JD chars':>9} {'regex ms':>10} {'single-pass ms':>15}")
+
+    for size in SIZES:
+        texts = [_synthetic_jd(size, rng) for _ in range(args.docs)]
+        for text in texts:
+            assert JDParser(text).classify_skills() == _legacy_classify(text)
+
+        legacy_ms = _ms_per_call(_legacy_classify, texts)
+        new_ms = _ms_per_call(lambda t: JDParser(t).classify_skills(), texts)
+        print(f"{size:>9} {legacy_ms:>10.2f} {new_ms:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""DOCX extraction: the streaming XML reader against python-docx.
+
+Generates DOCX files with python-docx and places taxonomy skills in body
+paragraphs, table cells, a header, a footer and text boxes (one plain VML
+box, one ``mc:AlternateContent`` box that carries its text twice). For each
+reader it reports the share of placed skills that ``parse_resume`` finds
+in the extracted text, per location, then times both on one large document.
+Exits non-zero if the streaming reader misses a skill, reads a text box
+twice, or drops or reorders a paragraph python-docx returns. Run from the
+repo root:
+
+    python benchmarks/bench_docx_reader.py --docs 200 --paragraphs 20000
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from docx import Document
+from docx.oxml import parse_xml
+
+from resume_reader import ResumeReader
+from scoring_service import parse_resume
+from skill_taxonomy import get_taxonomy
+
+LOCATIONS = ("body", "table", "header", "footer", "textbox")
+
+FILLER = (
+    "delivered owned the roadmap for a platform team and mentored engineers across "
+    "several product launches while improving reliability latency and cost"
+).split()
+
+_NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"'
+)
+
+
+def _box(text: str) -> str:
+    return f"<w:txbxContent><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:txbxContent>"
+
+
+def _textbox_run(text: str, alternate: bool) -> object:
+    vml = f"<w:pict><v:shape><v:textbox>{_box(text)}</v:textbox></v:shape></w:pict>"
+    if not alternate:
+        return parse_xml(f"<w:r {_NAMESPACES}>{vml}</w:r>")
+    return parse_xml(
+        f"<w:r {_NAMESPACES}><mc:AlternateContent>"
+        f'<mc:Choice Requires="wps"><w:drawing><wps:wsp><wps:txbx>{_box(text)}</wps:txbx></wps:wsp></w:drawing></mc:Choice>'
+        f"<mc:Fallback>{vml}</mc:Fallback>"
+        f"</mc:AlternateContent></w:r>"
+    )
+
+
+def _filler(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(FILLER) for _ in range(words))
+
+
+def _build(rng: random.Random, paragraphs: int, placed: Dict[str, List[str]]) -> bytes:
+    doc = Document()
+    section = doc.sections[0]
+    section.header.paragraphs[0].text = "Jane Doe | " + " | ".join(placed["header"])
+    section.footer.paragraphs[0].text = "References: " + ", ".join(placed["footer"])
+
+    body = list(placed["body"])
+    for n in range(paragraphs):
+        text = _filler(rng, 20)
+        if body and n % max(1, paragraphs // (len(placed["body"]) + 1)) == 0:
+            text += f" using {body.pop()}"
+        doc.add_paragraph(text)
+    for skill in body:
+        doc.add_paragraph(f"Also used {skill}.")
+
+    table = doc.add_table(rows=0, cols=2)
+    for skill in placed["table"]:
+        cells = table.add_row().cells
+        cells[0].text = skill
+        cells[1].text = f"{rng.randint(1, 9)} yrs"
+
+    for index, skill in enumerate(placed["textbox"]):
+        anchor = doc.add_paragraph("Highlights")
+        anchor._p.append(_textbox_run(skill, alternate=index % 2 == 0))
+
+    handle = io.BytesIO()
+    doc.save(handle)
+    return handle.getvalue()
+
+
+def _place(rng: random.Random, skills: List[str]) -> Dict[str, List[str]]:
+    chosen = rng.sample(skills, k=min(len(skills), 10))
+    placed: Dict[str, List[str]] = {location: [] for location in LOCATIONS}
+    for skill in chosen:
+        placed[rng.choice(LOCATIONS)].append(skill)
+    return placed
+
+
+def _is_subsequence(needle: List[str], haystack: List[str]) -> bool:
+    remaining = iter(haystack)
+    return all(any(line == item for item in remaining) for line in needle)
+
+
+def _timed(read: Callable[[], str], repeat: int) -> Tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        read()
+    seconds = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200, help="small documents for the recall check")
+    parser.add_argument("--paragraphs", type=int, default=20_000, help="body paragraphs in the large document")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=24)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = list(get_taxonomy().skills)
+    readers = ("python-docx", "stream")
+
+    placed_total = {location: 0 for location in LOCATIONS}
+    found = {reader: {location: 0 for location in LOCATIONS} for reader in readers}
+    ok = True
+    for _ in range(args.docs):
+        placed = _place(rng, skills)
+        data = _build(rng, 30, placed)
+
+        extracted = {
+            reader: ResumeReader.from_upload(data, "resume.docx", docx_reader=reader).extract_text() or ""
+            for reader in readers
+        }
+
+        for reader in readers:
+            parsed: Set[str] = set(parse_resume(extracted[reader])["skills"])
+            for location, names in placed.items():
+                found[reader][location] += sum(name in parsed for name in names)
+        for location, names in placed.items():
+            placed_total[location] += len(names)
+
+        stream_lines = extracted["stream"].split("\n")
+        ok = ok and _is_subsequence(extracted["python-docx"].split("\n"), stream_lines)
+        ok = ok and all(stream_lines.count(name) == 1 for name in placed["textbox"])
+
+    print(f"skill recall over {args.docs} documents")
+    print(f"{'location':<10} {'placed':>7} " + " ".join(f"{reader:>12}" for reader in readers))
+    for location in LOCATIONS:
+        total = placed_total[location]
+        shares = " ".join(f"{found[reader][location] / max(total, 1):12.1%}" for reader in readers)
+        print(f"{location:<10} {total:>7} {shares}")
+    recall = {reader: sum(found[reader].values()) / max(sum(placed_total.values()), 1) for reader in readers}
+    print(f"{'all':<10} {sum(placed_total.values()):>7} " + " ".join(f"{recall[r]:12.1%}" for r in readers))
+    ok = ok and recall["stream"] == 1.0
+
+    data = _build(rng, args.paragraphs, _place(rng, skills))
+    print(f"\nlarge document: {args.paragraphs} paragraphs, {len(data) / 1e6:.1f} MB")
+    timings = {}
+    for reader in readers:
+        doc_reader = ResumeReader.from_upload(data, "resume.docx", docx_reader=reader)
+        timings[reader] = _timed(doc_reader.extract_text, args.repeat)
+        seconds, peak = timings[reader]
+        print(f"{reader:<12} {seconds * 1000:9.1f} ms  peak {peak / 1e6:7.1f} MB")
+    print(f"speedup      {timings['python-docx'][0] / timings['stream'][0]:9.1f}x")
+
+    print(f"\nstream reader complete and in order: {ok}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
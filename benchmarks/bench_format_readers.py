@@ -0,0 +1,240 @@
+"""Reader registry: routing, content and speed for TXT, HTML, RTF, ODT and DOCX.
+
+Generates resumes in every format, with skills placed in the places each
+format hides text (HTML table cells and entities, RTF hex and ``\\u``
+escapes, ODT headers, footers and frames, DOCX tables). Each one is also
+given a misleading extension (HTML and RTF saved as ``.txt``, ODT as
+``.docx`` and the reverse). Every file is read through ``ResumeReader``.
+The bench checks which reader handled it and that ``parse_resume`` finds
+exactly the placed skills. Skills planted where they are not text (scripts,
+RTF font tables and ``{\\*`` destinations, ODT comments and deleted text)
+must not show up. Reports MB/s per reader and exits non-zero on any
+mismatch. Run from the repo root:
+
+    python benchmarks/bench_format_readers.py --docs 50 --paragraphs 2000
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from docx import Document
+
+import format_readers
+from resume_reader import ResumeReader
+from scoring_service import parse_resume
+from skill_taxonomy import get_taxonomy
+
+FILLER = (
+    "delivered owned the roadmap for a platform team and mentored engineers across "
+    "several product launches while improving reliability latency and cost"
+).split()
+
+# (kind the file is, extension it is saved with, reader that should handle it)
+ROUTES = [
+    ("txt", ".txt", "txt"),
+    ("txt-utf16", ".txt", "txt"),
+    ("html", ".html", "html"),
+    ("html", ".txt", "html"),
+    ("rtf", ".rtf", "rtf"),
+    ("rtf", ".txt", "rtf"),
+    ("odt", ".odt", "odt"),
+    ("odt", ".docx", "odt"),
+    ("docx", ".docx", "docx-stream"),
+    ("docx", ".odt", "docx-stream"),
+    ("txt", ".resume", "txt"),
+]
+
+
+def _filler(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(FILLER) for _ in range(words))
+
+
+def _body(rng: random.Random, paragraphs: int, skills: List[str]) -> List[str]:
+    lines = [_filler(rng, 18) for _ in range(paragraphs)]
+    for skill in skills:
+        lines[rng.randrange(len(lines))] += f" with {skill}"
+    return lines
+
+
+# =============================
+# Generators: (placed skills, hidden skills) -> file bytes
+# =============================
+def make_txt(rng: random.Random, paragraphs: int, placed: List[str], hidden: List[str]) -> bytes:
+    return "\r\n".join(_body(rng, paragraphs, placed)).encode("utf-8")
+
+
+def make_txt_utf16(rng: random.Random, paragraphs: int, placed: List[str], hidden: List[str]) -> bytes:
+    return "\n".join(_body(rng, paragraphs, placed)).encode("utf-16")
+
+
+def make_html(rng: random.Random, paragraphs: int, placed: List[str], hidden: List[str]) -> bytes:
+    half = len(placed) // 2
+    body = "\n".join(f"<p>{line.replace('and', '&amp;')}</p>" for line in _body(rng, paragraphs, placed[:half]))
+    cells = "".join(f"<tr><td>{skill}</td><td>{rng.randint(1, 9)}</td></tr>" for skill in placed[half:])
+    script = f"<script>var skills = {hidden!r};</script><style>.{''.join(hidden[:1]) or 'x'} {{}}</style>"
+    return (
+        f"<!DOCTYPE html>\n<html><head><title>Resume</title>{script}</head>"
+        f"<body>\n{body}\n<table>{cells}</table></body></html>"
+    ).encode("utf-8")
+
+
+def _rtf_escape(text: str) -> str:
+    # every "e" as a hex escape and every "o" as \u with a fallback char
+    return text.replace("e", "\\'65").replace("o", "\\u111?")
+
+
+def make_rtf(rng: random.Random, paragraphs: int, placed: List[str], hidden: List[str]) -> bytes:
+    half = len(placed) // 2
+    fonts = "".join(f"{{\\f{n} {name};}}" for n, name in enumerate(hidden or ["Arial"]))
+    lines = [_rtf_escape(line) for line in _body(rng, paragraphs, placed[:half])]
+    rows = "".join(f"\\trowd\\intbl {skill}\\cell {rng.randint(1, 9)}\\cell\\row\n" for skill in placed[half:])
+    hidden_text = " ".join(hidden)
+    return (
+        "{\\rtf1\\ansi\\ansicpg1252\\deff0"
+        f"{{\\fonttbl{fonts}}}{{\\colortbl;\\red0\\green0\\blue0;}}"
+        f"{{\\info{{\\title {hidden_text}}}}}{{\\*\\generator {hidden_text};}}\n"
+        + "\\par\n".join(lines)
+        + "\\par\n"
+        + rows
+        + "}"
+    ).encode("latin-1")
+
+
+_ODT_NS = (
+    'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+    'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+    'xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" '
+    'xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0" '
+    'xmlns:draw="urn:oasis:names:tc:opendocument:xmlns:drawing:1.0" '
+    'xmlns:dc="http://purl.org/dc/elements/1.1/"'
+)
+
+
+def make_odt(rng: random.Random, paragraphs: int, placed: List[str], hidden: List[str]) -> bytes:
+    header, footer, frame, cell = (placed[i::4] for i in range(4))
+    lines = _body(rng, paragraphs, [])
+    body = "".join(
+        f'<text:p>{line.replace(" ", "<text:s/>", 1)}<text:span> span</text:span> tail</text:p>' for line in lines
+    )
+    comment = f"<office:annotation><dc:creator>x</dc:creator><text:p>{' '.join(hidden)}</text:p></office:annotation>"
+    deleted = (
+        '<text:tracked-changes><text:changed-region text:id="c1"><text:deletion>'
+        f"<text:p>{' '.join(hidden)}</text:p></text:deletion></text:changed-region></text:tracked-changes>"
+    )
+    frames = "".join(
+        f"<text:p>Highlights<draw:frame><draw:text-box><text:p>{skill}</text:p></draw:text-box></draw:frame></text:p>"
+        for skill in frame
+    )
+    rows = "".join(
+        f"<table:table-row><table:table-cell><text:p>{skill}</text:p></table:table-cell></table:table-row>"
+        for skill in cell
+    )
+    content = (
+        f'<?xml version="1.0" encoding="UTF-8"?><office:document-content {_ODT_NS}><office:body><office:text>'
+        f"{deleted}<text:h>Jane{comment} Doe</text:h>{body}{frames}<table:table>{rows}</table:table>"
+        "</office:text></office:body></office:document-content>"
+    )
+    styles = (
+        f'<?xml version="1.0" encoding="UTF-8"?><office:document-styles {_ODT_NS}><office:master-styles>'
+        f'<style:master-page style:name="Standard"><style:header><text:p>{" | ".join(header)}</text:p></style:header>'
+        f'<style:footer><text:p>{", ".join(footer)}</text:p></style:footer></style:master-page>'
+        "</office:master-styles></office:document-styles>"
+    )
+
+    handle = io.BytesIO()
+    with zipfile.ZipFile(handle, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(zipfile.ZipInfo("mimetype"), "application/vnd.oasis.opendocument.text")
+        archive.writestr("content.xml", content)
+        archive.writestr("styles.xml", styles)
+        archive.writestr("META-INF/manifest.xml", "<manifest/>")
+    return handle.getvalue()
+
+
+def make_docx(rng: random.Random, paragraphs: int, placed: List[str], hidden: List[str]) -> bytes:
+    half = len(placed) // 2
+    doc = Document()
+    for line in _body(rng, paragraphs, placed[:half]):
+        doc.add_paragraph(line)
+    table = doc.add_table(rows=0, cols=1)
+    for skill in placed[half:]:
+        table.add_row().cells[0].text = skill
+    handle = io.BytesIO()
+    doc.save(handle)
+    return handle.getvalue()
+
+
+MAKERS: Dict[str, Callable[[random.Random, int, List[str], List[str]], bytes]] = {
+    "txt": make_txt,
+    "txt-utf16": make_txt_utf16,
+    "html": make_html,
+    "rtf": make_rtf,
+    "odt": make_odt,
+    "docx": make_docx,
+}
+
+
+def _read(data: bytes, filename: str) -> Tuple[str, str]:
+    reader = ResumeReader.from_upload(data, filename)
+    text = reader.extract_text() or ""
+    return text, reader.reader_kind or ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50, help="documents per route for the content check")
+    parser.add_argument("--paragraphs", type=int, default=2_000, help="paragraphs in the timed documents")
+    parser.add_argument("--seed", type=int, default=25)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = list(get_taxonomy().skills)
+
+    print(f"{'file':<10} {'saved as':<9} {'read by':<12} {'docs':>5} {'wrong reader':>12} {'skill mismatches':>16}")
+    ok = True
+    for kind, extension, expected in ROUTES:
+        wrong = mismatches = 0
+        for _ in range(args.docs):
+            chosen = rng.sample(skills, k=8)
+            placed, hidden = chosen[:5], chosen[5:]
+            text, used = _read(MAKERS[kind](rng, 12, placed, hidden), "resume" + extension)
+            wrong += used != expected
+            mismatches += set(parse_resume(text)["skills"]) != set(placed)
+        ok = ok and not wrong and not mismatches
+        print(f"{kind:<10} {extension:<9} {expected:<12} {args.docs:>5} {wrong:>12} {mismatches:>16}")
+
+    # shrink the chunk size so chunk boundaries fall inside RTF escapes too
+    chunk_bytes = format_readers.CHUNK_BYTES
+    format_readers.CHUNK_BYTES = 7
+    data = make_rtf(rng, 50, skills[:5], skills[5:8])
+    small_chunks = _read(data, "resume.rtf")[0]
+    format_readers.CHUNK_BYTES = chunk_bytes
+    chunked_ok = small_chunks == _read(data, "resume.rtf")[0]
+    print(f"\nrtf output independent of chunk size: {chunked_ok}")
+    ok = ok and chunked_ok
+
+    print(f"\n{'reader':<12} {'size MB':>8} {'ms':>9} {'MB/s':>8}")
+    for kind in MAKERS:
+        data = MAKERS[kind](rng, args.paragraphs, skills[:6], skills[6:9])
+        start = time.perf_counter()
+        _, used = _read(data, "resume")
+        seconds = time.perf_counter() - start
+        print(f"{used:<12} {len(data) / 1e6:8.2f} {seconds * 1000:9.1f} {len(data) / 1e6 / seconds:8.1f}")
+
+    print(f"\nevery file routed and read correctly: {ok}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Keyword score: term lookups against the old replace-and-substring scan.
+
+Times ``WeightedATSEngine``'s keyword score over generated resumes three
+ways: the old scan, the engine looking up the JD's skills in the text itself
+(what a caller without parsed skills gets), and the parsed skills
+passed as ``resume_terms`` (what ``scoring_service`` does). Also counts how
+many scores moved off the old scan's false substring hits. The intended
+score for each edge case lives in ``tests/test_keyword_score.py``. Run from
+the repo root:
+
+    python benchmarks/bench_keyword_score.py --resumes 2000 --size 4000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from bench_prefilter import _resume
+from resume_parser import ResumeParser
+from skill_taxonomy import get_taxonomy
+from weighted_ats import WeightedATSEngine
+
+
+def _legacy_keyword_score(resume_text: str, required: List[str], preferred: List[str]) -> float:
+    """The scan WeightedATSEngine used before term sets."""
+    text = resume_text.lower()
+    for alias, canonical in get_taxonomy().normalization.items():
+        text = text.replace(alias, canonical)
+
+    total = 2 * len(required) + len(preferred)
+    if not total:
+        return 0.0
+    hits = 2 * sum(skill in text for skill in required) + sum(skill in text for skill in preferred)
+    return hits / total * 100
+
+
+def _keyword_score(resume_text: str, required: List[str], preferred: List[str], **extra) -> float:
+    return WeightedATSEngine(100.0, None, None, resume_text, required, preferred, **extra).scores()[3]
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=2_000)
+    parser.add_argument("--size", type=int, default=4_000, help="characters per generated resume")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    texts = [_resume(rng, args.size, rng.random() < 0.5) for _ in range(args.resumes)]
+    skills = list(get_taxonomy().skills)
+    jds = [(rng.sample(skills, 3), rng.sample(skills, 4)) for _ in texts]
+    parsed = [ResumeParser(text).parse()["skills"] for text in texts]
+
+    legacy = _timed(lambda: [_legacy_keyword_score(t, r, p) for t, (r, p) in zip(texts, jds)])
+    scanned = _timed(lambda: [_keyword_score(t, r, p) for t, (r, p) in zip(texts, jds)])
+    reused = _timed(
+        lambda: [_keyword_score(t, r, p, resume_terms=s) for t, (r, p), s in zip(texts, jds, parsed)]
+    )
+    changed = sum(
+        round(_legacy_keyword_score(t, r, p), 2) != round(_keyword_score(t, r, p, resume_terms=s), 2)
+        for t, (r, p), s in zip(texts, jds, parsed)
+    )
+
+    per = 1e6 / args.resumes
+    print(f"old replace + substring    {legacy * per:8.1f} us/resume")
+    print(f"JD terms, engine looks up  {scanned * per:8.1f} us/resume")
+    print(f"term set, parsed skills    {reused * per:8.1f} us/resume")
+    print(f"scores changed vs old      {changed}/{args.resumes} (false substring hits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Per-stage timings for the scoring pipeline, with an optional baseline check.
+
+Times ``ResumeParser.parse``, ``JDParser.parse`` and
+``evaluate_resume_against_jd`` (parse cache disabled, so every call does the
+full work) over generated resume/JD pairs. Run from the repo root:
+
+    python benchmarks/bench_pipeline.py --save baseline.json
+    python benchmarks/bench_pipeline.py --compare baseline.json
+
+``--compare`` prints the change per stage and exits non-zero when any
+stage's median got slower than ``--tolerance`` (default 10%).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from jd_parser import JDParser
+from patterns import PREFERRED_HINTS, REQUIRED_HINTS
+from resume_parser import ResumeParser
+from scoring_service import configure_parse_cache, evaluate_resume_against_jd
+from skill_taxonomy import get_taxonomy
+
+FILLER = (
+    "designed and operated services for teams across the company with a focus "
+    "on reliability cost and developer experience while mentoring engineers"
+).split()
+
+
+def _document(rng: random.Random, size: int, hints: List[str]) -> str:
+    taxonomy = get_taxonomy()
+    terms = list(taxonomy.skills) + list(taxonomy.normalization)
+
+    parts: List[str] = [f"{rng.randint(2, 12)}+ years of experience."]
+    length = len(parts[0])
+    while length < size:
+        roll = rng.random()
+        if roll < 0.08:
+            word = rng.choice(terms)
+        elif roll < 0.1 and hints:
+            word = rng.choice(hints)
+        else:
+            word = rng.choice(FILLER)
+        if rng.random() < 0.05:
+            word += ".\n"
+        parts.append(word)
+        length += len(word) + 1
+    return " ".join(parts)
+
+
+def _time(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "min_ms": round(min(samples) * 1000, 4),
+    }
+
+
+def run(pairs: int, resume_size: int, jd_size: int, repeat: int, seed: int) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(seed)
+    resumes = [_document(rng, resume_size, []) for _ in range(pairs)]
+    jds = [_document(rng, jd_size, REQUIRED_HINTS + PREFERRED_HINTS) for _ in range(pairs)]
+
+    configure_parse_cache(max_entries=0)
+
+    def resume_stage() -> None:
+        for text in resumes:
+            ResumeParser(text).parse()
+
+    def jd_stage() -> None:
+        for text in jds:
+            JDParser(text).parse()
+
+    def end_to_end() -> None:
+        for resume_text, jd_text in zip(resumes, jds):
+            evaluate_resume_against_jd(resume_text, jd_text)
+
+    stages = {
+        "ResumeParser.parse": resume_stage,
+        "JDParser.parse": jd_stage,
+        "evaluate_resume_against_jd": end_to_end,
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    for name, fn in stages.items():
+        fn()  # warm-up
+        timing = _time(fn, repeat)
+        # report per document, not per batch of pairs
+        results[name] = {key: round(value / pairs, 4) for key, value in timing.items()}
+    return results
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> bool:
+    ok = True
+    print(f"{'stage':<30}{'baseline ms':>14}{'current ms':>14}{'change':>10}")
+    for name, timing in current.items():
+        before = baseline.get(name, {}).get("median_ms")
+        now = timing["median_ms"]
+        if not before:
+            print(f"{name:<30}{'-':>14}{now:>14.4f}{'new':>10}")
+            continue
+        change = (now - before) / before
+        flag = ""
+        if change > tolerance:
+            flag = "  SLOWER"
+            ok = False
+        print(f"{name:<30}{before:>14.4f}{now:>14.4f}{change:>+10.1%}{flag}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=50, help="resume/JD pairs per run")
+    parser.add_argument("--resume-size", type=int, default=4_000, help="characters per resume")
+    parser.add_argument("--jd-size", type=int, default=3_000, help="characters per JD")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save", help="write timings to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    results = run(args.pairs, args.resume_size, args.jd_size, args.repeat, args.seed)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        ok = compare(results, baseline, args.tolerance)
+    else:
+        for name, timing in results.items():
+            print(f"{name:<30}median {timing['median_ms']:.4f} ms  min {timing['min_ms']:.4f} ms")
+        ok = True
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
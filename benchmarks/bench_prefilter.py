@@ -0,0 +1,144 @@
+"""Required-skills prefilter against full scoring on a mostly-ineligible pool.
+
+Ranks a generated resume pool against one JD with and without
+``prefilter=True`` (parse cache off), and scores every resume with
+``evaluate_resume_against_jds_compact`` both ways. A pair the gate passes
+must equal the full path's result. A pair it rejects must equal it too,
+except that ``candidate_data["skills"]`` is ``None``. Run from the repo root:
+
+    python benchmarks/bench_prefilter.py --resumes 5000 --eligible 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from prefilter import gate_for
+from prepared import prepare
+from scoring_service import (
+    configure_parse_cache,
+    evaluate_resume_against_jds_compact,
+    parse_jd,
+    parse_jd_compact,
+    rank_resumes_for_jd,
+)
+from skill_taxonomy import get_taxonomy
+
+JD = (
+    "Must have Python, Kubernetes and Terraform. Strong proficiency in AWS. "
+    "You will join a small platform team that owns deployment tooling, observability "
+    "and the developer experience for every product group in the company. "
+    "Nice to have Helm, Grafana and Datadog. 4+ years of experience."
+)
+REQUIRED_SPELLINGS = {
+    "python": ["python"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "terraform": ["terraform", "tf"],
+    "amazon web services": ["aws", "amazon web services"],
+}
+# near misses the word-boundary rule has to reject
+DECOYS = ["pythonic", "k8sx", "tfx", "awsome", "terraforming", "_python", "python3"]
+
+FILLER = (
+    "led migrations owned on-call improved latency wrote design docs for "
+    "internal platforms and mentored engineers across several product teams"
+).split()
+
+
+def _resume(rng: random.Random, size: int, eligible: bool) -> str:
+    taxonomy = get_taxonomy()
+    others = list(taxonomy.skills) + list(taxonomy.normalization)
+
+    required = list(REQUIRED_SPELLINGS)
+    if not eligible:
+        # drop at least one required skill entirely
+        dropped = set(rng.sample(required, rng.randint(1, len(required))))
+        required = [skill for skill in required if skill not in dropped]
+        others = [
+            term
+            for term in others
+            if taxonomy.normalization.get(term, term) not in dropped
+        ]
+
+    words: List[str] = [f"{rng.randint(1, 12)} years of experience."]
+    words += [rng.choice(REQUIRED_SPELLINGS[skill]) for skill in required]
+    length = sum(len(word) + 1 for word in words)
+    while length < size:
+        roll = rng.random()
+        if roll < 0.05:
+            word = rng.choice(others)
+        elif roll < 0.07:
+            word = rng.choice(DECOYS)
+        else:
+            word = rng.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def _matches(fast: Dict[str, Any], full: Dict[str, Any]) -> bool:
+    if fast["candidate_data"]["skills"] is None:
+        # rejected by the gate: only the skill list may differ
+        if full["eligibility"]["eligible"]:
+            return False
+        fast = {**fast, "candidate_data": {**fast["candidate_data"], "skills": full["candidate_data"]["skills"]}}
+    return fast == full
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=5_000)
+    parser.add_argument("--eligible", type=float, default=0.1, help="share with every required skill")
+    parser.add_argument("--size", type=int, default=4_000, help="characters per resume")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [_resume(rng, args.size, rng.random() < args.eligible) for _ in range(args.resumes)]
+
+    configure_parse_cache(max_entries=0)
+
+    start = time.perf_counter()
+    full = rank_resumes_for_jd(resumes, JD)
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = rank_resumes_for_jd(resumes, JD, prefilter=True)
+    fast_seconds = time.perf_counter() - start
+
+    # both lists are sorted by score with ties in input order
+    mismatches = sum(not _matches(result, expected) for result, expected in zip(fast, full))
+    mismatches += len(fast) != len(full)
+
+    compact_jd = [parse_jd_compact(JD)]
+    for resume in resumes[:1_000]:
+        [(_, full_compact)] = evaluate_resume_against_jds_compact(resume, compact_jd)
+        [(_, fast_compact)] = evaluate_resume_against_jds_compact(resume, compact_jd, prefilter=True)
+        mismatches += not _matches(fast_compact.to_dict(), full_compact.to_dict())
+
+    gate = gate_for(parse_jd(JD)["required_skills"])
+    prefiltered = sum(bool(gate.check(prepare(resume).text)[1]) for resume in resumes)
+
+    print(f"resumes          {args.resumes}")
+    print(f"prefiltered      {prefiltered} ({prefiltered / args.resumes:.0%})")
+    print(f"full path        {full_seconds:.3f} s  ({full_seconds / args.resumes * 1000:.3f} ms/resume)")
+    print(f"with prefilter   {fast_seconds:.3f} s  ({fast_seconds / args.resumes * 1000:.3f} ms/resume)")
+    print(f"speedup          {full_seconds / fast_seconds:.1f}x")
+    print(f"mismatches       {mismatches}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
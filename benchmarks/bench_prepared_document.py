@@ -0,0 +1,116 @@
+"""Passes over each document per scoring call, with a shared PreparedDocument.
+
+Counts how often a resume or JD is normalized (``prepared.normalize``) and
+scanned by the skill matcher (``SkillMatcher.find_all``) for each scoring
+entry point, with the parse cache off so nothing is skipped. Every document
+should be normalized and scanned at most once, however many stages or JDs
+look at it. Also reports time per call. Run from the repo root:
+
+    python benchmarks/bench_prepared_document.py --jds 5 --size 6000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+import prepared
+from bench_prefilter import JD, _resume
+from scoring_service import (
+    configure_parse_cache,
+    evaluate_resume_against_jd,
+    evaluate_resume_against_jds,
+    evaluate_resume_against_jds_compact,
+    parse_jd_compact,
+    rank_resumes_for_jd,
+)
+from skill_matcher import SkillMatcher
+from weighted_ats import WeightedATSEngine
+
+COUNTS: Dict[str, int] = {"normalize": 0, "scan": 0}
+
+
+def _count(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    def counted(*args: Any, **kwargs: Any) -> Any:
+        COUNTS[name] += 1
+        return fn(*args, **kwargs)
+
+    return counted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jds", type=int, default=5)
+    parser.add_argument("--size", type=int, default=6_000, help="characters per generated resume")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=21)
+    args = parser.parse_args()
+
+    configure_parse_cache(max_entries=0)
+    prepared.normalize = _count("normalize", prepared.normalize)
+    SkillMatcher.find_all = _count("scan", SkillMatcher.find_all)
+
+    rng = random.Random(args.seed)
+    resume = _resume(rng, args.size, eligible=True)
+    rejected = _resume(rng, args.size, eligible=False)
+    jds = [JD + f" Team {n}." for n in range(args.jds)]
+    compact_jds = [parse_jd_compact(jd) for jd in jds]
+
+    # (name, call, documents it touches)
+    cases = [
+        ("evaluate_resume_against_jd", lambda: evaluate_resume_against_jd(resume, JD), 2),
+        (
+            "evaluate_resume_against_jd prefilter",
+            lambda: evaluate_resume_against_jd(resume, JD, prefilter=True),
+            2,
+        ),
+        (
+            f"evaluate_resume_against_jds x{args.jds} prefilter",
+            lambda: evaluate_resume_against_jds(resume, jds, prefilter=True),
+            1 + args.jds,
+        ),
+        (
+            f"evaluate_resume_against_jds_compact x{args.jds} prefilter",
+            lambda: evaluate_resume_against_jds_compact(resume, compact_jds, prefilter=True),
+            1,
+        ),
+        (
+            "rank_resumes_for_jd x2 prefilter",
+            lambda: rank_resumes_for_jd([resume, rejected], JD, prefilter=True),
+            3,
+        ),
+        (
+            "WeightedATSEngine on raw text",
+            lambda: WeightedATSEngine(50.0, 3, 2, resume, ["python"], ["docker"]).compute(),
+            1,
+        ),
+    ]
+
+    ok = True
+    print(f"{'entry point':<50} {'docs':>4} {'normalize':>9} {'scans':>5} {'ms/call':>8}")
+    for name, call, documents in cases:
+        COUNTS.update(normalize=0, scan=0)
+        call()
+        normalized, scans = COUNTS["normalize"], COUNTS["scan"]
+        ok = ok and normalized <= documents and scans <= documents
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            call()
+        ms = (time.perf_counter() - start) / args.repeat * 1000
+        print(f"{name:<50} {documents:>4} {normalized:>9} {scans:>5} {ms:8.2f}")
+
+    print(f"at most one pass per document: {ok}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Memory held per scored pair: nested result dicts against compact result types.
+
+Scores ``--resumes`` generated resumes against ``--jds`` JDs through
+``evaluate_resume_against_jds`` (dicts) and
+``evaluate_resume_against_jds_compact`` (``results.PairResult``), keeps every
+result alive, and reports what ``tracemalloc`` sees per pair plus the time
+per pair. Every compact result's ``to_dict()`` is checked against the dict
+path. Run from the repo root:
+
+    python benchmarks/bench_result_memory.py --resumes 2000 --jds 10
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from bench_prefilter import _resume
+from patterns import PREFERRED_HINTS, REQUIRED_HINTS
+from scoring_service import (
+    evaluate_resume_against_jds,
+    evaluate_resume_against_jds_compact,
+    parse_jd,
+    parse_jd_compact,
+    parse_resume,
+)
+from skill_taxonomy import get_taxonomy
+
+
+def _jd(rng: random.Random) -> str:
+    skills = list(get_taxonomy().skills)
+    required = ", ".join(rng.sample(skills, 2))
+    preferred = ", ".join(rng.sample(skills, 4))
+    return (
+        f"{rng.choice(REQUIRED_HINTS)} {required}. {rng.randint(1, 6)}+ years of experience. "
+        + "You will own services end to end and work closely with product and design. " * 2
+        + f"{rng.choice(PREFERRED_HINTS)} {preferred}."
+    )
+
+
+def _measure(build: Callable[[], List[Any]]) -> Tuple[List[Any], int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = build()
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, held, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=2_000)
+    parser.add_argument("--jds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [_resume(rng, 2_000, rng.random() < 0.5) for _ in range(args.resumes)]
+    jd_texts = [_jd(rng) for _ in range(args.jds)]
+    pairs = args.resumes * args.jds
+
+    # warm the parse cache so both runs measure the results, not parsing
+    for text in resumes:
+        parse_resume(text)
+    for text in jd_texts:
+        parse_jd(text)
+
+    dicts, dict_bytes, dict_seconds = _measure(
+        lambda: [evaluate_resume_against_jds(text, jd_texts) for text in resumes]
+    )
+
+    def compact() -> List[Any]:
+        parsed = [parse_jd_compact(text) for text in jd_texts]
+        return [evaluate_resume_against_jds_compact(text, parsed) for text in resumes]
+
+    compacts, compact_bytes, compact_seconds = _measure(compact)
+
+    mismatches = 0
+    for full, small in zip(dicts, compacts):
+        for expected, (index, result) in zip(full, small):
+            expected = dict(expected)
+            mismatches += expected.pop("jd_index") != index or expected != result.to_dict()
+
+    print(f"pairs             {pairs}")
+    print(
+        f"dict results      {dict_bytes / pairs:8.0f} B/pair  {dict_seconds / pairs * 1e6:6.1f} us/pair"
+    )
+    print(
+        f"compact results   {compact_bytes / pairs:8.0f} B/pair  {compact_seconds / pairs * 1e6:6.1f} us/pair"
+    )
+    print(f"memory ratio      {dict_bytes / compact_bytes:.1f}x")
+    print(f"mismatches        {mismatches}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
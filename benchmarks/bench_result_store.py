@@ -0,0 +1,133 @@
+"""Querying bulk results: columnar result store against re-reading JSONL.
+
+Writes ``--rows`` synthetic ``bulk_score`` rows both as JSON lines and
+through ``result_store.ResultStoreWriter``, then answers the same two
+questions from each: the top ``--top-k`` eligible rows for one JD, and every
+row scoring at least ``--min-score``. Reports time and the Python heap peak
+``tracemalloc`` sees per query (in a second, untimed run; memmapped pages
+are file-backed and not counted) and checks both answers agree. Run from the repo root:
+
+    python benchmarks/bench_result_store.py --rows 2000000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from result_store import ResultStore, ResultStoreWriter
+
+REASONS = ["Missing required skills: python", "Insufficient experience"]
+
+
+def _rows(rng: random.Random, count: int, jds: int):
+    for number in range(count):
+        row = {
+            "resume": f"/resumes/{number // jds:07d}.pdf",
+            "jd": f"/jds/{number % jds}.txt",
+            "eligible": rng.random() < 0.4,
+            "reason": None,
+            "final_ats_score": None,
+            "skill_score": None,
+            "experience_score": None,
+            "keyword_score": None,
+            "strength": None,
+            "error": None,
+        }
+        if row["eligible"]:
+            scores = [round(rng.uniform(0, 100), 2) for _ in range(4)]
+            row.update(zip(("final_ats_score", "skill_score", "experience_score", "keyword_score"), scores))
+            row["reason"] = "Eligible"
+        else:
+            row["reason"] = rng.choice(REASONS)
+        yield row
+
+
+def _measure(fn: Callable[[], Any]) -> Tuple[Any, float, int]:
+    # timed and traced separately: tracemalloc slows allocation-heavy code
+    start = time.perf_counter()
+    value = fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--jds", type=int, default=10)
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--min-score", type=float, default=99.5)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+    jd = "/jds/3.txt"
+
+    with tempfile.TemporaryDirectory() as workdir:
+        jsonl_path = Path(workdir) / "results.jsonl"
+        store_path = str(Path(workdir) / "store")
+
+        start = time.perf_counter()
+        with open(jsonl_path, "w", encoding="utf-8") as handle:
+            for row in _rows(random.Random(args.seed), args.rows, args.jds):
+                handle.write(json.dumps(row) + "\n")
+        jsonl_write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ResultStoreWriter(store_path) as writer:
+            for row in _rows(random.Random(args.seed), args.rows, args.jds):
+                writer.append_row(row)
+        store_write = time.perf_counter() - start
+
+        def jsonl_top():
+            with open(jsonl_path, encoding="utf-8") as handle:
+                rows = [json.loads(line) for line in handle]
+            numbered = [(n, r) for n, r in enumerate(rows) if r["jd"] == jd and r["final_ats_score"] is not None]
+            numbered.sort(key=lambda item: (-item[1]["final_ats_score"], item[0]))
+            return [n for n, _ in numbered[: args.top_k]]
+
+        def jsonl_select():
+            with open(jsonl_path, encoding="utf-8") as handle:
+                return [
+                    n
+                    for n, line in enumerate(handle)
+                    if (score := json.loads(line)["final_ats_score"]) is not None and score >= args.min_score
+                ]
+
+        store = ResultStore(store_path)
+        results = {
+            "jsonl top": _measure(jsonl_top),
+            "store top": _measure(lambda: store.top(args.top_k, jd=jd).tolist()),
+            "jsonl select": _measure(jsonl_select),
+            "store select": _measure(lambda: store.select(min_score=args.min_score).tolist()),
+        }
+
+    print(f"rows              {args.rows}")
+    print(f"write jsonl       {jsonl_write:8.2f} s")
+    print(f"write store       {store_write:8.2f} s")
+    for name, (_, seconds, peak) in results.items():
+        print(f"{name:<17} {seconds * 1000:8.0f} ms  peak {peak / 2**20:8.1f} MiB")
+
+    same = (
+        results["jsonl top"][0] == results["store top"][0]
+        and results["jsonl select"][0] == results["store select"][0]
+    )
+    print(f"same              {same}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Score-as-you-type: ScoringSession against re-running the full pipeline per edit.
+
+Builds a long resume and JD out of paragraphs, then replays ``--edits``
+keystroke-sized edits (a word typed into, or a line added to, one paragraph
+of either document). After each edit it scores the pair with
+``evaluate_resume_against_jd`` (every edit is new text, so the parse cache
+never helps) and with one ``scoring_session.ScoringSession``. It reports the
+time per edit and checks every result is identical. Run from the repo root:
+
+    python benchmarks/bench_scoring_session.py --paragraphs 60 --edits 200
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from bench_prefilter import _resume
+from bench_result_memory import _jd
+from scoring_service import evaluate_resume_against_jd
+from scoring_session import PARAGRAPH_BREAK, ScoringSession
+
+TYPED = ["python ", "docker ", "and ", "led ", "k8s ", "3+ years ", "must have sql ", "\n"]
+
+
+def _edit(rng: random.Random, paragraphs: List[str]) -> None:
+    index = rng.randrange(len(paragraphs))
+    if rng.random() < 0.9:
+        paragraphs[index] += rng.choice(TYPED)
+    else:
+        paragraphs.insert(index, _resume(rng, 200, True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=60, help="resume paragraphs (the JD gets a third)")
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resume = [_resume(rng, 500, rng.random() < 0.7) for _ in range(args.paragraphs)]
+    jd = [_jd(rng) for _ in range(max(1, args.paragraphs // 3))]
+    session = ScoringSession()
+
+    full_seconds = 0.0
+    session_seconds = 0.0
+    mismatches = 0
+    for _ in range(args.edits):
+        _edit(rng, resume if rng.random() < 0.7 else jd)
+        resume_text = PARAGRAPH_BREAK.join(resume)
+        jd_text = PARAGRAPH_BREAK.join(jd)
+
+        start = time.perf_counter()
+        expected = evaluate_resume_against_jd(resume_text, jd_text)
+        full_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = session.score(resume_text, jd_text)
+        session_seconds += time.perf_counter() - start
+
+        mismatches += result != expected
+
+    stats = session.stats()
+    print(f"resume            {len(resume_text)} chars, {len(resume)} paragraphs")
+    print(f"jd                {len(jd_text)} chars, {len(jd)} paragraphs")
+    print(f"full pipeline     {full_seconds / args.edits * 1000:8.2f} ms/edit")
+    print(f"scoring session   {session_seconds / args.edits * 1000:8.2f} ms/edit")
+    print(f"speedup           {full_seconds / session_seconds:8.1f}x")
+    print(f"paragraphs parsed {stats['resume_parsed'] + stats['jd_parsed']}, reused {stats['resume_reused'] + stats['jd_reused']}")
+    print(f"mismatches        {mismatches}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Per-document skill extraction latency as the taxonomy grows.
+
+Compares the old approach (one ``re.search(r"\\b...\\b")`` per term) with the
+prebuilt ``SkillMatcher`` automaton. Run from the repo root:
+
+    python benchmarks/bench_skill_matcher.py
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from jd_parser import BASE_SKILLS, SKILL_ALIASES
+from skill_matcher import build_matcher
+
+SIZES = [20, 100, 1_000, 10_000]
+
+
+def _synthetic_terms(count: int, rng: random.Random) -> List[str]:
+    terms = [skill.lower() for skill in BASE_SKILLS]
+    while len(terms) < count:
+        words = rng.randint(1, 3)
+        terms.append(
+            " ".join(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+                for _ in range(words)
+            )
+        )
+    return terms[:count]
+
+
+def _synthetic_document(terms: List[str], size: int, rng: random.Random) -> str:
+    filler = ["built", "and", "maintained", "services", "with", "team", "for", "the"]
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        token = rng.choice(terms) if rng.random() < 0.1 else rng.choice(filler)
+        parts.append(token)
+        length += len(token) + 1
+    return " ".join(parts)
+
+
+def _regex_extract(terms: List[str], aliases: Dict[str, List[str]]) -> Callable[[str], Set[str]]:
+    def run(text: str) -> Set[str]:
+        found: Set[str] = set()
+        for term in terms:
+            if re.search(r"\b" + re.escape(term) + r"\b", text):
+                found.add(term)
+        for canonical, names in aliases.items():
+            for alias in names:
+                if re.search(r"\b" + re.escape(alias) + r"\b", text):
+                    found.add(canonical)
+        return found
+
+    return run
+
+
+def _time_per_doc(fn: Callable[[str], Set[str]], docs: List[str]) -> float:
+    start = time.perf_counter()
+    for doc in docs:
+        fn(doc)
+    return (time.perf_counter() - start) / len(docs) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--doc-size", type=int, default=5_000, help="characters per document")
+    parser.add_argument("--docs", type=int, default=20, help="documents per measurement")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    print(f"{'terms':>8} {'regex ms/doc':>14} {'matcher ms/doc':>16} {'build ms':>10}")
+
+    for size in SIZES:
+        terms = _synthetic_terms(size, rng)
+        docs = [_synthetic_document(terms, args.doc_size, rng) for _ in range(args.docs)]
+
+        build_start = time.perf_counter()
+        matcher = build_matcher(terms, SKILL_ALIASES)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        regex = _regex_extract(terms, SKILL_ALIASES)
+        for doc in docs[:3]:
+            assert regex(doc) == matcher.find(doc)
+
+        regex_ms = _time_per_doc(regex, docs)
+        matcher_ms = _time_per_doc(matcher.find, docs)
+        print(f"{size:>8} {regex_ms:>14.3f} {matcher_ms:>16.3f} {build_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Vectorized skill grid vs per-pair WeightedSkillMatcher.
+
+Checks that ``SkillMatrix`` reproduces ``WeightedSkillMatcher`` and
+``ATSEngine`` scores on a random sample of pairs, then times the full grid.
+Run from the repo root:
+
+    python benchmarks/bench_skill_matrix.py --candidates 100000 --jds 100
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from ats_engine import ATSEngine, SKILL_NORMALIZATION
+from ats_weighted_skill import WeightedSkillMatcher
+from skill_matrix import SkillMatrix
+from skill_taxonomy import get_taxonomy
+
+
+def _random_candidates(count: int, rng: random.Random) -> List[List[str]]:
+    vocabulary = list(get_taxonomy().skills) + list(SKILL_NORMALIZATION)
+    return [rng.sample(vocabulary, rng.randint(0, 10)) for _ in range(count)]
+
+
+def _random_jds(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    skills = list(get_taxonomy().skills)
+    jds = []
+    for _ in range(count):
+        picked = rng.sample(skills, rng.randint(0, 8))
+        split = rng.randint(0, len(picked))
+        jds.append(
+            {
+                "skills": sorted(picked),
+                "required_skills": sorted(picked[:split]),
+                "preferred_skills": sorted(picked[split:]),
+            }
+        )
+    return jds
+
+
+def check_parity(
+    matrix: SkillMatrix,
+    candidates: List[List[str]],
+    jds: List[Dict[str, Any]],
+    samples: int,
+    rng: random.Random,
+) -> None:
+    final = matrix.final_skill_score()
+    match_percent = matrix.skill_match_percent()
+
+    for _ in range(samples):
+        c = rng.randrange(len(candidates))
+        j = rng.randrange(len(jds))
+
+        expected = WeightedSkillMatcher(
+            required_skills=jds[j]["required_skills"],
+            preferred_skills=jds[j]["preferred_skills"],
+            candidate_skills=candidates[c],
+        ).compute()
+        assert matrix.weighted_skill(c, j) == expected, (c, j)
+        assert round(float(final[c, j]), 2) == expected["final_skill_score"], (c, j)
+
+        ats = ATSEngine(jds[j]["skills"], candidates[c]).compute_skill_match()
+        assert round(float(match_percent[c, j]), 2) == ats["skill_match_percent"], (c, j)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=100_000)
+    parser.add_argument("--jds", type=int, default=100)
+    parser.add_argument("--parity-samples", type=int, default=5_000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    candidates = _random_candidates(args.candidates, rng)
+    jds = _random_jds(args.jds, rng)
+
+    start = time.perf_counter()
+    matrix = SkillMatrix(candidates, jds)
+    scores = matrix.final_skill_score()
+    grid_s = time.perf_counter() - start
+
+    check_parity(matrix, candidates, jds, args.parity_samples, rng)
+    print(f"parity ok on {args.parity_samples} sampled pairs")
+
+    # per-pair baseline on a slice, extrapolated to the full grid
+    sample_pairs = min(50_000, args.candidates * args.jds)
+    start = time.perf_counter()
+    for n in range(sample_pairs):
+        c, j = divmod(n, args.jds)
+        WeightedSkillMatcher(
+            required_skills=jds[j]["required_skills"],
+            preferred_skills=jds[j]["preferred_skills"],
+            candidate_skills=candidates[c % args.candidates],
+        ).compute()
+    per_pair_s = (time.perf_counter() - start) / sample_pairs * args.candidates * args.jds
+
+    pairs = scores.size
+    print(f"grid {args.candidates} x {args.jds} = {pairs:,} pairs")
+    print(f"  SkillMatrix:          {grid_s:8.2f} s  ({pairs / grid_s:,.0f} pairs/s)")
+    print(f"  WeightedSkillMatcher: {per_pair_s:8.2f} s  (extrapolated from {sample_pairs:,} pairs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Top-K ranking against score-everything-then-sort.
+
+Two pools:
+- ``rank_resumes_for_jd(..., top_k=K)`` over generated resume texts, where
+  resumes whose best reachable score can't beat the K-th are never parsed.
+  The parse cache is kept too small to help, so both runs parse cold.
+- ``CandidateIndex.search(jd, top_k=K)`` over parsed candidates, which stops
+  at the first candidate whose bound can't beat the K-th.
+
+Both are checked against slicing the fully sorted list. Run from the repo
+root:
+
+    python benchmarks/bench_top_k.py --resumes 20000 --candidates 1000000 --top-k 50
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from bench_candidate_index import _candidates
+from bench_prefilter import _resume
+from candidate_index import CandidateIndex
+from scoring_service import configure_parse_cache, parse_jd, rank_resumes_for_jd
+
+JD = (
+    "Must have Python. Required: 3+ years of experience. "
+    "Our platform group builds the services every product team depends on. "
+    "Nice to have Docker, Kubernetes, Terraform, Grafana and SQL."
+)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=20_000)
+    parser.add_argument("--candidates", type=int, default=1_000_000)
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    # ---- resume texts ----
+    texts = [_resume(rng, 3_000, rng.random() < 0.5) for _ in range(args.resumes)]
+    configure_parse_cache(max_entries=1)  # every resume parses cold
+
+    full, full_seconds = _timed(lambda: rank_resumes_for_jd(texts, JD))
+    top, top_seconds = _timed(lambda: rank_resumes_for_jd(texts, JD, top_k=args.top_k))
+    same = [r["resume_index"] for r in top] == [r["resume_index"] for r in full[: args.top_k]]
+    ok = same
+    print(
+        f"rank_resumes_for_jd  {args.resumes} resumes: full sort {full_seconds * 1000:.0f} ms, "
+        f"top-{args.top_k} {top_seconds * 1000:.0f} ms ({full_seconds / top_seconds:.1f}x), same={same}"
+    )
+
+    # ---- candidate index ----
+    index = CandidateIndex()
+    for number, resume_data in enumerate(_candidates(rng, args.candidates)):
+        index.add(f"c{number}", resume_data, resume_data["skills"])
+    jd_data = parse_jd(JD)
+
+    everyone, all_seconds = _timed(lambda: index.search(jd_data, top_k=None))
+    best, best_seconds = _timed(lambda: index.search(jd_data, top_k=args.top_k))
+    same = [r["candidate_id"] for r in best] == [r["candidate_id"] for r in everyone[: args.top_k]]
+    ok = ok and same
+    print(
+        f"CandidateIndex       {len(everyone)} eligible of {args.candidates}: full sort "
+        f"{all_seconds * 1000:.0f} ms, top-{args.top_k} {best_seconds * 1000:.0f} ms "
+        f"({all_seconds / best_seconds:.1f}x), same={same}"
+    )
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
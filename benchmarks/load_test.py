@@ -0,0 +1,163 @@
+"""Load test for local_api: p50/p99 latency and requests/sec per server mode.
+
+Starts ``local_api.py`` in each requested mode on a spare port, fires
+``--requests`` /score calls from ``--concurrency`` client threads (each
+holding one keep-alive connection), then stops the server. Run from the
+repo root:
+
+    python benchmarks/load_test.py --mode both --requests 2000 --concurrency 32
+
+Point it at an already running server with ``--url`` instead.
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlparse
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+RESUME = (
+    "Senior platform engineer, 6 years. Python, Go language, Docker, k8s, Terraform, "
+    "GitHub Actions, Prometheus and Grafana on AWS. Built Jenkins pipelines and Helm charts."
+)
+JD = (
+    "Must have Python and Kubernetes. Strong proficiency in Terraform and AWS. "
+    "Nice to have Helm, Grafana and Datadog. 4+ years of experience."
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_healthy(host: str, port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                conn.close()
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not become healthy")
+
+
+def _client(
+    host: str,
+    port: int,
+    count: int,
+    latencies: List[float],
+    statuses: Dict[int, int],
+    lock: threading.Lock,
+) -> None:
+    body = json.dumps({"resume_text": RESUME, "jd_text": JD}).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            conn.request("POST", "/score", body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            status = 0
+        elapsed = time.perf_counter() - start
+
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    conn.close()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_load(host: str, port: int, requests: int, concurrency: int) -> Dict[str, object]:
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    lock = threading.Lock()
+
+    per_client = [requests // concurrency] * concurrency
+    for i in range(requests % concurrency):
+        per_client[i] += 1
+
+    threads = [
+        threading.Thread(target=_client, args=(host, port, n, latencies, statuses, lock))
+        for n in per_client
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / wall, 1),
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+        "statuses": statuses,
+    }
+
+
+def _run_mode(mode: str, args: argparse.Namespace) -> Dict[str, object]:
+    port = _free_port()
+    command = [sys.executable, "local_api.py", "--mode", mode, "--port", str(port)]
+    if mode == "async" and args.workers:
+        command += ["--workers", str(args.workers)]
+
+    server = subprocess.Popen(
+        command, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_healthy("127.0.0.1", port)
+        return run_load("127.0.0.1", port, args.requests, args.concurrency)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["threaded", "async", "both"], default="both")
+    parser.add_argument("--url", help="load an already running server instead")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, help="async mode worker processes")
+    args = parser.parse_args()
+
+    if args.url:
+        target = urlparse(args.url)
+        print(json.dumps(run_load(target.hostname, target.port or 80, args.requests, args.concurrency)))
+        return
+
+    modes = ["threaded", "async"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        print(mode, json.dumps(_run_mode(mode, args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import glob
+import json
+import multiprocessing.util
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from extraction_cache import ExtractionCache
+from format_readers import registered_extensions
+from result_store import ERROR, ResultStoreWriter
+from results import PairResult, ParsedJD
+from resume_reader import ResumeReader
+from scoring_service import evaluate_resume_against_jds_compact, parse_jd_compact
+
+# every format with a registered reader; resume_reader adds PDF and DOCX
+RESUME_EXTENSIONS = registered_extensions()
+
+ROW_FIELDS = [
+    "resume",
+    "jd",
+    "eligible",
+    "reason",
+    "final_ats_score",
+    "skill_score",
+    "experience_score",
+    "keyword_score",
+    "strength",
+    "error",
+]
+
+# one resume's outcome: ([(jd path, result), ...] best first, error)
+Scored = Tuple[List[Tuple[str, PairResult]], Optional[str]]
+
+# set in each worker by _init_worker: [(jd path, parsed jd), ...]
+_JDS: List[Tuple[str, ParsedJD]] = []
+_CACHE: Optional[ExtractionCache] = None
+_PREFILTER = False
+
+
+# =============================
+# Input discovery
+# =============================
+def discover_resumes(inputs: Iterable[str]) -> List[str]:
+    """Expand directories (recursively) and glob patterns into resume paths."""
+    found: Set[str] = set()
+
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                for name in files:
+                    if name.lower().endswith(RESUME_EXTENSIONS):
+                        found.add(os.path.join(root, name))
+            continue
+
+        matches = glob.glob(item, recursive=True) if glob.has_magic(item) else [item]
+        for path in matches:
+            if os.path.isfile(path) and path.lower().endswith(RESUME_EXTENSIONS):
+                found.add(path)
+
+    return sorted(found)
+
+
+# =============================
+# Worker side
+# =============================
+def _init_worker(
+    jds: List[Tuple[str, str]],
+    cache_path: Optional[str] = None,
+    prefilter: bool = False,
+) -> None:
+    global _JDS, _CACHE, _PREFILTER
+    # each JD is parsed once per worker; parsed skills are taxonomy ids,
+    # which are the same in every process
+    _JDS = [(path, parse_jd_compact(text)) for path, text in jds]
+    _CACHE = ExtractionCache(cache_path) if cache_path else None
+    if _CACHE is not None:
+        # pool workers skip atexit; this writes the cache's buffered hit
+        # counts as the worker shuts down
+        multiprocessing.util.Finalize(_CACHE, _CACHE.close, exitpriority=10)
+    _PREFILTER = prefilter
+
+
+def score_file(resume_path: str) -> Scored:
+    """Read one resume and score it against every JD; never raises."""
+    try:
+        resume_text = ResumeReader(resume_path, cache=_CACHE).extract_text() or ""
+        if not resume_text.strip():
+            return [], "No text extracted"
+
+        results = evaluate_resume_against_jds_compact(
+            resume_text, [jd for _, jd in _JDS], prefilter=_PREFILTER
+        )
+    except Exception as exc:  # noqa: BLE001 - one bad file must not stop the run
+        return [], f"{type(exc).__name__}: {exc}"
+
+    return [(_JDS[index][0], result) for index, result in results], None
+
+
+def iter_scored(
+    resume_paths: List[str],
+    jds: List[Tuple[str, str]],
+    workers: int,
+    cache_path: Optional[str] = None,
+    prefilter: bool = False,
+) -> Iterator[Tuple[str, Scored]]:
+    """Yield ``(resume path, score_file result)`` in completion order."""
+    if workers <= 1:
+        _init_worker(jds, cache_path, prefilter)
+        try:
+            for path in resume_paths:
+                yield path, score_file(path)
+        finally:
+            if _CACHE is not None:
+                _CACHE.flush()
+        return
+
+    max_in_flight = workers * 4
+    remaining = iter(resume_paths)
+    pending: Dict[Future, str] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(jds, cache_path, prefilter),
+    ) as pool:
+
+        def fill() -> None:
+            while len(pending) < max_in_flight:
+                path = next(remaining, None)
+                if path is None:
+                    return
+                pending[pool.submit(score_file, path)] = path
+
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    scored = future.result()
+                except Exception as exc:  # noqa: BLE001 - e.g. a worker died
+                    scored = [], f"{type(exc).__name__}: {exc}"
+                yield path, scored
+            fill()
+
+
+# =============================
+# Output + checkpoint
+# =============================
+def _row(resume_path: str, jd_path: str, result: PairResult) -> Dict[str, Any]:
+    eligibility = result.eligibility.to_dict()
+    ats = result.weighted_ats
+    return {
+        "resume": resume_path,
+        "jd": jd_path,
+        "eligible": eligibility["eligible"],
+        "reason": eligibility["reason"],
+        "final_ats_score": ats.final_ats_score if ats else None,
+        "skill_score": ats.skill_score if ats else None,
+        "experience_score": ats.experience_score if ats else None,
+        "keyword_score": ats.keyword_score if ats else None,
+        "strength": ats.strength if ats else None,
+        "error": None,
+    }
+
+
+def _error_row(resume_path: str, error: str) -> Dict[str, Any]:
+    row: Dict[str, Any] = {field: None for field in ROW_FIELDS}
+    row["resume"] = resume_path
+    row["error"] = error
+    return row
+
+
+class _ResultSink:
+    def __init__(self, out_path: str, fmt: str) -> None:
+        self._store: Optional[ResultStoreWriter] = None
+        if fmt == "columnar":
+            self._store = ResultStoreWriter(out_path)
+            return
+
+        fresh = not os.path.exists(out_path) or os.path.getsize(out_path) == 0
+        self._handle: TextIO = open(out_path, "a", encoding="utf-8", newline="")
+        self._csv: Optional[csv.DictWriter] = None
+
+        if fmt == "csv":
+            self._csv = csv.DictWriter(self._handle, fieldnames=ROW_FIELDS)
+            if fresh:
+                self._csv.writeheader()
+
+    def write(self, resume_path: str, scored: Scored) -> None:
+        results, error = scored
+        if self._store is not None:
+            if error:
+                self._store.append(resume_path, None, ERROR)
+            for jd_path, result in results:
+                self._store.append_result(resume_path, jd_path, result)
+            return
+
+        if error:
+            rows = [_error_row(resume_path, error)]
+        else:
+            rows = [_row(resume_path, jd_path, result) for jd_path, result in results]
+        for row in rows:
+            if self._csv is not None:
+                self._csv.writerow(row)
+            else:
+                self._handle.write(json.dumps(row) + "\n")
+
+    def flush(self) -> None:
+        if self._store is not None:
+            self._store.flush()
+        else:
+            self._handle.flush()
+
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+        else:
+            self._handle.close()
+
+
+def load_checkpoint(path: str) -> Set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as handle:
+        return {line.rstrip("\n") for line in handle if line.strip()}
+
+
+def run(
+    inputs: List[str],
+    jd_paths: List[str],
+    out_path: str,
+    fmt: str = "jsonl",
+    workers: int = 1,
+    checkpoint_path: Optional[str] = None,
+    progress_every: int = 100,
+    cache_path: Optional[str] = None,
+    prefilter: bool = False,
+) -> Dict[str, int]:
+    jds = [(path, Path(path).read_text(encoding="utf-8")) for path in jd_paths]
+
+    checkpoint_path = checkpoint_path or out_path.rstrip(os.sep) + ".checkpoint"
+    completed = load_checkpoint(checkpoint_path)
+    todo = [path for path in discover_resumes(inputs) if path not in completed]
+
+    total = len(todo)
+    done = 0
+    errors = 0
+    started = time.perf_counter()
+
+    if completed:
+        print(f"Resuming: {len(completed)} files already done, {total} left", file=sys.stderr)
+
+    sink = _ResultSink(out_path, fmt)
+    # files whose rows are written but not yet flushed
+    unflushed: List[str] = []
+    try:
+        with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+
+            def commit() -> None:
+                # rows first, then their checkpoint lines: a crash in between
+                # re-scores those files instead of losing them
+                if not unflushed:
+                    return
+                sink.flush()
+                checkpoint.writelines(path + "\n" for path in unflushed)
+                checkpoint.flush()
+                unflushed.clear()
+
+            try:
+                for path, scored in iter_scored(todo, jds, workers, cache_path, prefilter):
+                    sink.write(path, scored)
+                    unflushed.append(path)
+
+                    done += 1
+                    errors += scored[1] is not None
+
+                    if done % progress_every == 0 or done == total:
+                        commit()
+                        elapsed = time.perf_counter() - started
+                        rate = done / elapsed if elapsed else 0.0
+                        eta = (total - done) / rate if rate else 0.0
+                        print(
+                            f"[{done}/{total}] {errors} errors, {rate:.1f} files/s, eta {eta:.0f}s",
+                            file=sys.stderr,
+                        )
+            finally:
+                commit()
+    finally:
+        sink.close()
+
+    return {"scored": done, "errors": errors, "skipped": len(completed)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Score a directory or glob of resume files against one or more JDs.",
+    )
+    parser.add_argument("inputs", nargs="+", help="resume files, directories or glob patterns")
+    parser.add_argument("--jd", action="append", required=True, help="JD text file (repeatable)")
+    parser.add_argument(
+        "--out", required=True, help="output file (.jsonl or .csv), or a directory for --format columnar"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv", "columnar"],
+        help="defaults to the --out extension; columnar writes a result_store directory",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--checkpoint", help="defaults to <out>.checkpoint")
+    parser.add_argument(
+        "--progress-every",
+        type=int,
+        default=100,
+        help="flush rows, checkpoint and report progress every N files",
+    )
+    parser.add_argument("--extraction-cache", help="SQLite file reused across runs for extracted text")
+    parser.add_argument(
+        "--prefilter",
+        action="store_true",
+        help="skip parsing resumes that miss a required skill (rows are unchanged)",
+    )
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.out.lower().endswith(".csv") else "jsonl")
+
+    summary = run(
+        inputs=args.inputs,
+        jd_paths=args.jd,
+        out_path=args.out,
+        fmt=fmt,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        progress_every=args.progress_every,
+        cache_path=args.extraction_cache,
+        prefilter=args.prefilter,
+    )
+    print(json.dumps(summary), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
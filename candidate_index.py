@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import pickle
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from atomic_file import atomic_open
+from ats_weighted_skill import WeightedSkillMatcher, skill_scores
+from ranking import TopK
+from skill_taxonomy import get_taxonomy
+from weighted_ats import WeightedATSEngine, experience_score, final_score_upper_bound
+
+# bump when the pickled layout changes
+INDEX_FORMAT = 2
+
+
+class CandidateIndex:
+    """Inverted index over parsed resumes for JD-to-candidate search.
+
+    Each canonical skill maps to a posting set of internal document ids, and
+    experience is kept as a sorted ``(years, doc)`` column. ``search``
+    intersects the postings of the JD's required skills (smallest first),
+    applies the experience floor, and scores only those survivors. The
+    survivors are exactly the candidates ``EligibilityEngine`` would pass
+    (a missing experience value passes, as it does there), and their scores
+    match ``scoring_service.score_parsed``.
+
+    Keyword scores need the resume's term set (``weighted_ats.keyword_terms``),
+    not its text, so the index keeps only that.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._next_doc = 0
+
+        self._postings: Dict[str, Set[int]] = {}
+        self._skills: Dict[int, Tuple[str, ...]] = {}
+        self._keywords: Dict[int, Tuple[str, ...]] = {}
+
+        self._experience: Dict[int, Optional[int]] = {}
+        self._by_experience: List[Tuple[int, int]] = []
+        # appended unsorted, merged into _by_experience on the next read:
+        # one insort per add is O(n) and dominates bulk builds
+        self._unsorted: List[Tuple[int, int]] = []
+        self._merged_below = 0  # docs under this id are in _by_experience
+        self._no_experience: Set[int] = set()
+
+        self.taxonomy_version = get_taxonomy().version
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, candidate_id: object) -> bool:
+        return candidate_id in self._ids
+
+    # =============================
+    # Building
+    # =============================
+    def add(
+        self,
+        candidate_id: str,
+        resume_data: Dict[str, Any],
+        resume_terms: Iterable[str],
+    ) -> None:
+        """Index ``ResumeParser.parse`` output; re-adding an id replaces it."""
+        self.remove(candidate_id)
+
+        doc = self._next_doc
+        self._next_doc += 1
+        self._ids[candidate_id] = doc
+        self._names[doc] = candidate_id
+
+        skills = tuple(sorted({str(s).lower().strip() for s in resume_data.get("skills", []) if str(s).strip()}))
+        keywords = tuple(sorted(resume_terms))
+        self._skills[doc] = skills
+        # most resumes have identical sets; share the tuple
+        self._keywords[doc] = skills if keywords == skills else keywords
+
+        for skill in skills:
+            self._postings.setdefault(skill, set()).add(doc)
+
+        experience = resume_data.get("experience")
+        self._experience[doc] = experience
+        if experience is None:
+            self._no_experience.add(doc)
+        else:
+            self._unsorted.append((experience, doc))
+
+    def add_resume(
+        self,
+        candidate_id: str,
+        resume_text: str,
+        candidate_experience: Optional[int] = None,
+    ) -> None:
+        from scoring_service import parse_resume
+
+        resume_data = parse_resume(resume_text, candidate_experience)
+        # the parsed skills are the keyword terms
+        self.add(candidate_id, resume_data, resume_data["skills"])
+
+    def remove(self, candidate_id: str) -> bool:
+        doc = self._ids.pop(candidate_id, None)
+        if doc is None:
+            return False
+
+        del self._names[doc]
+        del self._keywords[doc]
+        for skill in self._skills.pop(doc):
+            posting = self._postings[skill]
+            posting.discard(doc)
+            if not posting:
+                del self._postings[skill]
+
+        experience = self._experience.pop(doc)
+        if experience is None:
+            self._no_experience.discard(doc)
+        elif doc >= self._merged_below:
+            self._unsorted.remove((experience, doc))
+        else:
+            column = self._by_experience
+            del column[bisect_left(column, (experience, doc))]
+        return True
+
+    def _experience_column(self) -> List[Tuple[int, int]]:
+        if self._unsorted:
+            self._unsorted.sort()
+            # two sorted runs: timsort merges them in linear time
+            self._by_experience += self._unsorted
+            self._by_experience.sort()
+            self._unsorted = []
+        self._merged_below = self._next_doc
+        return self._by_experience
+
+    # =============================
+    # Search
+    # =============================
+    def eligible(self, jd_data: Dict[str, Any]) -> Set[int]:
+        """Document ids that pass the required-skills and experience gates."""
+        required = {
+            str(skill).lower().strip()
+            for skill in jd_data.get("required_skills", [])
+            if str(skill).strip()
+        }
+        floor = jd_data.get("experience_required")
+
+        if required:
+            postings = sorted((self._postings.get(skill, set()) for skill in required), key=len)
+            docs = set(postings[0])
+            for posting in postings[1:]:
+                if not docs:
+                    break
+                docs.intersection_update(posting)
+        else:
+            docs = None
+
+        if floor is None:
+            return set(self._names) if docs is None else docs
+
+        column = self._experience_column()
+        start = bisect_left(column, (floor, -1))
+        # whichever side is smaller drives the filter
+        if docs is not None and len(docs) < len(column) - start:
+            experience = self._experience
+            return {doc for doc in docs if experience[doc] is None or experience[doc] >= floor}
+
+        in_range = {doc for _, doc in column[start:]}
+        in_range |= self._no_experience
+        return in_range if docs is None else docs & in_range
+
+    def score(self, doc: int, jd_data: Dict[str, Any]) -> Dict[str, Any]:
+        weighted_skill = WeightedSkillMatcher(
+            required_skills=jd_data["required_skills"],
+            preferred_skills=jd_data["preferred_skills"],
+            candidate_skills=list(self._skills[doc]),
+        ).compute()
+
+        weighted_ats = WeightedATSEngine(
+            skill_match_percent=weighted_skill["final_skill_score"],
+            candidate_experience=self._experience[doc],
+            required_experience=jd_data.get("experience_required"),
+            resume_text="",
+            required_skills=jd_data["required_skills"],
+            preferred_skills=jd_data["preferred_skills"],
+            resume_terms=self._keywords[doc],
+        ).compute()
+
+        return {
+            "candidate_id": self._names[doc],
+            "candidate_data": {"skills": list(self._skills[doc]), "experience": self._experience[doc]},
+            "weighted_skill": weighted_skill,
+            "weighted_ats": weighted_ats,
+        }
+
+    def upper_bounds(self, docs: Set[int], jd_data: Dict[str, Any]) -> List[Tuple[float, int]]:
+        """``(best reachable final_ats_score, doc)`` for ``docs``, best first.
+
+        Every eligible doc has all required skills, so its skill score only
+        depends on how many preferred skills it has; those counts come
+        straight from the postings. The keyword score is taken at its
+        ceiling.
+        """
+        preferred = {s.lower() for s in jd_data["preferred_skills"]}
+        floor = jd_data.get("experience_required")
+
+        overlap = dict.fromkeys(docs, 0)
+        for skill in preferred:
+            for doc in self._postings.get(skill, set()) & docs:
+                overlap[doc] += 1
+
+        # the required part is always complete for an eligible doc
+        skill_by_count = [
+            round(skill_scores(1, 1, len(preferred), count)[2], 2)
+            for count in range(len(preferred) + 1)
+        ]
+
+        experience = self._experience
+        bounds = [
+            (
+                round(final_score_upper_bound(skill_by_count[count], experience_score(experience[doc], floor)), 2),
+                doc,
+            )
+            for doc, count in overlap.items()
+        ]
+        bounds.sort(key=lambda entry: (-entry[0], entry[1]))
+        return bounds
+
+    def search(self, jd_data: Dict[str, Any], top_k: Optional[int] = 50) -> List[Dict[str, Any]]:
+        """Eligible candidates for a parsed JD, best ``final_ats_score`` first.
+
+        Ties keep insertion order. With ``top_k``, candidates are visited in
+        upper-bound order and the scan stops at the first one whose bound
+        cannot beat the current K-th score.
+        """
+        docs = self.eligible(jd_data)
+
+        if top_k is None:
+            scored = [self.score(doc, jd_data) for doc in sorted(docs)]
+            scored.sort(key=lambda result: result["weighted_ats"]["final_ats_score"], reverse=True)
+            return scored
+
+        board = TopK(top_k)
+        for bound, doc in self.upper_bounds(docs, jd_data):
+            if not board.beats(bound, doc):
+                break
+            result = self.score(doc, jd_data)
+            board.push(result["weighted_ats"]["final_ats_score"], doc, result)
+        return board.results()
+
+    # =============================
+    # Persistence
+    # =============================
+    def save(self, path: str) -> None:
+        self._experience_column()
+        state = {"format": INDEX_FORMAT, **self.__dict__}
+        with atomic_open(path) as handle:
+            pickle.dump(state, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "CandidateIndex":
+        with open(path, "rb") as handle:
+            state = pickle.load(handle)
+
+        if state.pop("format", None) != INDEX_FORMAT:
+            raise ValueError(f"{path} was written by an incompatible CandidateIndex version")
+        if state["taxonomy_version"] != get_taxonomy().version:
+            raise ValueError(f"{path} was built with a different skill taxonomy; rebuild it")
+
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
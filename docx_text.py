@@ -0,0 +1,80 @@
+import re
+import zipfile
+from typing import BinaryIO, Iterator, List, Optional, Union
+from xml.etree.ElementTree import Element, iterparse
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# mc:AlternateContent repeats a text box as a VML fallback; read the choice only
+FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_PARAGRAPH = W + "p"
+_TEXT = W + "t"
+_BREAKS = {W + "tab": "\t", W + "br": "\n", W + "cr": "\n", W + "noBreakHyphen": "-"}
+_BODY = W + "body"
+
+_HEADER_RE = re.compile(r"word/header\d*\.xml")
+_FOOTER_RE = re.compile(r"word/footer\d*\.xml")
+
+
+def _part_order(names: List[str]) -> List[str]:
+    """Headers, the body, then footers; parts of a kind in numeric order."""
+
+    def numbered(pattern: "re.Pattern[str]") -> List[str]:
+        found = [name for name in names if pattern.fullmatch(name)]
+        return sorted(found, key=lambda name: (len(name), name))
+
+    body = ["word/document.xml"] if "word/document.xml" in names else []
+    return numbered(_HEADER_RE) + body + numbered(_FOOTER_RE)
+
+
+def iter_part_paragraphs(handle: BinaryIO) -> Iterator[str]:
+    """Text of every ``w:p`` in one part, in order of their closing tags.
+
+    Paragraphs in table cells and text boxes are ordinary ``w:p`` elements,
+    so they come out in place. A text box's paragraphs close before the
+    paragraph anchoring it, so they come first. Finished top-level elements
+    are cleared, which keeps memory flat on large documents.
+    """
+    open_paragraphs: List[List[str]] = []
+    container: Optional[Element] = None
+    fallback_depth = 0
+
+    for event, elem in iterparse(handle, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == FALLBACK:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == _PARAGRAPH:
+                open_paragraphs.append([])
+            elif container is None and tag in (_BODY, W + "hdr", W + "ftr"):
+                container = elem
+            continue
+
+        if tag == FALLBACK:
+            fallback_depth -= 1
+            continue
+        if fallback_depth or not open_paragraphs:
+            continue
+
+        if tag == _TEXT:
+            open_paragraphs[-1].append(elem.text or "")
+        elif tag in _BREAKS:
+            open_paragraphs[-1].append(_BREAKS[tag])
+        elif tag == _PARAGRAPH:
+            yield "".join(open_paragraphs.pop())
+            if not open_paragraphs and container is not None:
+                container.clear()
+
+
+def iter_docx_paragraphs(source: Union[str, BinaryIO]) -> Iterator[str]:
+    """Paragraph text of a DOCX: headers, body (tables and text boxes included), footers."""
+    with zipfile.ZipFile(source) as archive:
+        for name in _part_order(archive.namelist()):
+            with archive.open(name) as handle:
+                yield from iter_part_paragraphs(handle)
+
+
+def read_docx_text(source: Union[str, BinaryIO]) -> str:
+    return "\n".join(iter_docx_paragraphs(source))
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class EligibilityEngine:
@@ -22,9 +22,10 @@ class EligibilityEngine:
         return len(missing) == 0, missing
 
     def check_experience(self) -> bool:
-        required = self.jd.get("experience_required")
-        candidate_exp = self.candidate.get("experience")
+        return self.experience_ok(self.candidate.get("experience"), self.jd.get("experience_required"))
 
+    @staticmethod
+    def experience_ok(candidate_exp: int | None, required: int | None) -> bool:
         if required is not None and candidate_exp is not None:
             if candidate_exp < required:
                 return False
@@ -34,12 +35,18 @@ class EligibilityEngine:
     def evaluate(self) -> Dict[str, Any]:
         required_ok, missing_required = self.check_required_skills()
         if not required_ok:
+            return self.verdict(missing_required, True)
+        return self.verdict([], self.check_experience())
+
+    @staticmethod
+    def verdict(missing_required: List[str], experience_ok: bool) -> Dict[str, Any]:
+        if missing_required:
             return {
                 "eligible": False,
                 "reason": f"Missing required skills: {', '.join(missing_required)}",
             }
 
-        if not self.check_experience():
+        if not experience_ok:
             return {
                 "eligible": False,
                 "reason": "Insufficient experience",
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# a lookup only reads; access times and hit/miss counts are written in
+# batches, once this many entries were read or this long has passed
+ACCESS_FLUSH_ENTRIES = 64
+ACCESS_FLUSH_SECONDS = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    digest TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (digest, extractor)
+);
+CREATE INDEX IF NOT EXISTS texts_last_access ON texts (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters (name, value) VALUES ('hits', 0), ('misses', 0), ('bytes', 0);
+"""
+
+
+def hash_stream(handle: BinaryIO, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: handle.read(chunk_size), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str) -> str:
+    with open(path, "rb") as handle:
+        return hash_stream(handle)
+
+
+class ExtractionCache:
+    """SQLite store of extracted resume text keyed by file hash + extractor.
+
+    Several processes can share one database file (bulk runs open one
+    connection per worker). Hit/miss counters live in the database, so
+    ``stats()`` covers every process that used it. Once the stored text
+    exceeds ``max_bytes``, the least recently read entries are evicted.
+
+    Lookups never write: access times and counters are buffered and written
+    with the next ``put``, or every ``ACCESS_FLUSH_ENTRIES`` reads or
+    ``ACCESS_FLUSH_SECONDS``, so workers sharing a file don't serialize on
+    cache hits. ``close()`` writes what is left.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # (digest, extractor) -> last read time, and counts, not yet written
+        self._accessed: Dict[Tuple[str, str], float] = {}
+        self._hits = 0
+        self._misses = 0
+        self._flushed_at = time.monotonic()
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, digest: str, extractor: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM texts WHERE digest = ? AND extractor = ?",
+                (digest, extractor),
+            ).fetchone()
+
+            if row is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._accessed[(digest, extractor)] = time.time()
+
+            if (
+                len(self._accessed) >= ACCESS_FLUSH_ENTRIES
+                or time.monotonic() - self._flushed_at >= ACCESS_FLUSH_SECONDS
+            ):
+                with self._conn:
+                    self._flush_locked()
+
+            return None if row is None else row[0]
+
+    def put(self, digest: str, extractor: str, text: str) -> None:
+        size = len(text.encode("utf-8"))
+
+        with self._lock, self._conn:
+            previous = self._conn.execute(
+                "SELECT size FROM texts WHERE digest = ? AND extractor = ?",
+                (digest, extractor),
+            ).fetchone()
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO texts (digest, extractor, text, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, extractor, text, size, time.time()),
+            )
+            self._bump("bytes", size - (previous[0] if previous else 0))
+            # recent reads count before anything is evicted
+            self._flush_locked()
+            self._evict_locked(self.max_bytes)
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Drop least recently used entries until under ``max_bytes``."""
+        with self._lock, self._conn:
+            self._flush_locked()
+            return self._evict_locked(self.max_bytes if max_bytes is None else max_bytes)
+
+    def flush(self) -> None:
+        """Write buffered access times and hit/miss counts."""
+        with self._lock, self._conn:
+            self._flush_locked()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            with self._conn:
+                self._flush_locked()
+            counters = dict(self._conn.execute("SELECT name, value FROM counters"))
+            entries = self._conn.execute("SELECT COUNT(*) FROM texts").fetchone()[0]
+
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "entries": entries,
+            "bytes": counters["bytes"],
+            "max_bytes": self.max_bytes,
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            with self._conn:
+                self._flush_locked()
+            self._conn.close()
+
+    # caller holds the lock and an open transaction
+    def _bump(self, name: str, delta: int) -> None:
+        self._conn.execute("UPDATE counters SET value = value + ? WHERE name = ?", (delta, name))
+
+    def _flush_locked(self) -> None:
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE texts SET last_access = ? WHERE digest = ? AND extractor = ?",
+                [(at, digest, extractor) for (digest, extractor), at in self._accessed.items()],
+            )
+            self._accessed.clear()
+        if self._hits:
+            self._bump("hits", self._hits)
+            self._hits = 0
+        if self._misses:
+            self._bump("misses", self._misses)
+            self._misses = 0
+        self._flushed_at = time.monotonic()
+
+    def _evict_locked(self, max_bytes: int) -> int:
+        total = self._conn.execute("SELECT value FROM counters WHERE name = 'bytes'").fetchone()[0]
+        if total <= max_bytes:
+            return 0
+
+        # walk the last_access index only as far as needed
+        victims: List[Tuple[str, str]] = []
+        freed = 0
+        rows = self._conn.execute("SELECT digest, extractor, size FROM texts ORDER BY last_access")
+        for digest, extractor, size in rows:
+            if total - freed <= max_bytes:
+                break
+            victims.append((digest, extractor))
+            freed += size
+        rows.close()
+
+        self._conn.executemany("DELETE FROM texts WHERE digest = ? AND extractor = ?", victims)
+        self._bump("bytes", -freed)
+        return len(victims)
+
+
+# =============================
+# Bulk pre-warm
+# =============================
+def _prewarm_one(cache_path: str, max_bytes: int, path: str) -> Optional[str]:
+    from resume_reader import ResumeReader
+
+    cache = ExtractionCache(cache_path, max_bytes=max_bytes)
+    try:
+        ResumeReader(path, cache=cache).extract_text()
+        return None
+    except Exception as exc:  # noqa: BLE001 - report and keep warming the rest
+        return f"{path}: {type(exc).__name__}: {exc}"
+    finally:
+        cache.close()
+
+
+def prewarm(
+    cache_path: str,
+    paths: Iterable[str],
+    workers: int = 1,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> List[str]:
+    """Extract every path into the cache; returns one message per failure."""
+    paths = list(paths)
+
+    if workers <= 1:
+        failures = [_prewarm_one(cache_path, max_bytes, path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            failures = list(
+                pool.map(_prewarm_one, [cache_path] * len(paths), [max_bytes] * len(paths), paths)
+            )
+
+    return [failure for failure in failures if failure]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage the extracted-text cache.")
+    parser.add_argument("cache", help="SQLite cache file")
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    warm = commands.add_parser("prewarm", help="extract resumes into the cache")
+    warm.add_argument("inputs", nargs="+", help="resume files, directories or glob patterns")
+    warm.add_argument("--workers", type=int, default=1)
+
+    commands.add_parser("stats", help="print entry count, size and hit rate")
+    commands.add_parser("evict", help="trim the cache down to --max-bytes")
+    args = parser.parse_args()
+
+    if args.command == "prewarm":
+        from bulk_score import discover_resumes
+
+        for failure in prewarm(args.cache, discover_resumes(args.inputs), args.workers, args.max_bytes):
+            print(failure)
+
+    cache = ExtractionCache(args.cache, max_bytes=args.max_bytes)
+    try:
+        if args.command == "evict":
+            print(f"evicted {cache.evict()} entries")
+        print(json.dumps(cache.stats()))
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
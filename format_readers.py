@@ -0,0 +1,471 @@
+import codecs
+import io
+import re
+import zipfile
+from contextlib import contextmanager
+from html.parser import HTMLParser
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree.ElementTree import Element, iterparse
+
+# a path on disk, or the document's bytes (an upload)
+Source = Union[str, bytes]
+
+# bytes handed to sniffers; enough for every magic below, including the
+# mimetype entry at the front of an ODT archive
+SNIFF_BYTES = 2048
+
+# text is decoded and parsed this many bytes at a time
+CHUNK_BYTES = 64 * 1024
+
+
+# =============================
+# Registry
+# =============================
+class FormatReader:
+    """One way to get text out of a file format.
+
+    ``read`` takes a ``Source`` and returns the text. ``sniff`` looks at the
+    first ``SNIFF_BYTES`` of a file and says whether it is this format.
+    ``cost`` orders readers when several claim a file: cheapest first.
+    """
+
+    __slots__ = ("kind", "extensions", "read", "sniff", "cost")
+
+    def __init__(
+        self,
+        kind: str,
+        extensions: Tuple[str, ...],
+        read: Callable[[Source], str],
+        sniff: Optional[Callable[[bytes], bool]] = None,
+        cost: float = 1.0,
+    ) -> None:
+        self.kind = kind
+        self.extensions = tuple(extension.lower() for extension in extensions)
+        self.read = read
+        self.sniff = sniff
+        self.cost = cost
+
+
+_READERS: Dict[str, FormatReader] = {}
+
+
+def register_reader(
+    kind: str,
+    extensions: Tuple[str, ...],
+    read: Callable[[Source], str],
+    sniff: Optional[Callable[[bytes], bool]] = None,
+    cost: float = 1.0,
+) -> FormatReader:
+    """Add (or replace) the reader for ``kind``.
+
+    ``kind`` is also the extraction cache's extractor name, so a reader
+    whose output changes should get a new kind.
+    """
+    reader = FormatReader(kind, extensions, read, sniff, cost)
+    _READERS[kind] = reader
+    return reader
+
+
+def registered_readers() -> List[FormatReader]:
+    return sorted(_READERS.values(), key=lambda reader: reader.cost)
+
+
+def registered_extensions() -> Tuple[str, ...]:
+    return tuple(sorted({extension for reader in _READERS.values() for extension in reader.extensions}))
+
+
+def candidate_readers(filename: str, head: bytes) -> List[FormatReader]:
+    """Readers to try on a file, in order.
+
+    Readers whose sniffer recognizes ``head`` come first, then readers
+    registered for the file's extension; each group cheapest first. A file
+    nothing claims is read as plain text if ``head`` looks like text.
+    """
+    suffix = filename.lower()
+    readers = registered_readers()
+
+    sniffed = [reader for reader in readers if reader.sniff is not None and reader.sniff(head)]
+    by_extension = [
+        reader for reader in readers if reader not in sniffed and suffix.endswith(reader.extensions)
+    ]
+    found = sniffed + by_extension
+    if not found and "txt" in _READERS and looks_like_text(head):
+        found = [_READERS["txt"]]
+    return found
+
+
+@contextmanager
+def open_binary(source: Source) -> Iterator[BinaryIO]:
+    if isinstance(source, str):
+        with open(source, "rb") as handle:
+            yield handle
+    else:
+        yield io.BytesIO(source)
+
+
+def open_source(source: Source) -> Union[str, BinaryIO]:
+    # a path, or an upload's bytes wrapped for libraries that want a file
+    return source if isinstance(source, str) else io.BytesIO(source)
+
+
+def read_head(source: Source) -> bytes:
+    if isinstance(source, bytes):
+        return source[:SNIFF_BYTES]
+    with open(source, "rb") as handle:
+        return handle.read(SNIFF_BYTES)
+
+
+# =============================
+# Plain text
+# =============================
+def _text_encoding(head: bytes) -> str:
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    return "utf-8-sig"
+
+
+def looks_like_text(head: bytes) -> bool:
+    if not head:
+        return False
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return True
+    if b"\x00" in head:
+        return False
+    try:
+        # not final: the head may end inside a multi-byte character
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def iter_text_chunks(handle: BinaryIO) -> Iterator[str]:
+    """Decoded text, ``CHUNK_BYTES`` at a time, newlines normalized to ``\\n``."""
+    head = handle.read(2)
+    handle.seek(0)
+    # undecodable bytes become U+FFFD rather than failing the whole file
+    text = io.TextIOWrapper(handle, encoding=_text_encoding(head), errors="replace", newline=None)
+    try:
+        while True:
+            chunk = text.read(CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        # leave the caller's handle open
+        text.detach()
+
+
+def read_txt(source: Source) -> str:
+    with open_binary(source) as handle:
+        return "".join(iter_text_chunks(handle))
+
+
+# =============================
+# HTML
+# =============================
+_HTML_RE = re.compile(rb"^\s*(<\?xml[^>]*>\s*)?(<!--.*?-->\s*)*<(!doctype\s+html|html|head|body)\b", re.I | re.S)
+_SPACE_RE = re.compile(r"[^\S\n]+")
+
+# tags that end a line of text; table cells only need separating
+_HTML_BLOCKS = frozenset(
+    "address article aside blockquote br dd div dl dt footer h1 h2 h3 h4 h5 h6 header hr "
+    "li main nav ol p pre section table tr ul".split()
+)
+_HTML_CELLS = frozenset(("td", "th"))
+_HTML_SKIP = frozenset(("script", "style", "template", "noscript"))
+
+
+def sniff_html(head: bytes) -> bool:
+    return _HTML_RE.match(head.lstrip(codecs.BOM_UTF8)) is not None
+
+
+class _HTMLText(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.skipping = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in _HTML_SKIP:
+            self.skipping += 1
+        elif tag in _HTML_BLOCKS:
+            self.parts.append("\n")
+        elif tag in _HTML_CELLS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _HTML_SKIP:
+            self.skipping = max(0, self.skipping - 1)
+        elif tag in _HTML_BLOCKS:
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self.skipping:
+            # line breaks in the source are just whitespace; blocks make lines
+            self.parts.append(data.replace("\n", " "))
+
+    def text(self) -> str:
+        lines = (_SPACE_RE.sub(" ", line).strip() for line in "".join(self.parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+
+def read_html(source: Source) -> str:
+    parser = _HTMLText()
+    with open_binary(source) as handle:
+        for chunk in iter_text_chunks(handle):
+            parser.feed(chunk)
+    parser.close()
+    return parser.text()
+
+
+# =============================
+# RTF
+# =============================
+_RTF_TOKEN_RE = re.compile(
+    r"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?"  # control word, optional parameter
+    r"|\\'([0-9a-fA-F]{2})"  # hex-escaped byte
+    r"|\\([^a-zA-Z'])"  # control symbol
+    r"|([{}])"
+    r"|[\r\n]+"  # source line breaks carry no meaning
+    r"|([^\\{}\r\n]+)",
+    re.S,
+)
+
+# groups whose content is never document text
+_RTF_DESTINATIONS = frozenset(
+    "fonttbl colortbl stylesheet info pict object fldinst listtable listoverridetable "
+    "rsidtbl generator themedata colorschememapping datastore latentstyles xmlnstbl "
+    "mmathPr filetbl revtbl bkmkstart bkmkend".split()
+)
+_RTF_BREAKS = {"par": "\n", "line": "\n", "row": "\n", "sect": "\n", "page": "\n", "cell": " ", "tab": "\t"}
+_RTF_SYMBOLS = {"~": "\u00a0", "_": "-", "-": "", "\\": "\\", "{": "{", "}": "}", "\n": "\n", "\r": "\n"}
+_RTF_CHARS = {
+    "emdash": "\u2014", "endash": "\u2013", "bullet": "\u2022",
+    "lquote": "\u2018", "rquote": "\u2019", "ldblquote": "\u201c", "rdblquote": "\u201d",
+}
+
+
+def sniff_rtf(head: bytes) -> bool:
+    return head.lstrip().startswith(b"{\\rtf")
+
+
+def _rtf_safe_end(buffer: str) -> int:
+    """Where to cut ``buffer`` so no token is split; the rest waits for more input."""
+    cut = buffer.rfind("\\", max(0, len(buffer) - 64))
+    if cut < 0:
+        return len(buffer)
+    # back up over a run of backslashes: "\\\\" is one token
+    while cut > 0 and buffer[cut - 1] == "\\":
+        cut -= 1
+    return cut
+
+
+class _RTFText:
+    """RTF token stream to plain text; groups, destinations and \\uN skips tracked."""
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        # per group: (skipping, chars to drop after \uN)
+        self.stack: List[Tuple[bool, int]] = []
+        self.skipping = False
+        self.uc = 1
+        self.pending_skip = 0
+        self.codepage = "cp1252"
+        self.group_start = False
+        self.raw = bytearray()
+
+    def _flush_bytes(self) -> None:
+        if self.raw:
+            self.parts.append(self.raw.decode(self.codepage, errors="replace"))
+            self.raw.clear()
+
+    def _emit(self, text: str) -> None:
+        self._flush_bytes()
+        if self.pending_skip:
+            dropped = min(self.pending_skip, len(text))
+            self.pending_skip -= dropped
+            text = text[dropped:]
+        if text and not self.skipping:
+            self.parts.append(text)
+
+    def feed(self, text: str) -> None:
+        for match in _RTF_TOKEN_RE.finditer(text):
+            word, param, hex_byte, symbol, brace, plain = match.groups()
+            if word is None and hex_byte is None and symbol is None and brace is None and plain is None:
+                continue  # a source line break
+            starting = self.group_start
+            self.group_start = False
+
+            if brace == "{":
+                self._flush_bytes()
+                self.stack.append((self.skipping, self.uc))
+                self.group_start = True
+            elif brace == "}":
+                self._flush_bytes()
+                if self.stack:
+                    self.skipping, self.uc = self.stack.pop()
+                self.pending_skip = 0
+            elif hex_byte is not None:
+                if self.pending_skip:
+                    self.pending_skip -= 1
+                elif not self.skipping:
+                    self.raw.append(int(hex_byte, 16))
+            elif symbol is not None:
+                if symbol == "*" and starting:
+                    # {\* ...}: an optional destination this reader doesn't know
+                    self.skipping = True
+                    continue
+                self._emit(_RTF_SYMBOLS.get(symbol, ""))
+            elif word is not None:
+                self._control(word, param, starting)
+            elif plain is not None:
+                self._emit(plain)
+
+    def _control(self, word: str, param: Optional[str], starting: bool) -> None:
+        if word in _RTF_DESTINATIONS and starting:
+            self.skipping = True
+        elif word == "ansicpg" and param:
+            try:
+                self.codepage = codecs.lookup(f"cp{param}").name
+            except LookupError:
+                pass
+        elif word == "uc" and param:
+            self.uc = int(param)
+        elif word == "u" and param:
+            code = int(param)
+            self._emit(chr(code + 65536 if code < 0 else code))
+            self.pending_skip = self.uc
+        elif word in _RTF_BREAKS:
+            self._emit(_RTF_BREAKS[word])
+        elif word in _RTF_CHARS:
+            self._emit(_RTF_CHARS[word])
+
+    def text(self) -> str:
+        self._flush_bytes()
+        return "".join(self.parts).strip()
+
+
+def read_rtf(source: Source) -> str:
+    parser = _RTFText()
+    carry = ""
+    with open_binary(source) as handle:
+        while True:
+            # RTF is 7-bit; latin-1 maps every byte without failing
+            chunk = handle.read(CHUNK_BYTES).decode("latin-1")
+            if not chunk:
+                break
+            buffer = carry + chunk
+            cut = _rtf_safe_end(buffer)
+            parser.feed(buffer[:cut])
+            carry = buffer[cut:]
+    parser.feed(carry)
+    return parser.text()
+
+
+# =============================
+# ODT
+# =============================
+_TEXT_NS = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+_STYLE_NS = "{urn:oasis:names:tc:opendocument:xmlns:style:1.0}"
+_OFFICE_NS = "{urn:oasis:names:tc:opendocument:xmlns:office:1.0}"
+
+_ODT_PARAGRAPHS = frozenset((_TEXT_NS + "p", _TEXT_NS + "h"))
+# content that isn't part of the running text
+_ODT_SKIP = frozenset((_OFFICE_NS + "annotation", _TEXT_NS + "note-citation", _TEXT_NS + "tracked-changes"))
+_ODT_HEADERS = frozenset(_STYLE_NS + name for name in ("header", "header-left", "header-first"))
+_ODT_FOOTERS = frozenset(_STYLE_NS + name for name in ("footer", "footer-left", "footer-first"))
+_ODT_CONTAINERS = frozenset((_OFFICE_NS + "text", _OFFICE_NS + "master-styles"))
+
+
+def sniff_odt(head: bytes) -> bool:
+    # the spec puts an uncompressed "mimetype" entry first in the archive
+    return head.startswith(b"PK\x03\x04") and b"mimetypeapplication/vnd.oasis.opendocument.text" in head[:256]
+
+
+def _odt_paragraph_text(paragraph: Element) -> str:
+    parts: List[str] = []
+
+    def walk(elem: Element) -> None:
+        if elem.text:
+            parts.append(elem.text)
+        for child in elem:
+            tag = child.tag
+            if tag == _TEXT_NS + "s":
+                parts.append(" " * int(child.get(_TEXT_NS + "c", "1")))
+            elif tag == _TEXT_NS + "tab":
+                parts.append("\t")
+            elif tag == _TEXT_NS + "line-break":
+                parts.append("\n")
+            elif tag not in _ODT_PARAGRAPHS and tag not in _ODT_SKIP:
+                # paragraphs in frames and text boxes are read on their own
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(paragraph)
+    return "".join(parts)
+
+
+def _iter_odt_part(handle: BinaryIO) -> Iterator[Tuple[str, str]]:
+    """``(region, text)`` per paragraph; region is "header", "footer" or "body"."""
+    region = "body"
+    depth = 0
+    skipping = 0
+    container: Optional[Element] = None
+
+    for event, elem in iterparse(handle, events=("start", "end")):
+        tag = elem.tag
+        if tag in _ODT_SKIP:
+            # comments and deleted text hold paragraphs of their own
+            skipping += 1 if event == "start" else -1
+            continue
+        if skipping:
+            continue
+
+        if event == "start":
+            if tag in _ODT_PARAGRAPHS:
+                depth += 1
+            elif tag in _ODT_HEADERS:
+                region = "header"
+            elif tag in _ODT_FOOTERS:
+                region = "footer"
+            elif tag in _ODT_CONTAINERS and container is None:
+                container = elem
+            continue
+
+        if tag in _ODT_HEADERS or tag in _ODT_FOOTERS:
+            region = "body"
+        elif tag in _ODT_PARAGRAPHS:
+            depth -= 1
+            yield region, _odt_paragraph_text(elem)
+            if not depth and container is not None:
+                container.clear()
+
+
+def iter_odt_paragraphs(source: Source) -> Iterator[str]:
+    """Paragraph text of an ODT: headers, body (tables and frames included), footers."""
+    with zipfile.ZipFile(open_source(source)) as archive:
+        names = set(archive.namelist())
+        footers: List[str] = []
+        if "styles.xml" in names:
+            with archive.open("styles.xml") as handle:
+                for region, text in _iter_odt_part(handle):
+                    if region == "header":
+                        yield text
+                    elif region == "footer":
+                        footers.append(text)
+        with archive.open("content.xml") as handle:
+            for _, text in _iter_odt_part(handle):
+                yield text
+        yield from footers
+
+
+def read_odt(source: Source) -> str:
+    return "\n".join(iter_odt_paragraphs(source))
+
+
+register_reader("txt", (".txt", ".text"), read_txt, cost=1.0)
+register_reader("html", (".html", ".htm", ".xhtml"), read_html, sniff_html, cost=2.0)
+register_reader("rtf", (".rtf",), read_rtf, sniff_rtf, cost=3.0)
+register_reader("odt", (".odt",), read_odt, sniff_odt, cost=3.0)
@@ -1,38 +1,161 @@
 import re
-from typing import List, Dict, Optional
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from patterns import (  # noqa: F401 - hint lists re-exported for callers
+    PREFERRED_HINTS,
+    REQUIRED_HINT_RE,
+    REQUIRED_HINTS,
+)
+from prepared import Document, prepare
+from skill_matcher import SkillMatcher
+from skill_taxonomy import get_taxonomy
+
+_TAXONOMY = get_taxonomy()
 
 SKILL_ALIASES: Dict[str, List[str]] = {
-    "kubernetes": ["k8s"],
-    "javascript": ["js"],
-    "github actions": ["github action", "gh actions"],
-    "golang": ["go language"],
-    "amazon web services": ["aws"],
-    "terraform": ["tf"],
+    skill: list(aliases) for skill, aliases in _TAXONOMY.aliases.items()
+}
+
+BASE_SKILLS: List[str] = list(_TAXONOMY.skills)
+
+# every spelling of a skill: the canonical name and its aliases
+SKILL_VARIANTS: Dict[str, Tuple[str, ...]] = {
+    skill: tuple(sorted({skill, *SKILL_ALIASES.get(skill, [])})) for skill in BASE_SKILLS
 }
 
-REQUIRED_HINTS = [
-    "must have",
-    "required",
-    "strong proficiency",
-    "mandatory",
-    "expertise in",
-]
-
-PREFERRED_HINTS = [
-    "good to have",
-    "nice to have",
-    "plus",
-    "preferred",
-    "preferred skills",
-    "familiarity with",
-    "exposure to",
-]
+# a hint counts for a skill when it sits fully inside the context window
+# around a mention: up to this many characters either side
+CONTEXT_WINDOW = 80
+
+
+def hint_spans(pattern: "re.Pattern[str]", text: str) -> Tuple[List[int], List[int]]:
+    starts: List[int] = []
+    ends: List[int] = []
+    for match in pattern.finditer(text):
+        starts.append(match.start(1))
+        ends.append(match.end(1))
+    return starts, ends
+
+
+def variant_occurrences(text: str, skills: Iterable[str]) -> List[Tuple[int, str, str]]:
+    """``(start, skill, spelling)`` for every occurrence of a spelling of ``skills``.
+
+    Plain substring hits, inside other words too ("sql" in "mysql"): the
+    original per-variant ``findall`` built its context windows from these,
+    not from word-bounded mentions. Offsets are ascending per spelling.
+    """
+    found: List[Tuple[int, str, str]] = []
+    for skill in skills:
+        for variant in SKILL_VARIANTS.get(skill, (skill,)):
+            start = text.find(variant)
+            while start >= 0:
+                found.append((start, skill, variant))
+                start = text.find(variant, start + 1)
+    return found
+
+
+@lru_cache(maxsize=1)
+def _variant_matcher() -> SkillMatcher:
+    # every (spelling, skill) pair, so a spelling shared by two skills
+    # reports both, as the per-variant loop does
+    return SkillMatcher([(variant, skill) for skill, variants in SKILL_VARIANTS.items() for variant in variants])
+
+
+def all_variant_occurrences(text: str) -> List[Tuple[int, str, str]]:
+    """``variant_occurrences`` of every taxonomy skill, from one automaton pass.
+
+    Cheaper than the ``str.find`` loop once more than a handful of skills
+    are asked for.
+    """
+    return [(start, skill, text[start:end]) for start, end, skill in _variant_matcher().find_occurrences(text)]
+
+
+def _hint_in_window(spans: Tuple[List[int], List[int]], lo: int, hi: int) -> bool:
+    starts, ends = spans
+
+    i = bisect_left(starts, lo)
+    while i < len(starts) and starts[i] < hi:
+        if ends[i] <= hi:
+            return True
+        i += 1
+    return False
+
+
+def _context_windows(starts: List[int], length: int, text_size: int) -> List[Tuple[int, int]]:
+    """Windows ``re.findall(".{0,80}" + term + ".{0,80}")`` would return.
+
+    ``starts`` are the sorted offsets of one term. Like findall, a window
+    anchors on the last mention within reach of its left edge and the next
+    window resumes where the previous one ended.
+    """
+    windows: List[Tuple[int, int]] = []
+    cursor = 0
+    i = 0
+
+    while i < len(starts):
+        left = max(cursor, starts[i] - CONTEXT_WINDOW)
+
+        j = i
+        while j + 1 < len(starts) and starts[j + 1] <= left + CONTEXT_WINDOW:
+            j += 1
+
+        right = min(text_size, starts[j] + length + CONTEXT_WINDOW)
+        windows.append((left, right))
+
+        cursor = right
+        i = j + 1
+        while i < len(starts) and starts[i] < cursor:
+            i += 1
+
+    return windows
+
+
+def classify_mentions(
+    mentions: Iterable[Tuple[int, str, str]],
+    required_spans: Tuple[List[int], List[int]],
+    text_size: int,
+) -> Dict[str, List[str]]:
+    """Required/preferred split from ``(start, skill, spelling)`` mentions.
+
+    ``mentions`` are ``variant_occurrences`` of the skills found, ascending
+    per ``(skill, spelling)``; ``required_spans`` are ``hint_spans`` of
+    ``REQUIRED_HINT_RE`` over the same ``text_size``-long text.
+    """
+    # group mention offsets per (skill, spelling); each alias spelling
+    # gets its own context windows, as the per-variant regex did
+    grouped: Dict[Tuple[str, str], List[int]] = {}
+    for start, skill, spelling in mentions:
+        grouped.setdefault((skill, spelling), []).append(start)
+
+    required = set()
+    for (skill, spelling), starts in grouped.items():
+        if skill in required:
+            continue
+        windows = _context_windows(starts, len(spelling), text_size)
+        if any(_hint_in_window(required_spans, lo, hi) for lo, hi in windows):
+            required.add(skill)
+
+    # a PREFERRED_HINTS match and no hint at all both end up preferred
+    preferred = {skill for skill, _ in grouped} - required
+
+    return {
+        "required_skills": sorted(required),
+        "preferred_skills": sorted(preferred),
+    }
 
 
 class JDParser:
-    def __init__(self, jd_text: str) -> None:
-        self.raw_text: str = jd_text
-        self.cleaned_text: str = self.clean_text()
+    def __init__(self, jd_text: Document) -> None:
+        self.document = prepare(jd_text)
+        self.raw_text: str = self.document.raw_text
+        self.lower_text: str = self.document.text
+
+    @property
+    def cleaned_text(self) -> str:
+        """``raw_text`` on one line, case kept; parsing matches ``lower_text``."""
+        return self.clean_text()
 
     def clean_text(self) -> str:
         text: str = self.raw_text.replace("\n", " ")
@@ -41,98 +164,29 @@ class JDParser:
     # =========================================
     # Skill Extraction
     # =========================================
+    def skill_hits(self) -> List[Tuple[int, int, str]]:
+        """Every ``(start, end, canonical)`` skill mention, from one scan."""
+        return self.document.skill_hits
+
     def extract_skills(self) -> List[str]:
-        BASE_SKILLS: List[str] = [
-            "python",
-            "sql",
-            "docker",
-            "kubernetes",
-            "jenkins",
-            "terraform",
-            "ansible",
-            "github actions",
-            "grafana",
-            "prometheus",
-            "helm",
-            "golang",
-            "datadog",
-            "amazon web services",
-            "snowflake",
-            "AIML"
-        ]
-
-        lower_text: str = self.cleaned_text.lower()
-        found: set[str] = set()
-
-        def matches(term: str) -> bool:
-            pattern = r"\b" + re.escape(term.lower()) + r"\b"
-            return re.search(pattern, lower_text) is not None
-
-        # Base skills
-        for skill in BASE_SKILLS:
-            if matches(skill):
-                found.add(skill)
-
-        # Alias normalization
-        for canonical, aliases in SKILL_ALIASES.items():
-            for alias in aliases:
-                if matches(alias):
-                    found.add(canonical)
-
-        return sorted(found)
+        return sorted(self.document.skills)
 
     # =========================================
     # NEW: Required vs Preferred Classification
     # =========================================
-    def _skill_variants(self, skill: str) -> List[str]:
-        skill_l = skill.lower()
-        variants = {skill_l}
-
-        # canonical -> aliases
-        if skill_l in SKILL_ALIASES:
-            variants.update(alias.lower() for alias in SKILL_ALIASES[skill_l])
-
-        # alias -> canonical
-        for canonical, aliases in SKILL_ALIASES.items():
-            if skill_l in (alias.lower() for alias in aliases):
-                variants.add(canonical.lower())
-                variants.update(alias.lower() for alias in aliases)
-
-        return sorted(variants)
-
     def classify_skills(self) -> Dict[str, List[str]]:
-        base_skills = self.extract_skills()
-        text = self.cleaned_text.lower()
-
-        required = set()
-        preferred = set()
-
-        for skill in base_skills:
-            contexts: List[str] = []
-            for variant in self._skill_variants(skill):
-                pattern = r".{0,80}" + re.escape(variant) + r".{0,80}"
-                contexts.extend(re.findall(pattern, text))
-            context = " ".join(contexts)
-
-            if any(hint in context for hint in REQUIRED_HINTS):
-                required.add(skill)
-            elif any(hint in context for hint in PREFERRED_HINTS):
-                preferred.add(skill)
-            else:
-                preferred.add(skill)
-        return {
-            "required_skills": sorted(required),
-            "preferred_skills": sorted(preferred),
-        }
+        text = self.lower_text
+        return classify_mentions(
+            variant_occurrences(text, self.document.skills),
+            hint_spans(REQUIRED_HINT_RE, text),
+            len(text),
+        )
 
     # =========================================
     # Experience Extraction
     # =========================================
     def extract_experience(self) -> Optional[int]:
-        match = re.search(r"(\d+)\+?\s*years", self.cleaned_text.lower())
-        if match:
-            return int(match.group(1))
-        return None
+        return self.document.experience
 
     # =========================================
     # Final Parse
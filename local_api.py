@@ -1,12 +1,322 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
 import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from email.message import Message
+from email.parser import BytesHeaderParser
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
 
-from scoring_service import evaluate_resume_against_jd
+from format_readers import SNIFF_BYTES, candidate_readers
+from profiling import METRICS, StageProfiler
+from resume_reader import MAX_UPLOAD_BYTES, UPLOAD_EXTENSIONS, ResumeReader, upload_cache
+from scoring_service import (
+    evaluate_resume_against_jd,
+    parse_cache_stats,
+    parse_jd,
+    parse_resume,
+    prefilter_resume,
+    score_parsed,
+)
 
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_BATCH_ITEMS = 10_000
 
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "POST, GET, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
+
+
+def handle_score(raw: bytes) -> Tuple[int, Dict[str, Any]]:
+    """Validate a /score body and score it; returns ``(status, payload)``.
+
+    Shared by both server modes. The async mode runs it in a worker
+    process, so JSON decoding stays off the event loop as well. Results
+    always carry ``timings``; ``finish_score`` records and strips them.
+    """
+    try:
+        body = json.loads(raw.decode("utf-8")) if raw else {}
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return 400, {"error": "Invalid JSON"}
+
+    if not isinstance(body, dict):
+        return 400, {"error": "Invalid JSON"}
+
+    resume_text = str(body.get("resume_text", "")).strip()
+    jd_text = str(body.get("jd_text", "")).strip()
+    candidate_experience = body.get("candidate_experience")
+    if candidate_experience is not None:
+        try:
+            candidate_experience = int(candidate_experience)
+        except (TypeError, ValueError):
+            return 400, {"error": "candidate_experience must be an integer or null"}
+
+    if not resume_text or not jd_text:
+        return 400, {"error": "resume_text and jd_text are required"}
+
+    result = evaluate_resume_against_jd(
+        resume_text=resume_text,
+        jd_text=jd_text,
+        candidate_experience=candidate_experience,
+        profiler=StageProfiler(),
+    )
+    return 200, result
+
+
+def finish_score(payload: Dict[str, Any], profile: bool) -> Dict[str, Any]:
+    """Feed a /score result's timings into /metrics; keep them only if asked."""
+    timings = payload.get("timings")
+    if timings is not None:
+        METRICS.observe(timings)
+        if not profile:
+            del payload["timings"]
+    return payload
+
+
+# =============================
+# /score/upload
+# =============================
+def _header_params(name: str, value: str) -> Message:
+    message = Message()
+    message[name] = value
+    return message
+
+
+def parse_multipart(raw: bytes, content_type: str) -> Dict[str, Tuple[Optional[str], bytes]]:
+    """``{field: (filename, data)}`` from a multipart/form-data body.
+
+    Parts are sliced out of ``raw`` as they are, so file bytes come through
+    unchanged. Raises ``ValueError`` on a malformed body.
+    """
+    header = _header_params("Content-Type", content_type)
+    boundary = header.get_param("boundary")
+    if header.get_content_type() != "multipart/form-data" or not isinstance(boundary, str):
+        raise ValueError("Expected multipart/form-data with a boundary")
+
+    delimiter = b"\r\n--" + boundary.encode("latin-1")
+    parts = (b"\r\n" + raw).split(delimiter)
+    if len(parts) < 3 or not parts[-1].startswith(b"--"):
+        raise ValueError("Malformed multipart body")
+
+    fields: Dict[str, Tuple[Optional[str], bytes]] = {}
+    for part in parts[1:-1]:
+        head, separator, data = part.partition(b"\r\n\r\n")
+        if not separator:
+            raise ValueError("Malformed multipart part")
+        headers = BytesHeaderParser().parsebytes(head.lstrip(b"\r\n") + b"\r\n\r\n")
+        disposition = _header_params("Content-Disposition", headers.get("Content-Disposition", ""))
+        name = disposition.get_param("name", header="content-disposition")
+        if isinstance(name, str):
+            fields[name] = (disposition.get_filename(), data)
+    return fields
+
+
+def handle_upload(raw: bytes, content_type: str) -> Tuple[int, Dict[str, Any]]:
+    """Score a multipart /score/upload body; returns ``(status, payload)``.
+
+    Fields: ``resume`` (a file in any format ``format_readers`` knows), ``jd_text`` and optionally
+    ``candidate_experience``. The file is extracted from memory, never
+    written to disk; with ``RESUMELYTICS_EXTRACTION_CACHE`` set, a file
+    seen before (by content hash) skips extraction. ``timings`` include it.
+    """
+    try:
+        fields = parse_multipart(raw, content_type)
+    except ValueError as exc:
+        return 400, {"error": str(exc)}
+
+    filename, data = fields.get("resume", (None, b""))
+    if not filename or not data:
+        return 400, {"error": "A resume file is required"}
+    # size first: an oversized file is refused without sniffing it
+    if len(data) > MAX_UPLOAD_BYTES:
+        return 413, {"error": f"Resume file larger than {MAX_UPLOAD_BYTES} bytes"}
+    if not candidate_readers(filename, data[:SNIFF_BYTES]):
+        return 415, {"error": f"Unsupported file format. Use one of: {', '.join(UPLOAD_EXTENSIONS)}"}
+
+    try:
+        jd_text = fields.get("jd_text", (None, b""))[1].decode("utf-8").strip()
+        experience_text = fields.get("candidate_experience", (None, b""))[1].decode("utf-8").strip()
+    except UnicodeDecodeError:
+        return 400, {"error": "Form fields must be UTF-8"}
+    if not jd_text:
+        return 400, {"error": "jd_text is required"}
+
+    candidate_experience = None
+    if experience_text:
+        try:
+            candidate_experience = int(experience_text)
+        except ValueError:
+            return 400, {"error": "candidate_experience must be an integer or null"}
+
+    profiler = StageProfiler()
+    reader = ResumeReader.from_upload(data, filename, cache=upload_cache(), profiler=profiler)
+    try:
+        resume_text = (reader.extract_text() or "").strip()
+    except Exception as exc:  # noqa: BLE001 - a corrupt upload is the client's problem
+        return 422, {"error": f"Could not read resume: {type(exc).__name__}: {exc}"}
+    if not resume_text:
+        return 422, {"error": "No text extracted from resume"}
+
+    result = evaluate_resume_against_jd(
+        resume_text=resume_text,
+        jd_text=jd_text,
+        candidate_experience=candidate_experience,
+        profiler=profiler,
+    )
+    return 200, result
+
+
+def split_route(raw_path: str) -> Tuple[str, bool]:
+    """``(path, profile)`` from a request target like ``/score?profile=1``."""
+    target = urlsplit(raw_path)
+    flag = parse_qs(target.query).get("profile", [""])[-1].lower()
+    return target.path, flag in ("1", "true", "yes")
+
+
+# =============================
+# /score/batch
+# =============================
+def parse_batch_request(raw: bytes) -> Tuple[int, Dict[str, Any]]:
+    """Validate a /score/batch body.
+
+    Accepts ``{"jd_text", "resume_texts"}`` (one JD, many resumes) or
+    ``{"resume_text", "jd_texts", "candidate_experience"?}`` (one resume,
+    many JDs). Returns ``(200, batch)`` or ``(400, error payload)``; the
+    items themselves are only checked later, one by one. ``"prefilter": true``
+    routes resumes through ``prefilter_resume`` (one-JD batches only): a
+    resume missing a required skill is not parsed and its result has
+    ``candidate_data.skills`` set to null.
+    """
+    try:
+        body = json.loads(raw.decode("utf-8")) if raw else {}
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return 400, {"error": "Invalid JSON"}
+
+    if not isinstance(body, dict):
+        return 400, {"error": "Invalid JSON"}
+
+    if "resume_texts" in body and "jd_text" in body:
+        mode, shared, items = "jd", body["jd_text"], body["resume_texts"]
+    elif "jd_texts" in body and "resume_text" in body:
+        mode, shared, items = "resume", body["resume_text"], body["jd_texts"]
+    else:
+        return 400, {"error": "Send jd_text with resume_texts, or resume_text with jd_texts"}
+
+    if not isinstance(shared, str) or not shared.strip():
+        return 400, {"error": "jd_text and resume_text must be non-empty strings"}
+
+    if not isinstance(items, list) or not items:
+        return 400, {"error": "resume_texts / jd_texts must be a non-empty list"}
+
+    if len(items) > MAX_BATCH_ITEMS:
+        return 400, {"error": f"At most {MAX_BATCH_ITEMS} items per batch"}
+
+    candidate_experience = body.get("candidate_experience")
+    if candidate_experience is not None:
+        try:
+            candidate_experience = int(candidate_experience)
+        except (TypeError, ValueError):
+            return 400, {"error": "candidate_experience must be an integer or null"}
+
+    return 200, {
+        "mode": mode,
+        "shared": shared.strip(),
+        "items": items,
+        "candidate_experience": candidate_experience,
+        "prefilter": mode == "jd" and bool(body.get("prefilter")),
+    }
+
+
+def parse_batch_shared(mode: str, shared: str, candidate_experience: Optional[int]) -> Dict[str, Any]:
+    if mode == "jd":
+        return parse_jd(shared)
+    return parse_resume(shared, candidate_experience)
+
+
+def score_batch_item(
+    mode: str,
+    shared: str,
+    shared_data: Dict[str, Any],
+    index: int,
+    item: Any,
+    prefilter: bool = False,
+) -> Dict[str, Any]:
+    """One NDJSON line: ``{"index", "result"}`` or ``{"index", "error"}``."""
+    if not isinstance(item, str) or not item.strip():
+        return {"index": index, "error": "Item must be a non-empty string"}
+
+    text = item.strip()
+    try:
+        if mode == "jd":
+            result = prefilter_resume(text, shared_data) if prefilter else None
+            if result is None:
+                result = score_parsed(text, parse_resume(text), shared_data)
+        else:
+            result = score_parsed(shared, shared_data, parse_jd(text))
+    except Exception as exc:  # noqa: BLE001 - report inline, keep the batch going
+        return {"index": index, "error": f"{type(exc).__name__}: {exc}"}
+
+    return {"index": index, "result": result}
+
+
+def iter_batch_lines(batch: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Score a validated batch in order, then yield a summary line."""
+    shared_data = parse_batch_shared(batch["mode"], batch["shared"], batch["candidate_experience"])
+
+    errors = 0
+    for index, item in enumerate(batch["items"]):
+        line = score_batch_item(
+            batch["mode"], batch["shared"], shared_data, index, item, batch["prefilter"]
+        )
+        errors += "error" in line
+        yield line
+
+    yield {"done": True, "count": len(batch["items"]), "errors": errors}
+
+
+def _ndjson(payload: Dict[str, Any]) -> bytes:
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
+def _cache_stats() -> Dict[str, Any]:
+    return {"parse_cache": parse_cache_stats()}
+
+
+# =============================
+# Request bodies (both modes)
+# =============================
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def body_length(content_length: Optional[str]) -> int:
+    """Validated ``Content-Length``, checked before any of the body is read.
+
+    Raises ``_HTTPError`` 400 unless it is a non-negative integer, 413 above
+    ``MAX_BODY_BYTES``; a missing header means no body.
+    """
+    text = (content_length or "0").strip()
+    if not (text.isascii() and text.isdigit()):
+        raise _HTTPError(400, "Invalid Content-Length")
+    length = int(text)
+    if length > MAX_BODY_BYTES:
+        raise _HTTPError(413, "Request body too large")
+    return length
+
+
+# =============================
+# Threaded mode (default)
+# =============================
 class _Handler(BaseHTTPRequestHandler):
     def _write_json(self, status_code: int, payload: Dict[str, Any]) -> None:
         body = json.dumps(payload).encode("utf-8")
@@ -17,66 +327,427 @@ class _Handler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(body)
 
+    def _write_metrics(self) -> None:
+        body = METRICS.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", METRICS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> Optional[bytes]:
+        """The request body, or ``None`` once an error response went out."""
+        try:
+            length = body_length(self.headers.get("Content-Length"))
+        except _HTTPError as exc:
+            # the unread body is still on the socket
+            self.close_connection = True
+            self._write_json(exc.status, {"error": str(exc)})
+            return None
+        return self.rfile.read(length)
+
     def do_OPTIONS(self) -> None:  # noqa: N802
         self.send_response(204)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "POST, GET, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        for name, value in _CORS_HEADERS.items():
+            self.send_header(name, value)
         self.end_headers()
 
     def do_GET(self) -> None:  # noqa: N802
-        if self.path == "/health":
+        path, _ = split_route(self.path)
+        if path == "/health":
             self._write_json(200, {"ok": True})
             return
+        if path == "/cache/stats":
+            self._write_json(200, _cache_stats())
+            return
+        if path == "/metrics":
+            self._write_metrics()
+            return
         self._write_json(404, {"error": "Not found"})
 
     def do_POST(self) -> None:  # noqa: N802
-        if self.path != "/score":
+        path, profile = split_route(self.path)
+        if path == "/score/batch":
+            self._score_batch()
+            return
+
+        if path not in ("/score", "/score/upload"):
             self._write_json(404, {"error": "Not found"})
             return
 
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length).decode("utf-8")
+        body = self._read_body()
+        if body is None:
+            return
+        if path == "/score/upload":
+            status, payload = handle_upload(body, self.headers.get("Content-Type", ""))
+        else:
+            status, payload = handle_score(body)
+        self._write_json(status, finish_score(payload, profile))
 
-        try:
-            body = json.loads(raw) if raw else {}
-        except json.JSONDecodeError:
-            self._write_json(400, {"error": "Invalid JSON"})
+    def _score_batch(self) -> None:
+        body = self._read_body()
+        if body is None:
+            return
+        status, batch = parse_batch_request(body)
+        if status != 200:
+            self._write_json(status, batch)
             return
 
-        resume_text = str(body.get("resume_text", "")).strip()
-        jd_text = str(body.get("jd_text", "")).strip()
-        candidate_experience = body.get("candidate_experience")
-        if candidate_experience is not None:
-            try:
-                candidate_experience = int(candidate_experience)
-            except (TypeError, ValueError):
-                self._write_json(
-                    400,
-                    {"error": "candidate_experience must be an integer or null"},
+        # HTTP/1.0 response without Content-Length: the body ends when the
+        # connection closes, so each line can be flushed as soon as it's ready
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        for line in iter_batch_lines(batch):
+            self.wfile.write(_ndjson(line))
+            self.wfile.flush()
+
+
+def run_server(host: str = "127.0.0.1", port: int = 8787) -> None:
+    server = ThreadingHTTPServer((host, port), _Handler)
+    print(f"Resumelytics API running on http://{host}:{port}")
+    server.serve_forever()
+
+
+# =============================
+# Async mode
+# =============================
+_REASONS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    404: "Not Found",
+    408: "Request Timeout",
+    413: "Payload Too Large",
+    415: "Unsupported Media Type",
+    422: "Unprocessable Entity",
+    503: "Service Unavailable",
+}
+
+
+class AsyncScoringServer:
+    """HTTP/1.1 keep-alive server that scores in a bounded worker pool.
+
+    Connections are handled on one event loop. Scoring (and JSON decoding)
+    runs in ``executor``; once ``max_pending`` requests are queued or running,
+    new /score calls get an immediate 503 with ``Retry-After`` instead of
+    piling up.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_pending: int = 256,
+        keepalive_timeout: float = 15.0,
+        batch_window: int = 16,
+    ) -> None:
+        self.executor = executor
+        self.max_pending = max_pending
+        self.keepalive_timeout = keepalive_timeout
+        self.batch_window = batch_window
+        self.pending = 0
+
+    async def handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader), timeout=self.keepalive_timeout
+                    )
+                except asyncio.TimeoutError:
+                    break
+                except _HTTPError as exc:
+                    await self._write_json(writer, exc.status, {"error": str(exc)}, keep_alive=False)
+                    break
+
+                if request is None:
+                    break
+
+                method, target, headers, body, keep_alive = request
+                path, profile = split_route(target)
+                if method == "POST" and path == "/score/batch":
+                    await self._stream_batch(writer, body, keep_alive)
+                    if not keep_alive:
+                        break
+                    continue
+
+                if method == "GET" and path == "/metrics":
+                    metrics = METRICS.render().encode("utf-8")
+                    await self._write(
+                        writer, 200, metrics, {"Content-Type": METRICS_CONTENT_TYPE}, keep_alive
+                    )
+                    if not keep_alive:
+                        break
+                    continue
+
+                status, payload, extra = await self._dispatch(
+                    method, path, body, profile, headers.get("content-type", "")
                 )
-                return
+                if status == 204:
+                    await self._write(writer, 204, b"", extra, keep_alive)
+                else:
+                    await self._write_json(writer, status, payload, keep_alive, extra)
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(
+        self,
+        reader: asyncio.StreamReader,
+    ) -> Optional[Tuple[str, str, Dict[str, str], bytes, bool]]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as exc:
+            if not exc.partial:
+                return None  # client closed an idle connection
+            raise
+        except asyncio.LimitOverrunError:
+            raise _HTTPError(400, "Headers too large")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise _HTTPError(400, "Malformed request line")
+
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        length = body_length(headers.get("content-length"))
+        body = await reader.readexactly(length) if length else b""
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+
+        return method.upper(), path, headers, body, keep_alive
 
-        if not resume_text or not jd_text:
-            self._write_json(
-                400,
-                {"error": "resume_text and jd_text are required"},
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+        profile: bool = False,
+        content_type: str = "",
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        if method == "OPTIONS":
+            return 204, {}, dict(_CORS_HEADERS)
+
+        if method == "GET" and path == "/health":
+            return 200, {"ok": True}, {}
+
+        if method == "GET" and path == "/cache/stats":
+            # each pool worker has its own parse cache; this reports one of them
+            loop = asyncio.get_running_loop()
+            return 200, await loop.run_in_executor(self.executor, _cache_stats), {}
+
+        if method == "POST" and path in ("/score", "/score/upload"):
+            if self.pending >= self.max_pending:
+                return 503, {"error": "Server busy, retry shortly"}, {"Retry-After": "1"}
+
+            self.pending += 1
+            try:
+                loop = asyncio.get_running_loop()
+                if path == "/score/upload":
+                    # multipart parsing and extraction run in the worker too
+                    call = loop.run_in_executor(self.executor, handle_upload, body, content_type)
+                else:
+                    call = loop.run_in_executor(self.executor, handle_score, body)
+                status, payload = await call
+            finally:
+                self.pending -= 1
+            # timings come back from the worker; histograms live in this process
+            return status, finish_score(payload, profile), {}
+
+        return 404, {"error": "Not found"}, {}
+
+    async def _stream_batch(
+        self,
+        writer: asyncio.StreamWriter,
+        body: bytes,
+        keep_alive: bool,
+    ) -> None:
+        """Answer /score/batch as chunked NDJSON, one line per finished item.
+
+        The whole batch holds a single pending slot; at most ``batch_window``
+        of its items sit in the pool at once so other callers still get
+        through. Lines go out in completion order and carry their ``index``.
+        """
+        if self.pending >= self.max_pending:
+            await self._write_json(
+                writer, 503, {"error": "Server busy, retry shortly"}, keep_alive, {"Retry-After": "1"}
             )
             return
 
-        result = evaluate_resume_against_jd(
-            resume_text=resume_text,
-            jd_text=jd_text,
-            candidate_experience=candidate_experience,
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            status, batch = await loop.run_in_executor(self.executor, parse_batch_request, body)
+            if status != 200:
+                await self._write_json(writer, status, batch, keep_alive)
+                return
+
+            mode = batch["mode"]
+            shared = batch["shared"]
+            prefilter = batch["prefilter"]
+            shared_data = await loop.run_in_executor(
+                self.executor, parse_batch_shared, mode, shared, batch["candidate_experience"]
+            )
+
+            await self._write_head(
+                writer,
+                200,
+                {"Content-Type": "application/x-ndjson", "Transfer-Encoding": "chunked"},
+                keep_alive,
+            )
+
+            items = iter(enumerate(batch["items"]))
+            running: Dict["asyncio.Future[Dict[str, Any]]", int] = {}
+            errors = 0
+
+            def submit_next() -> None:
+                nxt = next(items, None)
+                if nxt is not None:
+                    future = loop.run_in_executor(
+                        self.executor, score_batch_item, mode, shared, shared_data, *nxt, prefilter
+                    )
+                    running[future] = nxt[0]
+
+            for _ in range(self.batch_window):
+                submit_next()
+
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        line = future.result()
+                    except Exception as exc:  # noqa: BLE001 - e.g. a worker died
+                        line = {"index": index, "error": f"{type(exc).__name__}: {exc}"}
+                    errors += "error" in line
+                    await self._write_chunk(writer, _ndjson(line))
+                    submit_next()
+
+            summary = {"done": True, "count": len(batch["items"]), "errors": errors}
+            await self._write_chunk(writer, _ndjson(summary))
+            await self._write_chunk(writer, b"")
+        finally:
+            self.pending -= 1
+
+    async def _write_chunk(self, writer: asyncio.StreamWriter, data: bytes) -> None:
+        # an empty chunk terminates the chunked body
+        writer.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        await writer.drain()
+
+    async def _write_json(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Dict[str, Any],
+        keep_alive: bool,
+        extra: Optional[Dict[str, str]] = None,
+    ) -> None:
+        headers = {"Content-Type": "application/json", **(extra or {})}
+        await self._write(writer, status, json.dumps(payload).encode("utf-8"), headers, keep_alive)
+
+    async def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: bytes,
+        headers: Dict[str, str],
+        keep_alive: bool,
+    ) -> None:
+        await self._write_head(
+            writer, status, {"Content-Length": str(len(body)), **headers}, keep_alive
         )
-        self._write_json(200, result)
+        writer.write(body)
+        await writer.drain()
 
+    async def _write_head(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        headers: Dict[str, str],
+        keep_alive: bool,
+    ) -> None:
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}"]
+        merged = {
+            "Access-Control-Allow-Origin": "*",
+            "Connection": "keep-alive" if keep_alive else "close",
+            **headers,
+        }
+        if keep_alive:
+            merged["Keep-Alive"] = f"timeout={int(self.keepalive_timeout)}"
+        lines.extend(f"{name}: {value}" for name, value in merged.items())
 
-def run_server(host: str = "127.0.0.1", port: int = 8787) -> None:
-    server = ThreadingHTTPServer((host, port), _Handler)
-    print(f"Resumelytics API running on http://{host}:{port}")
-    server.serve_forever()
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+
+def run_async_server(
+    host: str = "127.0.0.1",
+    port: int = 8787,
+    workers: Optional[int] = None,
+    max_pending: int = 256,
+) -> None:
+    workers = workers or os.cpu_count() or 1
+
+    async def serve() -> None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            app = AsyncScoringServer(pool, max_pending=max_pending, batch_window=workers * 2)
+            server = await asyncio.start_server(app.handle_connection, host, port)
+            print(
+                f"Resumelytics API (async, {workers} workers) running on http://{host}:{port}"
+            )
+            async with server:
+                await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resumelytics local scoring API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--mode", choices=["threaded", "async"], default="threaded")
+    parser.add_argument("--workers", type=int, help="async mode: scoring processes")
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=256,
+        help="async mode: queued + running /score calls before answering 503",
+    )
+    parser.add_argument(
+        "--extraction-cache",
+        help="SQLite file of extracted text, reused for /score/upload files seen before",
+    )
+    args = parser.parse_args()
+
+    if args.extraction_cache:
+        # workers read it from the environment they inherit
+        os.environ["RESUMELYTICS_EXTRACTION_CACHE"] = args.extraction_cache
+
+    if args.mode == "async":
+        run_async_server(args.host, args.port, args.workers, args.max_pending)
+    else:
+        run_server(args.host, args.port)
 
 
 if __name__ == "__main__":
-    run_server()
+    main()
@@ -83,6 +83,7 @@ def main() -> None:
         resume_text=resume_text,
         required_skills=result["required_skills"],
         preferred_skills=result["preferred_skills"],
+        resume_terms=candidate_data["skills"],
     )
 
     weighted_result = weighted.compute()
@@ -0,0 +1,124 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def normalize_text(text: str) -> str:
+    # both parsers fold newlines and case before matching, so these forms
+    # always parse to the same result
+    return text.replace("\n", " ").strip().lower()
+
+
+def _estimate_bytes(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_estimate_bytes(k) + _estimate_bytes(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_estimate_bytes(item) for item in value)
+    return size
+
+
+def _copy(value: Dict[str, Any]) -> Dict[str, Any]:
+    # parsed documents are flat dicts of scalars and string lists; callers
+    # are free to mutate what they get back (scoring_service does)
+    return {k: list(v) if isinstance(v, list) else v for k, v in value.items()}
+
+
+class ParseCache:
+    """Bounded, thread-safe LRU cache of parsed resume / JD dicts.
+
+    Keys are a hash of the document kind, the taxonomy version and the
+    normalized text, so a taxonomy edit never serves stale skills.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(kind: str, version: str, text: str) -> str:
+        digest = hashlib.sha256(f"{kind}\0{version}\0".encode("utf-8"))
+        digest.update(normalize_text(text).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy(entry[0])
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        stored = _copy(value)
+        size = _estimate_bytes(stored)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (stored, size)
+            self._bytes += size
+            self._evict()
+
+    def get_or_parse(self, key: str, parse: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        # parse outside the lock; a concurrent duplicate parse is harmless
+        value = parse()
+        self.put(key, value)
+        return value
+
+    def configure(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _evict(self) -> None:
+        # caller holds the lock
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
@@ -0,0 +1,48 @@
+import re
+from typing import List
+
+from skill_matcher import SkillMatcher
+from skill_taxonomy import get_taxonomy
+
+# =============================
+# Hint vocabularies (JD classification)
+# =============================
+REQUIRED_HINTS: List[str] = [
+    "must have",
+    "required",
+    "strong proficiency",
+    "mandatory",
+    "expertise in",
+]
+
+PREFERRED_HINTS: List[str] = [
+    "good to have",
+    "nice to have",
+    "plus",
+    "preferred",
+    "preferred skills",
+    "familiarity with",
+    "exposure to",
+]
+
+
+def hint_pattern(hints: List[str]) -> "re.Pattern[str]":
+    # zero-width lookahead so overlapping hints are all reported; shorter
+    # hints first so the tightest span wins when two share an offset
+    alternatives = "|".join(re.escape(h) for h in sorted(hints, key=len))
+    return re.compile("(?=(" + alternatives + "))")
+
+
+# =============================
+# Compiled once at import
+# =============================
+REQUIRED_HINT_RE = hint_pattern(REQUIRED_HINTS)
+
+EXPERIENCE_RE = re.compile(r"(\d+)\+?\s*years")
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def skill_matcher() -> SkillMatcher:
+    """The taxonomy's compiled skill/alias matcher (built at taxonomy load)."""
+    return get_taxonomy().matcher
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from skill_matcher import build_terms, contains_term
+from skill_taxonomy import get_taxonomy
+
+
+class RequiredSkillGate:
+    """A JD's required skills compiled to just the spellings that satisfy them.
+
+    ``check`` answers the question ``EligibilityEngine.check_required_skills``
+    asks without extracting every taxonomy skill from the resume: each
+    required skill is looked up by its own spellings with the same
+    word-boundary rule ``SkillMatcher`` applies. Required skills outside the
+    taxonomy can never be extracted, so they are always missing, as on the
+    full path.
+    """
+
+    __slots__ = ("required", "_spellings")
+
+    def __init__(self, required_skills: Iterable[str], terms: Dict[str, str]) -> None:
+        # normalized the way EligibilityEngine does it
+        self.required: Tuple[str, ...] = tuple(
+            sorted({str(skill).lower().strip() for skill in required_skills if str(skill).strip()})
+        )
+
+        by_canonical: Dict[str, List[str]] = {}
+        for term, canonical in terms.items():
+            by_canonical.setdefault(canonical, []).append(term)
+
+        # shortest spelling first: cheapest to scan for, usually the common one
+        self._spellings: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (skill, tuple(sorted(by_canonical.get(skill, []), key=len)))
+            for skill in self.required
+        )
+
+    def check(self, lower_text: str) -> Tuple[List[str], List[str]]:
+        """``(found, missing)`` required skills for ``lower_text``, both sorted."""
+        found: List[str] = []
+        missing: List[str] = []
+
+        for skill, spellings in self._spellings:
+            if any(contains_term(lower_text, term) for term in spellings):
+                found.append(skill)
+            else:
+                missing.append(skill)
+
+        return found, missing
+
+
+@lru_cache(maxsize=256)
+def _gate(version: str, required: Tuple[str, ...]) -> RequiredSkillGate:
+    taxonomy = get_taxonomy()
+    return RequiredSkillGate(required, build_terms(list(taxonomy.skills), taxonomy.aliases))
+
+
+def gate_for(required_skills: Iterable[str]) -> RequiredSkillGate:
+    """Compiled gate for a JD's required skills, reused across resumes."""
+    return _gate(get_taxonomy().version, tuple(sorted(str(s) for s in required_skills)))
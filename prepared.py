@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import FrozenSet, List, Optional, Tuple, Union
+
+from patterns import EXPERIENCE_RE, TOKEN_RE, skill_matcher
+
+SkillHit = Tuple[int, int, str]
+
+
+def normalize(raw_text: str) -> str:
+    """The form every parser, gate and engine matches against."""
+    return raw_text.replace("\n", " ").strip().lower()
+
+
+class PreparedDocument:
+    """One resume or JD, normalized once and shared by every stage.
+
+    The normalized text, skill mentions, token offsets and experience figure
+    are each computed on first use and kept. However many stages (or JDs)
+    look at a document, it is lowercased once and scanned by the skill
+    matcher once. Pass it wherever a resume or JD text is accepted.
+    """
+
+    __slots__ = ("raw_text", "_text", "_hits", "_skills", "_tokens", "_words", "_experience")
+
+    def __init__(self, raw_text: str) -> None:
+        self.raw_text = raw_text
+        self._text: Optional[str] = None
+        self._hits: Optional[List[SkillHit]] = None
+        self._skills: Optional[FrozenSet[str]] = None
+        self._tokens: Optional[List[Tuple[int, int]]] = None
+        self._words: Optional[FrozenSet[str]] = None
+        # a list so "not computed" and "no experience found" differ
+        self._experience: Optional[List[Optional[int]]] = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = normalize(self.raw_text)
+        return self._text
+
+    @property
+    def skill_hits(self) -> List[SkillHit]:
+        """Every word-bounded ``(start, end, canonical)`` skill mention."""
+        if self._hits is None:
+            self._hits = list(skill_matcher().find_all(self.text))
+        return self._hits
+
+    @property
+    def skills(self) -> FrozenSet[str]:
+        if self._skills is None:
+            self._skills = frozenset(skill for _, _, skill in self.skill_hits)
+        return self._skills
+
+    @property
+    def tokens(self) -> List[Tuple[int, int]]:
+        """``(start, end)`` of every ``\\w+`` run in ``text``."""
+        if self._tokens is None:
+            self._tokens = [match.span() for match in TOKEN_RE.finditer(self.text)]
+        return self._tokens
+
+    @property
+    def words(self) -> FrozenSet[str]:
+        # a single-word term matches ``\b<term>\b`` exactly when it is a token
+        if self._words is None:
+            text = self.text
+            self._words = frozenset(text[start:end] for start, end in self.tokens)
+        return self._words
+
+    @property
+    def experience(self) -> Optional[int]:
+        if self._experience is None:
+            match = EXPERIENCE_RE.search(self.text)
+            self._experience = [int(match.group(1)) if match else None]
+        return self._experience[0]
+
+
+Document = Union[str, PreparedDocument]
+
+
+def prepare(document: Document) -> PreparedDocument:
+    return document if isinstance(document, PreparedDocument) else PreparedDocument(document)
+
+
+def raw_text(document: Document) -> str:
+    return document.raw_text if isinstance(document, PreparedDocument) else document
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+# upper bounds in seconds; scoring stages run from tens of microseconds
+# (cache hits) to seconds (large PDFs)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class StageProfiler:
+    """Wall and CPU time per pipeline stage for one scoring request.
+
+    CPU time is ``time.thread_time``, so it excludes whatever other threads
+    (e.g. concurrent requests in the threaded server) did meanwhile. A stage
+    entered twice accumulates.
+    """
+
+    __slots__ = ("stages",)
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, List[float]] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            totals = self.stages.setdefault(name, [0.0, 0.0])
+            totals[0] += time.perf_counter() - wall
+            totals[1] += time.thread_time() - cpu
+
+    def to_dict(self) -> Dict[str, Any]:
+        stages = {
+            name: {"wall_ms": round(wall * 1000, 3), "cpu_ms": round(cpu * 1000, 3)}
+            for name, (wall, cpu) in self.stages.items()
+        }
+        return {
+            "stages": stages,
+            "total_wall_ms": round(sum(wall for wall, _ in self.stages.values()) * 1000, 3),
+            "total_cpu_ms": round(sum(cpu for _, cpu in self.stages.values()) * 1000, 3),
+        }
+
+
+def stage(profiler: Optional[StageProfiler], name: str) -> ContextManager[None]:
+    """``profiler.stage(name)``, or a no-op when profiling is off."""
+    if profiler is None:
+        return nullcontext()
+    return profiler.stage(name)
+
+
+# =============================
+# Prometheus histograms
+# =============================
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+
+class StageMetrics:
+    """Per-stage wall/CPU histograms fed from ``timings`` blocks.
+
+    Buckets are cumulative from process start, as the Prometheus text format
+    expects; rolling windows come from ``rate()``/``histogram_quantile()`` on
+    the scraping side.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Histogram] = {}
+
+    def observe(self, timings: Dict[str, Any]) -> None:
+        with self._lock:
+            for name, values in timings.get("stages", {}).items():
+                self._observe_locked("wall", name, values["wall_ms"] / 1000)
+                self._observe_locked("cpu", name, values["cpu_ms"] / 1000)
+            self._observe_locked("wall", "total", timings.get("total_wall_ms", 0.0) / 1000)
+            self._observe_locked("cpu", "total", timings.get("total_cpu_ms", 0.0) / 1000)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for kind in ("wall", "cpu"):
+                metric = f"resumelytics_stage_{kind}_seconds"
+                lines.append(f"# HELP {metric} {kind} time per scoring stage")
+                lines.append(f"# TYPE {metric} histogram")
+
+                for (series_kind, name), hist in sorted(self._series.items()):
+                    if series_kind != kind:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(self.buckets, hist.counts):
+                        cumulative += count
+                        lines.append(f'{metric}_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                    lines.append(f'{metric}_bucket{{stage="{name}",le="+Inf"}} {hist.count}')
+                    lines.append(f'{metric}_sum{{stage="{name}"}} {hist.total:.6f}')
+                    lines.append(f'{metric}_count{{stage="{name}"}} {hist.count}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def _observe_locked(self, kind: str, name: str, seconds: float) -> None:
+        hist = self._series.get((kind, name))
+        if hist is None:
+            hist = self._series[(kind, name)] = _Histogram(len(self.buckets))
+
+        index = bisect_left(self.buckets, seconds)
+        if index < len(self.buckets):
+            hist.counts[index] += 1
+        hist.total += seconds
+        hist.count += 1
+
+
+# recorded at the API layer, in the process that serves /metrics
+METRICS = StageMetrics()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, List, Optional, Tuple
+
+
+class TopK:
+    """The ``k`` best items by score, kept in a bounded min-heap.
+
+    Ties go to the smaller ``order`` (e.g. the input position), so the
+    result equals ``sorted(..., reverse=True)[:k]`` over items in ``order``
+    with a stable sort. ``beats`` lets callers skip expensive scoring when
+    an upper bound on the item's score cannot displace the current K-th.
+    """
+
+    __slots__ = ("k", "_heap")
+
+    def __init__(self, k: int) -> None:
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        # (score, -order, item): the root is the entry evicted next
+        self._heap: List[Tuple[float, int, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def threshold(self) -> Optional[float]:
+        """Score of the current K-th item, once ``k`` items are held."""
+        if len(self._heap) < self.k:
+            return None
+        return self._heap[0][0]
+
+    def beats(self, score: float, order: int) -> bool:
+        if len(self._heap) < self.k:
+            return True
+        kth_score, kth_order, _ = self._heap[0]
+        return (score, -order) > (kth_score, kth_order)
+
+    def push(self, score: float, order: int, item: Any) -> bool:
+        """Offer an item; returns whether it is (for now) in the top ``k``."""
+        if not self.beats(score, order):
+            return False
+
+        entry = (score, -order, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heapreplace(self._heap, entry)
+        return True
+
+    def results(self) -> List[Any]:
+        """Held items, best first."""
+        return [item for _, _, item in sorted(self._heap, key=lambda e: (e[0], e[1]), reverse=True)]
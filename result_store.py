@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+import numpy as np
+
+from atomic_file import atomic_open
+from results import PairResult
+
+# bump when the on-disk layout changes
+STORE_FORMAT = 1
+
+# one fixed-width little-endian file per column; scores are NaN where the
+# pair was not scored (ineligible or failed)
+COLUMNS: Dict[str, str] = {
+    "candidate": "<i4",
+    "jd": "<i4",
+    "status": "u1",
+    "final_ats_score": "<f4",
+    "skill_score": "<f4",
+    "experience_score": "<f4",
+    "keyword_score": "<f4",
+}
+SCORE_COLUMNS = ("final_ats_score", "skill_score", "experience_score", "keyword_score")
+
+ELIGIBLE = 0
+MISSING_SKILLS = 1
+INSUFFICIENT_EXPERIENCE = 2
+ERROR = 3
+STATUS_NAMES = {
+    ELIGIBLE: "eligible",
+    MISSING_SKILLS: "missing_skills",
+    INSUFFICIENT_EXPERIENCE: "insufficient_experience",
+    ERROR: "error",
+}
+
+# rows a reader looks at per step; bounds the memory a filter or top-k uses
+CHUNK_ROWS = 1 << 20
+
+_META = "meta.json"
+_SIDECARS = {"candidate": "candidates.jsonl", "jd": "jds.jsonl"}
+
+
+def status_for(eligible: Optional[bool], reason: Optional[str], error: Optional[str]) -> int:
+    """Status code for a bulk_score row."""
+    if error:
+        return ERROR
+    if eligible:
+        return ELIGIBLE
+    if reason == "Insufficient experience":
+        return INSUFFICIENT_EXPERIENCE
+    return MISSING_SKILLS
+
+
+def _write_meta(path: str, meta: Dict[str, Any]) -> None:
+    with atomic_open(os.path.join(path, _META), "w", encoding="utf-8") as handle:
+        json.dump(meta, handle)
+
+
+def _read_meta(path: str) -> Dict[str, Any]:
+    with open(os.path.join(path, _META), encoding="utf-8") as handle:
+        meta = json.load(handle)
+    if meta.get("format") != STORE_FORMAT:
+        raise ValueError(f"{path} was written by an incompatible result store version")
+    return meta
+
+
+def _read_names(path: str, kind: str, count: int) -> List[str]:
+    names: List[str] = []
+    sidecar = os.path.join(path, _SIDECARS[kind])
+    if os.path.exists(sidecar):
+        with open(sidecar, encoding="utf-8") as handle:
+            for line in handle:
+                if len(names) == count:
+                    break
+                names.append(json.loads(line))
+    return names
+
+
+# =============================
+# Writer
+# =============================
+class ResultStoreWriter:
+    """Appends scored pairs to a directory of fixed-width column files.
+
+    Candidate and JD names go to JSON-lines sidecar tables; the columns hold
+    their integer ids. Rows are buffered and written every ``flush_rows``;
+    ``meta.json`` is replaced after each flush, so a crash loses at most the
+    unflushed rows and reopening the store appends after the last good row.
+    """
+
+    def __init__(self, path: str, flush_rows: int = 65536) -> None:
+        self.path = path
+        self.flush_rows = flush_rows
+        os.makedirs(path, exist_ok=True)
+
+        if os.path.exists(os.path.join(path, _META)):
+            meta = _read_meta(path)
+        else:
+            meta = {"format": STORE_FORMAT, "rows": 0, "candidates": 0, "jds": 0}
+        self.rows: int = meta["rows"]
+
+        self._ids: Dict[str, Dict[str, int]] = {}
+        self._sidecars: Dict[str, TextIO] = {}
+        for kind, key in (("candidate", "candidates"), ("jd", "jds")):
+            names = _read_names(path, kind, meta[key])
+            self._ids[kind] = {name: index for index, name in enumerate(names)}
+            sidecar = os.path.join(path, _SIDECARS[kind])
+            # drop names written after the last flushed meta
+            with open(sidecar, "a", encoding="utf-8"):
+                pass
+            self._truncate_lines(sidecar, len(names))
+            self._sidecars[kind] = open(sidecar, "a", encoding="utf-8")
+
+        self._files = {}
+        for name, dtype in COLUMNS.items():
+            column = os.path.join(path, f"{name}.col")
+            with open(column, "ab") as handle:
+                handle.truncate(self.rows * np.dtype(dtype).itemsize)
+            self._files[name] = open(column, "ab")
+
+        self._buffer: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+
+    @staticmethod
+    def _truncate_lines(path: str, keep: int) -> None:
+        with open(path, "rb+") as handle:
+            for _ in range(keep):
+                if not handle.readline():
+                    break
+            handle.truncate(handle.tell())
+
+    def _id(self, kind: str, name: str) -> int:
+        ids = self._ids[kind]
+        found = ids.get(name)
+        if found is None:
+            found = ids[name] = len(ids)
+            self._sidecars[kind].write(json.dumps(name) + "\n")
+        return found
+
+    def append(
+        self,
+        candidate: str,
+        jd: Optional[str],
+        status: int,
+        final_ats_score: Optional[float] = None,
+        skill_score: Optional[float] = None,
+        experience_score: Optional[float] = None,
+        keyword_score: Optional[float] = None,
+    ) -> None:
+        buffer = self._buffer
+        buffer["candidate"].append(self._id("candidate", candidate))
+        buffer["jd"].append(-1 if jd is None else self._id("jd", jd))
+        buffer["status"].append(status)
+        buffer["final_ats_score"].append(np.nan if final_ats_score is None else final_ats_score)
+        buffer["skill_score"].append(np.nan if skill_score is None else skill_score)
+        buffer["experience_score"].append(np.nan if experience_score is None else experience_score)
+        buffer["keyword_score"].append(np.nan if keyword_score is None else keyword_score)
+
+        if len(buffer["status"]) >= self.flush_rows:
+            self.flush()
+
+    def append_result(self, candidate: str, jd: Optional[str], result: PairResult) -> None:
+        """Append one ``results.PairResult``."""
+        if result.eligibility.eligible:
+            status = ELIGIBLE
+        elif result.eligibility.missing_required:
+            status = MISSING_SKILLS
+        else:
+            status = INSUFFICIENT_EXPERIENCE
+
+        ats = result.weighted_ats
+        if ats is None:
+            self.append(candidate, jd, status)
+        else:
+            self.append(
+                candidate,
+                jd,
+                status,
+                ats.final_ats_score,
+                ats.skill_score,
+                ats.experience_score,
+                ats.keyword_score,
+            )
+
+    def append_row(self, row: Dict[str, Any]) -> None:
+        """Append one ``bulk_score`` output row."""
+        self.append(
+            row["resume"],
+            row.get("jd"),
+            status_for(row.get("eligible"), row.get("reason"), row.get("error")),
+            row.get("final_ats_score"),
+            row.get("skill_score"),
+            row.get("experience_score"),
+            row.get("keyword_score"),
+        )
+
+    def flush(self) -> None:
+        pending = len(self._buffer["status"])
+        if pending:
+            for name, dtype in COLUMNS.items():
+                np.asarray(self._buffer[name], dtype=dtype).tofile(self._files[name])
+                self._files[name].flush()
+                self._buffer[name] = []
+            self.rows += pending
+
+        for sidecar in self._sidecars.values():
+            sidecar.flush()
+
+        _write_meta(
+            self.path,
+            {
+                "format": STORE_FORMAT,
+                "rows": self.rows,
+                "candidates": len(self._ids["candidate"]),
+                "jds": len(self._ids["jd"]),
+                "columns": COLUMNS,
+            },
+        )
+
+    def close(self) -> None:
+        self.flush()
+        for handle in list(self._files.values()) + list(self._sidecars.values()):
+            handle.close()
+
+    def __enter__(self) -> "ResultStoreWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+# =============================
+# Reader
+# =============================
+class ResultStore:
+    """Read-only view of a result store; columns are ``numpy.memmap``s.
+
+    Filters and top-k walk the columns ``chunk_rows`` at a time, so memory
+    stays bounded by the chunk size plus the answer, not the store size.
+    """
+
+    def __init__(self, path: str, chunk_rows: int = CHUNK_ROWS) -> None:
+        self.path = path
+        self.chunk_rows = chunk_rows
+        meta = _read_meta(path)
+        self.rows: int = meta["rows"]
+
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, dtype in COLUMNS.items():
+            if self.rows:
+                self.columns[name] = np.memmap(
+                    os.path.join(path, f"{name}.col"), dtype=dtype, mode="r", shape=(self.rows,)
+                )
+            else:
+                self.columns[name] = np.empty(0, dtype=dtype)
+
+        self.candidate_names = _read_names(path, "candidate", meta["candidates"])
+        self.jd_names = _read_names(path, "jd", meta["jds"])
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _chunks(self) -> Iterator[tuple]:
+        for start in range(0, self.rows, self.chunk_rows):
+            yield start, min(self.rows, start + self.chunk_rows)
+
+    def _mask(
+        self,
+        start: int,
+        stop: int,
+        min_score: Optional[float],
+        max_score: Optional[float],
+        status: Optional[int],
+        jd: Optional[str],
+    ) -> np.ndarray:
+        mask = np.ones(stop - start, dtype=bool)
+
+        if min_score is not None or max_score is not None:
+            scores = self.columns["final_ats_score"][start:stop]
+            # NaN compares false, so unscored rows drop out here
+            if min_score is not None:
+                mask &= scores >= np.float32(min_score)
+            if max_score is not None:
+                mask &= scores <= np.float32(max_score)
+        if status is not None:
+            mask &= self.columns["status"][start:stop] == status
+        if jd is not None:
+            mask &= self.columns["jd"][start:stop] == self._jd_id(jd)
+        return mask
+
+    def _jd_id(self, jd: str) -> int:
+        try:
+            return self.jd_names.index(jd)
+        except ValueError:
+            return -2  # matches nothing
+
+    def select(
+        self,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        status: Optional[int] = None,
+        jd: Optional[str] = None,
+    ) -> np.ndarray:
+        """Row numbers matching every given filter, ascending."""
+        found = [
+            np.nonzero(self._mask(start, stop, min_score, max_score, status, jd))[0] + start
+            for start, stop in self._chunks()
+        ]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def top(
+        self,
+        k: int,
+        by: str = "final_ats_score",
+        jd: Optional[str] = None,
+        min_score: Optional[float] = None,
+    ) -> np.ndarray:
+        """Row numbers of the ``k`` highest ``by`` scores (ties: lower row first)."""
+        if by not in SCORE_COLUMNS:
+            raise ValueError(f"by must be one of {', '.join(SCORE_COLUMNS)}")
+
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+
+        for start, stop in self._chunks():
+            scores = np.asarray(self.columns[by][start:stop])
+            mask = ~np.isnan(scores) & self._mask(start, stop, min_score, None, None, jd)
+            rows = np.nonzero(mask)[0]
+            values = scores[rows]
+
+            if len(rows) > k:
+                kth = np.partition(values, len(values) - k)[len(values) - k]
+                above = values > kth
+                ties = np.nonzero(values == kth)[0][: k - int(above.sum())]
+                keep = np.sort(np.concatenate([np.nonzero(above)[0], ties]))
+                rows, values = rows[keep], values[keep]
+
+            rows = np.concatenate([best_rows, rows + start])
+            values = np.concatenate([best_scores, values])
+            order = np.lexsort((rows, -values))[:k]
+            best_rows, best_scores = rows[order], values[order]
+
+        return best_rows
+
+    def row(self, index: int) -> Dict[str, Any]:
+        columns = self.columns
+        jd = int(columns["jd"][index])
+        result: Dict[str, Any] = {
+            "resume": self.candidate_names[int(columns["candidate"][index])],
+            "jd": self.jd_names[jd] if jd >= 0 else None,
+            "status": STATUS_NAMES[int(columns["status"][index])],
+        }
+        for name in SCORE_COLUMNS:
+            value = float(columns[name][index])
+            # float32 keeps ~7 significant digits; scores are stored at 2 dp
+            result[name] = None if np.isnan(value) else round(value, 2)
+        return result
+
+    def rows_at(self, indices: np.ndarray) -> List[Dict[str, Any]]:
+        return [self.row(int(index)) for index in indices]
+
+    def stats(self) -> Dict[str, Any]:
+        counts = np.zeros(len(STATUS_NAMES), dtype=np.int64)
+        for start, stop in self._chunks():
+            counts += np.bincount(self.columns["status"][start:stop], minlength=len(STATUS_NAMES))
+        return {
+            "rows": self.rows,
+            "candidates": len(self.candidate_names),
+            "jds": len(self.jd_names),
+            **{STATUS_NAMES[code]: int(count) for code, count in enumerate(counts)},
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query a columnar result store.")
+    parser.add_argument("store", help="result store directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("stats", help="row, candidate and JD counts by status")
+
+    top = commands.add_parser("top", help="best rows by score")
+    top.add_argument("-k", type=int, default=50)
+    top.add_argument("--by", choices=SCORE_COLUMNS, default="final_ats_score")
+    top.add_argument("--jd", help="only rows for this JD")
+    top.add_argument("--min-score", type=float)
+
+    select = commands.add_parser("select", help="rows matching filters")
+    select.add_argument("--jd")
+    select.add_argument("--min-score", type=float)
+    select.add_argument("--max-score", type=float)
+    select.add_argument("--status", choices=list(STATUS_NAMES.values()))
+    select.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    store = ResultStore(args.store)
+    if args.command == "stats":
+        print(json.dumps(store.stats()))
+    elif args.command == "top":
+        for row in store.rows_at(store.top(args.k, args.by, args.jd, args.min_score)):
+            print(json.dumps(row))
+    else:
+        codes = {name: code for code, name in STATUS_NAMES.items()}
+        status = codes[args.status] if args.status else None
+        indices = store.select(args.min_score, args.max_score, status, args.jd)
+        for row in store.rows_at(indices[: args.limit]):
+            print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
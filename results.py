@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ats_weighted_skill import WeightedSkillMatcher
+from eligibility_engine import EligibilityEngine
+from skill_taxonomy import get_taxonomy
+from weighted_ats import WeightedATSEngine
+
+SkillIds = Tuple[int, ...]
+
+# =============================
+# Skill interning
+# =============================
+# taxonomy skills take ids 0..n-1 in taxonomy order; anything else (e.g.
+# hand-entered JD skills) is appended on first sight
+_NAMES: List[str] = list(get_taxonomy().skills)
+_IDS: Dict[str, int] = {name: index for index, name in enumerate(_NAMES)}
+_INTERN_LOCK = threading.Lock()
+
+
+def skill_id(name: str) -> int:
+    name = str(name).lower().strip()
+    found = _IDS.get(name)
+    if found is not None:
+        return found
+
+    with _INTERN_LOCK:
+        found = _IDS.get(name)
+        if found is None:
+            found = _IDS[name] = len(_NAMES)
+            _NAMES.append(name)
+        return found
+
+
+def intern_skills(names: Iterable[str]) -> SkillIds:
+    """Sorted, de-duplicated ids for non-blank skill names."""
+    return tuple(sorted({skill_id(name) for name in names if str(name).strip()}))
+
+
+def skill_names(ids: Iterable[int]) -> List[str]:
+    """Names for ``ids``, sorted by name like the dict results."""
+    return sorted(_NAMES[i] for i in ids)
+
+
+# =============================
+# Result types
+# =============================
+# slotted and frozen: a scored pair holds a few floats and references to
+# shared parse results instead of its own dicts of string lists; to_dict()
+# builds the JSON shape only when asked
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedResume:
+    # None when the prefilter rejected the resume without extracting skills
+    skills: Optional[SkillIds]
+    experience: Optional[int]
+
+    @classmethod
+    def from_dict(cls, resume_data: Dict[str, Any]) -> "ParsedResume":
+        return cls(intern_skills(resume_data.get("skills", [])), resume_data.get("experience"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        skills = None if self.skills is None else skill_names(self.skills)
+        return {"skills": skills, "experience": self.experience}
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedJD:
+    skills: SkillIds
+    required_skills: SkillIds
+    preferred_skills: SkillIds
+    experience_required: Optional[int]
+
+    @classmethod
+    def from_dict(cls, jd_data: Dict[str, Any]) -> "ParsedJD":
+        return cls(
+            intern_skills(jd_data.get("skills", [])),
+            intern_skills(jd_data.get("required_skills", [])),
+            intern_skills(jd_data.get("preferred_skills", [])),
+            jd_data.get("experience_required"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "skills": skill_names(self.skills),
+            "required_skills": skill_names(self.required_skills),
+            "preferred_skills": skill_names(self.preferred_skills),
+            "experience_required": self.experience_required,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Eligibility:
+    eligible: bool
+    missing_required: SkillIds = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.eligible:
+            return EligibilityEngine.verdict([], True)
+        # not eligible and nothing missing: failed on experience
+        return EligibilityEngine.verdict(skill_names(self.missing_required), False)
+
+
+# the two verdicts that carry no data are shared by every pair
+ELIGIBLE = Eligibility(True)
+INSUFFICIENT_EXPERIENCE = Eligibility(False)
+
+
+@dataclass(frozen=True, slots=True)
+class SkillScore:
+    required_score: float
+    preferred_score: float
+    final_skill_score: float
+    strength: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "required_score": self.required_score,
+            "preferred_score": self.preferred_score,
+            "final_skill_score": self.final_skill_score,
+            "strength": self.strength,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ATSScore:
+    final_ats_score: float
+    skill_score: float
+    experience_score: float
+    keyword_score: float
+    strength: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "final_ats_score": self.final_ats_score,
+            "skill_score": self.skill_score,
+            "experience_score": self.experience_score,
+            "keyword_score": self.keyword_score,
+            "strength": self.strength,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PairResult:
+    """Compact counterpart of a ``scoring_service.score_parsed`` dict."""
+
+    candidate: ParsedResume
+    jd: ParsedJD
+    eligibility: Eligibility
+    weighted_skill: Optional[SkillScore] = None
+    weighted_ats: Optional[ATSScore] = None
+
+    @property
+    def rank_key(self) -> float:
+        # ineligible pairs sink to the bottom, as in scoring_service
+        return self.weighted_ats.final_ats_score if self.weighted_ats is not None else -1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "candidate_data": self.candidate.to_dict(),
+            "jd_data": self.jd.to_dict(),
+            "eligibility": self.eligibility.to_dict(),
+        }
+        if self.weighted_skill is not None:
+            result["weighted_skill"] = self.weighted_skill.to_dict()
+        if self.weighted_ats is not None:
+            result["weighted_ats"] = self.weighted_ats.to_dict()
+        return result
+
+
+def skill_score(scores: Tuple[float, float, float]) -> SkillScore:
+    required, preferred, total = scores
+    return SkillScore(round(required, 2), round(preferred, 2), round(total, 2), WeightedSkillMatcher.label(total))
+
+
+def ats_score(scores: Tuple[float, float, float, float]) -> ATSScore:
+    final, skill, experience, keyword = scores
+    return ATSScore(
+        round(final, 2),
+        round(skill, 2),
+        round(experience, 2),
+        round(keyword, 2),
+        WeightedATSEngine.label(final),
+    )
@@ -1,34 +1,296 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import BinaryIO, Callable, Deque, Dict, Iterator, List, Optional, Union
+
 import pdfplumber
 from docx import Document
-from typing import Optional
+
+from docx_text import read_docx_text
+from extraction_cache import ExtractionCache, hash_bytes, hash_file
+from format_readers import (
+    Source,
+    candidate_readers,
+    open_source,
+    read_head,
+    register_reader,
+    registered_extensions,
+)
+from profiling import StageProfiler, stage
+
+# bump when extraction output changes so cached text is re-extracted
+EXTRACTOR_VERSION = "1"
+
+# pages handed to one pool task; each task reopens the PDF, so very small
+# batches spend their time parsing the document structure again
+PAGES_PER_TASK = 4
+
+# "stream" parses the DOCX XML directly and includes tables, headers,
+# footers and text boxes; "python-docx" is the old body-paragraphs-only reader
+DOCX_READERS = ("stream", "python-docx")
+DOCX_READER = os.environ.get("RESUMELYTICS_DOCX_READER", "stream")
+
+
+def _extract_pdf_pages(source: Source, start: int, stop: int) -> List[str]:
+    """Pool task: text of pages ``[start, stop)`` (empty string for blank pages)."""
+    texts = []
+    with pdfplumber.open(open_source(source)) as pdf:
+        for page in pdf.pages[start:stop]:
+            texts.append(page.extract_text() or "")
+            page.close()
+    return texts
+
+
+def _iter_pages(pdf: "pdfplumber.PDF", page_count: int) -> Iterator[str]:
+    for page in pdf.pages[:page_count]:
+        text = page.extract_text()
+        # drop pdfplumber's per-page object cache once the text is out
+        page.close()
+        if text:
+            yield text
+
+
+def read_pdf(source: Source) -> str:
+    with pdfplumber.open(open_source(source)) as pdf:
+        return "\n".join(_iter_pages(pdf, len(pdf.pages)))
+
+
+def read_docx_stream(source: Source) -> str:
+    return read_docx_text(open_source(source))
+
+
+def read_docx_python(source: Source) -> str:
+    doc = Document(open_source(source))
+    return "\n".join([para.text for para in doc.paragraphs])
+
+
+def sniff_pdf(head: bytes) -> bool:
+    # readers tolerate a little junk before the header, so look past byte 0
+    return b"%PDF-" in head[:1024]
+
+
+def sniff_docx(head: bytes) -> bool:
+    # OOXML archives list [Content_Types].xml (first, in practice); ODT has none
+    return head.startswith(b"PK\x03\x04") and b"[Content_Types].xml" in head
+
+
+register_reader("docx-stream", (".docx",), read_docx_stream, sniff_docx, cost=3.0)
+register_reader("docx", (".docx",), read_docx_python, sniff_docx, cost=6.0)
+register_reader("pdf", (".pdf",), read_pdf, sniff_pdf, cost=10.0)
+
+# =============================
+# Uploads
+# =============================
+# limits for every upload entry point (local_api's /score/upload, the web app)
+MAX_UPLOAD_BYTES = int(os.environ.get("RESUMELYTICS_MAX_UPLOAD_BYTES", str(5 * 1024 * 1024)))
+UPLOAD_EXTENSIONS = registered_extensions()
+
+_UPLOAD_CACHES: Dict[str, ExtractionCache] = {}
+_UPLOAD_CACHES_LOCK = threading.Lock()
+
+
+def upload_cache(path: Optional[str] = None) -> Optional[ExtractionCache]:
+    """The cache at ``path`` (default ``RESUMELYTICS_EXTRACTION_CACHE``), opened once per process."""
+    path = path or os.environ.get("RESUMELYTICS_EXTRACTION_CACHE")
+    if not path:
+        return None
+    with _UPLOAD_CACHES_LOCK:
+        cache = _UPLOAD_CACHES.get(path)
+        if cache is None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            cache = _UPLOAD_CACHES[path] = ExtractionCache(path)
+        return cache
+
 
 
 class ResumeReader:
-    def __init__(self, file_path: str) -> None:
-        self.file_path = file_path.lower()
+    def __init__(
+        self,
+        file_path: str,
+        cache: Optional[ExtractionCache] = None,
+        profiler: Optional[StageProfiler] = None,
+        docx_reader: Optional[str] = None,
+    ) -> None:
+        # keep the path as given; lowercasing it breaks case-sensitive filesystems
+        self.file_path = file_path
+        self.cache = cache
+        self.profiler = profiler
+        self.docx_reader = docx_reader or DOCX_READER
+        if self.docx_reader not in DOCX_READERS:
+            raise ValueError(f"Unknown DOCX reader {self.docx_reader!r}; use one of {DOCX_READERS}")
+        # set by from_upload: the document itself, with file_path its name
+        self.data: Optional[bytes] = None
+        # the registered reader whose text extract_text returned
+        self.reader_kind: Optional[str] = None
+
+    @classmethod
+    def from_upload(
+        cls,
+        upload: Union[bytes, BinaryIO],
+        filename: str,
+        cache: Optional[ExtractionCache] = None,
+        profiler: Optional[StageProfiler] = None,
+        max_bytes: Optional[int] = None,
+        docx_reader: Optional[str] = None,
+    ) -> "ResumeReader":
+        """Reader over an in-memory document (e.g. an HTTP upload); nothing touches disk.
+
+        ``filename`` only picks the format. A file object is read to the
+        end, up to ``max_bytes``; larger input raises ``ValueError``. The
+        cache key is the upload's content hash, as for files on disk.
+        """
+        if isinstance(upload, bytes):
+            data = upload
+        else:
+            data = upload.read() if max_bytes is None else upload.read(max_bytes + 1)
+        if max_bytes is not None and len(data) > max_bytes:
+            raise ValueError(f"Upload exceeds {max_bytes} bytes")
+
+        reader = cls(filename, cache, profiler, docx_reader)
+        reader.data = data
+        return reader
+
+    @property
+    def _source(self) -> Source:
+        return self.file_path if self.data is None else self.data
 
     def extract_text(self) -> Optional[str]:
-        if self.file_path.endswith(".pdf"):
-            return self._read_pdf()
+        """Text from the first reader that finds any.
+
+        Readers come from ``format_readers.candidate_readers``: those that
+        recognize the file's first bytes, then those registered for its
+        extension, cheapest first. A reader that fails or finds no text
+        hands over to the next; if every one fails, the last error is raised.
+        """
+        # python-docx mode never uses the stream reader; stream mode may
+        # still fall back to python-docx
+        excluded = "docx-stream" if self.docx_reader == "python-docx" else None
+        readers = [
+            reader
+            for reader in candidate_readers(self.file_path, read_head(self._source))
+            if reader.kind != excluded
+        ]
+        if not readers:
+            raise ValueError(f"Unsupported file format. Use one of: {', '.join(registered_extensions())}")
+
+        # hashed once, not once per reader tried
+        digest = None
+        if self.cache is not None:
+            with stage(self.profiler, "extract"):
+                digest = hash_file(self.file_path) if self.data is None else hash_bytes(self.data)
+
+        error: Optional[Exception] = None
+        for reader in readers:
+            try:
+                text = self._cached(reader.kind, partial(reader.read, self._source), digest)
+            except Exception as exc:  # noqa: BLE001 - try the next reader
+                error = exc
+                continue
+            if text.strip():
+                self.reader_kind = reader.kind
+                return text
 
-        if self.file_path.endswith(".docx"):
-            return self._read_docx()
+        if error is not None:
+            raise error
+        return ""
 
-        raise ValueError("Unsupported file format. Use PDF or DOCX.")
+    def _cached(self, kind: str, read: Callable[[], str], digest: Optional[str]) -> str:
+        with stage(self.profiler, "extract"):
+            return self._read_through_cache(kind, read, digest)
+
+    def _read_through_cache(self, kind: str, read: Callable[[], str], digest: Optional[str]) -> str:
+        if self.cache is None or digest is None:
+            return read()
+
+        extractor = f"{kind}:{EXTRACTOR_VERSION}"
+
+        text = self.cache.get(digest, extractor)
+        if text is None:
+            text = read()
+            self.cache.put(digest, extractor, text)
+        return text
 
     # ---------- PDF ----------
-    def _read_pdf(self) -> str:
-        text_parts = []
+    def iter_pdf_pages(
+        self,
+        workers: int = 1,
+        max_pages: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[str]:
+        """Yield the text of each non-blank page, in page order.
+
+        With ``workers > 1`` (or an ``executor``), pages are extracted in
+        parallel in batches of ``PAGES_PER_TASK``. Only a few batches are in
+        flight at any time, so memory stays flat on large files.
+        ``max_pages`` stops after that many pages. ``max_bytes`` stops once
+        that much UTF-8 text has been yielded; the last page is truncated to
+        fit.
+        """
+        with pdfplumber.open(open_source(self._source)) as pdf:
+            page_count = len(pdf.pages)
+            if max_pages is not None:
+                page_count = min(page_count, max_pages)
+
+            if executor is None and (workers <= 1 or page_count <= PAGES_PER_TASK):
+                pages = _iter_pages(pdf, page_count)
+                yield from self._limit_bytes(pages, max_bytes)
+                return
+
+        if executor is not None:
+            pages = self._iter_pages_parallel(executor, page_count, max(workers, 2) * 2)
+            yield from self._limit_bytes(pages, max_bytes)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pages = self._iter_pages_parallel(pool, page_count, workers * 2)
+            yield from self._limit_bytes(pages, max_bytes)
+
+    def _iter_pages_parallel(
+        self,
+        executor: Executor,
+        page_count: int,
+        max_in_flight: int,
+    ) -> Iterator[str]:
+        batches = iter(range(0, page_count, PAGES_PER_TASK))
+        pending: Deque[Future] = deque()
+
+        def submit_next() -> None:
+            start = next(batches, None)
+            if start is not None:
+                stop = min(start + PAGES_PER_TASK, page_count)
+                pending.append(executor.submit(_extract_pdf_pages, self._source, start, stop))
+
+        try:
+            for _ in range(max_in_flight):
+                submit_next()
 
-        with pdfplumber.open(self.file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+            while pending:
+                texts = pending.popleft().result()
+                submit_next()
+                for text in texts:
+                    if text:
+                        yield text
+        finally:
+            # consumer stopped early (cutoff or error): drop queued batches
+            for future in pending:
+                future.cancel()
 
-        return "\n".join(text_parts)
+    @staticmethod
+    def _limit_bytes(pages: Iterator[str], max_bytes: Optional[int]) -> Iterator[str]:
+        if max_bytes is None:
+            yield from pages
+            return
 
-    # ---------- DOCX ----------
-    def _read_docx(self) -> str:
-        doc = Document(self.file_path)
-        return "\n".join([para.text for para in doc.paragraphs])
\ No newline at end of file
+        remaining = max_bytes
+        for text in pages:
+            encoded = text.encode("utf-8")
+            if len(encoded) >= remaining:
+                clipped = encoded[:remaining].decode("utf-8", errors="ignore")
+                if clipped:
+                    yield clipped
+                return
+            remaining -= len(encoded)
+            yield text
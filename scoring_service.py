@@ -1,31 +1,73 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from ats_weighted_skill import WeightedSkillMatcher
+from ats_weighted_skill import WeightedSkillMatcher, skill_scores
 from eligibility_engine import EligibilityEngine
 from jd_parser import JDParser
+from parse_cache import ParseCache
+from prefilter import gate_for
+from prepared import Document, PreparedDocument, prepare, raw_text
+from profiling import StageProfiler, stage
+from ranking import TopK
 from resume_parser import ResumeParser
-from weighted_ats import WeightedATSEngine
+from results import (
+    ELIGIBLE,
+    INSUFFICIENT_EXPERIENCE,
+    Eligibility,
+    PairResult,
+    ParsedJD,
+    ParsedResume,
+    ats_score,
+    intern_skills,
+    skill_names,
+    skill_score,
+)
+from skill_taxonomy import get_taxonomy
+from weighted_ats import WeightedATSEngine, experience_score, final_score_upper_bound
 
+# shared by every caller in the process (local_api threads, web app, batch runs)
+_PARSE_CACHE = ParseCache(
+    max_entries=int(os.environ.get("RESUMELYTICS_PARSE_CACHE_ENTRIES", "1024")),
+    max_bytes=int(os.environ.get("RESUMELYTICS_PARSE_CACHE_BYTES", str(64 * 1024 * 1024))),
+)
 
-def evaluate_resume_against_jd(
-    resume_text: str,
-    jd_text: str,
-    candidate_experience: Optional[int] = None,
-) -> Dict[str, Any]:
-    resume_data = ResumeParser(resume_text).parse()
-    jd_data = JDParser(jd_text).parse()
+
+def parse_jd(jd_text: Document) -> Dict[str, Any]:
+    key = ParseCache.make_key("jd", get_taxonomy().version, raw_text(jd_text))
+    return _PARSE_CACHE.get_or_parse(key, lambda: JDParser(jd_text).parse())
+
+
+def parse_resume(resume_text: Document, candidate_experience: Optional[int] = None) -> Dict[str, Any]:
+    key = ParseCache.make_key("resume", get_taxonomy().version, raw_text(resume_text))
+    resume_data = _PARSE_CACHE.get_or_parse(key, lambda: ResumeParser(resume_text).parse())
 
     if candidate_experience is not None:
         resume_data["experience"] = candidate_experience
 
-    candidate_profile = {
-        "experience": resume_data.get("experience"),
-        "skills": resume_data.get("skills", []),
-    }
+    return resume_data
 
-    eligibility = EligibilityEngine(jd_data, candidate_profile).evaluate()
+
+def score_parsed(
+    resume_text: Document,
+    resume_data: Dict[str, Any],
+    jd_data: Dict[str, Any],
+    profiler: Optional[StageProfiler] = None,
+    eligibility: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Eligibility and weighted scores for an already parsed pair.
+
+    Pass ``eligibility`` when the verdict for this pair is already known.
+    """
+    if eligibility is None:
+        candidate_profile = {
+            "experience": resume_data.get("experience"),
+            "skills": resume_data.get("skills", []),
+        }
+
+        with stage(profiler, "eligibility"):
+            eligibility = EligibilityEngine(jd_data, candidate_profile).evaluate()
 
     result: Dict[str, Any] = {
         "candidate_data": resume_data,
@@ -36,25 +78,298 @@ def evaluate_resume_against_jd(
     if not eligibility["eligible"]:
         return result
 
-    weighted_skill = WeightedSkillMatcher(
-        required_skills=jd_data["required_skills"],
-        preferred_skills=jd_data["preferred_skills"],
-        candidate_skills=resume_data["skills"],
-    ).compute()
-
-    weighted_ats = WeightedATSEngine(
-        skill_match_percent=weighted_skill["final_skill_score"],
-        candidate_experience=resume_data.get("experience"),
-        required_experience=jd_data.get("experience_required"),
-        resume_text=resume_text,
-        required_skills=jd_data["required_skills"],
-        preferred_skills=jd_data["preferred_skills"],
-    ).compute()
+    with stage(profiler, "weighted_skill"):
+        weighted_skill = WeightedSkillMatcher(
+            required_skills=jd_data["required_skills"],
+            preferred_skills=jd_data["preferred_skills"],
+            candidate_skills=resume_data["skills"],
+        ).compute()
+
+    with stage(profiler, "weighted_ats"):
+        weighted_ats = WeightedATSEngine(
+            skill_match_percent=weighted_skill["final_skill_score"],
+            candidate_experience=resume_data.get("experience"),
+            required_experience=jd_data.get("experience_required"),
+            resume_text=resume_text,
+            required_skills=jd_data["required_skills"],
+            preferred_skills=jd_data["preferred_skills"],
+            resume_terms=resume_data["skills"],
+        ).compute()
 
     result["weighted_skill"] = weighted_skill
     result["weighted_ats"] = weighted_ats
     return result
 
 
+def prefilter_resume(
+    resume_text: Document,
+    jd_data: Dict[str, Any],
+    candidate_experience: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """Ineligible result from the required-skills gate alone, or ``None``.
+
+    ``None`` means every required skill is present and the pair needs full
+    scoring. A rejected resume is never parsed: the eligibility verdict,
+    reason and experience are exactly what the full path gives, but
+    ``candidate_data["skills"]`` is ``None`` (not extracted).
+    """
+    document = prepare(resume_text)
+    _, missing = gate_for(jd_data.get("required_skills", [])).check(document.text)
+    if not missing:
+        return None
+
+    experience = document.experience if candidate_experience is None else candidate_experience
+    return {
+        "candidate_data": {"skills": None, "experience": experience},
+        "jd_data": jd_data,
+        "eligibility": EligibilityEngine.verdict(missing, True),
+    }
+
+
+def _rank_key(result: Dict[str, Any]) -> float:
+    # ineligible pairs have no weighted_ats block and sink to the bottom
+    weighted_ats = result.get("weighted_ats")
+    if not weighted_ats:
+        return -1.0
+    return weighted_ats["final_ats_score"]
+
+
+def evaluate_resume_against_jd(
+    resume_text: str,
+    jd_text: str,
+    candidate_experience: Optional[int] = None,
+    profiler: Optional[StageProfiler] = None,
+    prefilter: bool = False,
+) -> Dict[str, Any]:
+    """Score one pair; with a ``profiler``, add a per-stage ``timings`` block.
+
+    Pass the same profiler to ``ResumeReader`` first to include extraction.
+    With ``prefilter``, resumes missing a required skill are rejected by
+    ``prefilter_resume`` before the full parse.
+    """
+    with stage(profiler, "parse_jd"):
+        jd_data = parse_jd(jd_text)
+
+    # normalized and scanned at most once, whichever stages run
+    document = prepare(resume_text)
+
+    result: Optional[Dict[str, Any]] = None
+    if prefilter:
+        with stage(profiler, "prefilter"):
+            result = prefilter_resume(document, jd_data, candidate_experience)
+
+    if result is None:
+        with stage(profiler, "parse_resume"):
+            resume_data = parse_resume(document, candidate_experience)
+        result = score_parsed(document, resume_data, jd_data, profiler)
+
+    if profiler is not None:
+        result["timings"] = profiler.to_dict()
+    return result
+
+
+def evaluate_resume_against_jds(
+    resume_text: str,
+    jd_texts: Iterable[str],
+    candidate_experience: Optional[int] = None,
+    prefilter: bool = False,
+) -> List[Dict[str, Any]]:
+    """Score one resume against many JDs, best fit first.
+
+    The resume is parsed at most once (not at all when ``prefilter`` rejects
+    it for every JD); each result carries ``jd_index`` pointing back into
+    ``jd_texts``.
+    """
+    document = prepare(resume_text)
+    resume_data: Optional[Dict[str, Any]] = None
+
+    results: List[Dict[str, Any]] = []
+    for index, jd_text in enumerate(jd_texts):
+        jd_data = parse_jd(jd_text)
+
+        result = prefilter_resume(document, jd_data, candidate_experience) if prefilter else None
+        if result is None:
+            if resume_data is None:
+                resume_data = parse_resume(document, candidate_experience)
+            result = score_parsed(document, resume_data, jd_data)
+        result["jd_index"] = index
+        results.append(result)
+
+    results.sort(key=_rank_key, reverse=True)
+    return results
+
+
+def rank_resumes_for_jd(
+    resume_texts: Iterable[str],
+    jd_text: str,
+    prefilter: bool = False,
+    top_k: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Score many resumes against one JD, best fit first.
+
+    The JD is parsed once; each result carries ``resume_index`` pointing back
+    into ``resume_texts``. ``prefilter`` skips the full parse for resumes
+    missing a required skill. With ``top_k`` only the best ``top_k`` results
+    come back (the same ones, in the same order, as slicing the full list).
+    Resumes whose best reachable score cannot beat the current K-th are
+    never parsed (see ``_reachable_score``).
+    """
+    jd_data = parse_jd(jd_text)
+
+    if top_k is not None:
+        return _top_resumes_for_jd(resume_texts, jd_data, prefilter, top_k)
+
+    results: List[Dict[str, Any]] = []
+    for index, resume_text in enumerate(resume_texts):
+        document = prepare(resume_text)
+        result = prefilter_resume(document, jd_data) if prefilter else None
+        if result is None:
+            result = score_parsed(document, parse_resume(document, None), jd_data)
+        result["resume_index"] = index
+        results.append(result)
+
+    results.sort(key=_rank_key, reverse=True)
+    return results
+
+
+def _reachable_score(document: PreparedDocument, jd_data: Dict[str, Any]) -> float:
+    """Highest ``_rank_key`` the pair can reach, without parsing the resume.
+
+    Only the JD's own skills are looked up, with the prefilter gate's
+    word-bounded ``str.find`` checks, which find exactly what the parse
+    would. The keyword score is taken at 100, so this never undershoots.
+    """
+    _, missing = gate_for(jd_data.get("required_skills", [])).check(document.text)
+    if missing or not EligibilityEngine.experience_ok(
+        document.experience, jd_data.get("experience_required")
+    ):
+        return -1.0
+
+    preferred = {skill.lower() for skill in jd_data.get("preferred_skills", [])}
+    found, _ = gate_for(preferred).check(document.text)
+    _, _, final_skill_score = skill_scores(1, 1, len(preferred), len(found))
+
+    bound = final_score_upper_bound(
+        round(final_skill_score, 2),
+        experience_score(document.experience, jd_data.get("experience_required")),
+    )
+    return round(bound, 2)
+
+
+def _top_resumes_for_jd(
+    resume_texts: Iterable[str],
+    jd_data: Dict[str, Any],
+    prefilter: bool,
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    board = TopK(top_k)
+
+    for index, resume_text in enumerate(resume_texts):
+        document = prepare(resume_text)
+        if not board.beats(_reachable_score(document, jd_data), index):
+            continue
+
+        result = prefilter_resume(document, jd_data) if prefilter else None
+        if result is None:
+            result = score_parsed(document, parse_resume(document, None), jd_data)
+
+        result["resume_index"] = index
+        board.push(_rank_key(result), index, result)
+
+    return board.results()
+
+
+# =============================
+# Compact results (see results.py)
+# =============================
+def parse_jd_compact(jd_text: Document) -> ParsedJD:
+    return ParsedJD.from_dict(parse_jd(jd_text))
+
+
+def parse_resume_compact(resume_text: Document, candidate_experience: Optional[int] = None) -> ParsedResume:
+    return ParsedResume.from_dict(parse_resume(resume_text, candidate_experience))
+
+
+def score_compact(resume_text: Document, resume: ParsedResume, jd: ParsedJD) -> PairResult:
+    """``score_parsed`` on interned skill ids; ``.to_dict()`` gives the same dict."""
+    candidate = set(resume.skills)
+
+    missing = tuple(skill for skill in jd.required_skills if skill not in candidate)
+    if missing:
+        return PairResult(resume, jd, Eligibility(False, missing))
+    if not EligibilityEngine.experience_ok(resume.experience, jd.experience_required):
+        return PairResult(resume, jd, INSUFFICIENT_EXPERIENCE)
+
+    weighted_skill = skill_score(
+        skill_scores(
+            len(jd.required_skills),
+            len(jd.required_skills),
+            len(jd.preferred_skills),
+            sum(1 for skill in jd.preferred_skills if skill in candidate),
+        )
+    )
+    weighted_ats = ats_score(
+        WeightedATSEngine(
+            skill_match_percent=weighted_skill.final_skill_score,
+            candidate_experience=resume.experience,
+            required_experience=jd.experience_required,
+            resume_text=resume_text,
+            required_skills=skill_names(jd.required_skills),
+            preferred_skills=skill_names(jd.preferred_skills),
+            resume_terms=skill_names(resume.skills),
+        ).scores()
+    )
+    return PairResult(resume, jd, ELIGIBLE, weighted_skill, weighted_ats)
+
+
+def prefilter_compact(
+    resume_text: Document,
+    jd: ParsedJD,
+    candidate_experience: Optional[int] = None,
+) -> Optional[PairResult]:
+    """``prefilter_resume`` for compact results; rejected resumes have ``skills=None``."""
+    document = prepare(resume_text)
+    _, missing = gate_for(skill_names(jd.required_skills)).check(document.text)
+    if not missing:
+        return None
+
+    experience = document.experience if candidate_experience is None else candidate_experience
+    return PairResult(ParsedResume(None, experience), jd, Eligibility(False, intern_skills(missing)))
+
+
+def evaluate_resume_against_jds_compact(
+    resume_text: str,
+    jds: Sequence[ParsedJD],
+    candidate_experience: Optional[int] = None,
+    prefilter: bool = False,
+) -> List[Tuple[int, PairResult]]:
+    """``evaluate_resume_against_jds`` over pre-parsed JDs: ``(jd index, result)``, best first."""
+    document = prepare(resume_text)
+    resume: Optional[ParsedResume] = None
+
+    results: List[Tuple[int, PairResult]] = []
+    for index, jd in enumerate(jds):
+        result = prefilter_compact(document, jd, candidate_experience) if prefilter else None
+        if result is None:
+            if resume is None:
+                resume = parse_resume_compact(document, candidate_experience)
+            result = score_compact(document, resume, jd)
+        results.append((index, result))
+
+    results.sort(key=lambda entry: entry[1].rank_key, reverse=True)
+    return results
+
+
+def parse_cache_stats() -> Dict[str, Any]:
+    return _PARSE_CACHE.stats()
+
+
+def configure_parse_cache(
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> None:
+    _PARSE_CACHE.configure(max_entries=max_entries, max_bytes=max_bytes)
+
+
 def parse_skills_csv(skills_csv: str) -> List[str]:
     return [item.strip().lower() for item in skills_csv.split(",") if item.strip()]
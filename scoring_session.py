@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from jd_parser import all_variant_occurrences, classify_mentions, hint_spans
+from patterns import EXPERIENCE_RE, REQUIRED_HINT_RE, skill_matcher
+from prepared import normalize
+from scoring_service import score_parsed
+
+# text on either side of a blank line is parsed on its own; skill terms,
+# their spellings and hints never contain two whitespace characters in a
+# row, so no match can straddle the break
+PARAGRAPH_BREAK = "\n\n"
+
+# an experience mention can only straddle a break when one side ends in
+# "<digit>[+]" and the other starts with "years" (blank paragraphs between
+# them included)
+_TAIL_RE = re.compile(r"\d\+?\s*\Z")
+_HEAD_RE = re.compile(r"\s*years")
+
+
+class _Paragraph:
+    """Parse results for one paragraph, offsets relative to the paragraph.
+
+    Skill occurrences and required-hint spans are only collected for JD
+    paragraphs; nothing else classifies skills.
+    """
+
+    __slots__ = ("size", "lead", "trail", "mentions", "occurrences", "hints", "experience", "tail", "head")
+
+    def __init__(self, raw: str, jd: bool) -> None:
+        # normalize() without the strip: offsets must line up with the
+        # whole document's
+        text = raw.replace("\n", " ").lower()
+        body = text.strip()
+
+        self.size = len(text)
+        self.lead = len(text) - len(text.lstrip())
+        self.trail = len(text) - len(text.rstrip())
+        self.mentions: List[Tuple[int, str, str]] = [
+            (start, skill, text[start:end]) for start, end, skill in skill_matcher().find_all(text)
+        ]
+        self.occurrences: List[Tuple[int, str, str]] = []
+        self.hints: Tuple[List[int], List[int]] = ([], [])
+        if jd:
+            # every skill's spellings, inside words too; classify() keeps the
+            # skills the whole document mentions
+            self.occurrences = all_variant_occurrences(text)
+            self.hints = hint_spans(REQUIRED_HINT_RE, text)
+
+        match = EXPERIENCE_RE.search(text)
+        self.experience: Optional[int] = int(match.group(1)) if match else None
+        self.tail = not body or _TAIL_RE.search(text) is not None
+        self.head = not body or _HEAD_RE.match(text) is not None
+
+
+class _Document:
+    """A document split into paragraphs, each parsed once per distinct text."""
+
+    __slots__ = ("jd", "text", "paragraphs", "_by_text", "parsed", "reused")
+
+    def __init__(self, jd: bool = False) -> None:
+        self.jd = jd
+        self.text: Optional[str] = None
+        self.paragraphs: List[_Paragraph] = []
+        self._by_text: Dict[str, _Paragraph] = {}
+        self.parsed = 0
+        self.reused = 0
+
+    def update(self, text: str) -> bool:
+        """Take the current text; returns whether it changed."""
+        if text == self.text:
+            return False
+
+        by_text: Dict[str, _Paragraph] = {}
+        paragraphs: List[_Paragraph] = []
+        for raw in text.split(PARAGRAPH_BREAK):
+            paragraph = by_text.get(raw) or self._by_text.get(raw)
+            if paragraph is None:
+                paragraph = _Paragraph(raw, self.jd)
+                self.parsed += 1
+            else:
+                self.reused += 1
+            by_text[raw] = paragraph
+            paragraphs.append(paragraph)
+
+        # only paragraphs still in the document are kept
+        self._by_text = by_text
+        self.paragraphs = paragraphs
+        self.text = text
+        return True
+
+    def _offsets(self) -> Tuple[List[int], int]:
+        """Start of each paragraph in the normalized (stripped) text, and its length."""
+        starts: List[int] = []
+        position = 0
+        for paragraph in self.paragraphs:
+            starts.append(position)
+            position += paragraph.size + len(PARAGRAPH_BREAK)
+        size = position - len(PARAGRAPH_BREAK)
+
+        lead = 0
+        for start, paragraph in zip(starts, self.paragraphs):
+            if paragraph.lead < paragraph.size:
+                lead = start + paragraph.lead
+                break
+        else:
+            return [0] * len(starts), 0
+
+        trail = 0
+        for start, paragraph in zip(reversed(starts), reversed(self.paragraphs)):
+            if paragraph.trail < paragraph.size:
+                trail = size - (start + paragraph.size - paragraph.trail)
+                break
+
+        return [start - lead for start in starts], size - lead - trail
+
+    def skills(self) -> List[str]:
+        return sorted({skill for p in self.paragraphs for _, skill, _ in p.mentions})
+
+    def experience(self) -> Optional[int]:
+        paragraphs = self.paragraphs
+        if any(a.tail and b.head for a, b in zip(paragraphs, paragraphs[1:])):
+            # a mention may run across a break: search the whole text
+            match = EXPERIENCE_RE.search(normalize(self.text or ""))
+            return int(match.group(1)) if match else None
+
+        for paragraph in paragraphs:
+            if paragraph.experience is not None:
+                return paragraph.experience
+        return None
+
+    def classify(self) -> Dict[str, List[str]]:
+        starts, size = self._offsets()
+        found = set(self.skills())
+
+        mentions: List[Tuple[int, str, str]] = []
+        hint_starts: List[int] = []
+        hint_ends: List[int] = []
+        for base, paragraph in zip(starts, self.paragraphs):
+            mentions.extend(
+                (base + start, skill, spelling)
+                for start, skill, spelling in paragraph.occurrences
+                if skill in found
+            )
+            hint_starts.extend(base + start for start in paragraph.hints[0])
+            hint_ends.extend(base + end for end in paragraph.hints[1])
+
+        return classify_mentions(mentions, (hint_starts, hint_ends), size)
+
+
+class ScoringSession:
+    """Incremental ``evaluate_resume_against_jd`` for a resume/JD pair being edited.
+
+    Both documents are split on blank lines and every paragraph's skill
+    mentions, required-hint spans and experience mention are kept. A new
+    call re-parses only paragraphs whose text is new and rebuilds the parse
+    results from the kept pieces, so results equal the full pipeline's.
+    """
+
+    def __init__(self) -> None:
+        self._resume = _Document()
+        self._jd = _Document(jd=True)
+        self._resume_parse: Optional[Tuple[List[str], Optional[int]]] = None
+        self._jd_parse: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def parse(
+        self,
+        resume_text: str,
+        jd_text: str,
+        candidate_experience: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """``(parse_resume, parse_jd)`` results for the current texts."""
+        with self._lock:
+            if self._resume.update(resume_text) or self._resume_parse is None:
+                self._resume_parse = (self._resume.skills(), self._resume.experience())
+            if self._jd.update(jd_text) or self._jd_parse is None:
+                self._jd_parse = {
+                    "skills": self._jd.skills(),
+                    **self._jd.classify(),
+                    "experience_required": self._jd.experience(),
+                }
+            skills, experience = self._resume_parse
+            jd_parse = self._jd_parse
+
+        # fresh dicts per call: results are handed out and may be mutated
+        resume_data = {
+            "skills": list(skills),
+            "experience": experience if candidate_experience is None else candidate_experience,
+        }
+        jd_data = {key: list(value) if isinstance(value, list) else value for key, value in jd_parse.items()}
+        return resume_data, jd_data
+
+    def score(
+        self,
+        resume_text: str,
+        jd_text: str,
+        candidate_experience: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        resume_data, jd_data = self.parse(resume_text, jd_text, candidate_experience)
+        return score_parsed(resume_text, resume_data, jd_data)
+
+    def stats(self) -> Dict[str, int]:
+        """Paragraphs parsed and reused so far, per document."""
+        return {
+            "resume_parsed": self._resume.parsed,
+            "resume_reused": self._resume.reused,
+            "jd_parsed": self._jd.parsed,
+            "jd_reused": self._jd.reused,
+        }
@@ -0,0 +1,176 @@
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Union
+
+
+def _is_word_char(ch: str) -> bool:
+    # mirrors what `\w` accepts in a unicode `re` pattern
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over skill terms and their aliases.
+
+    Built once from a ``{term: canonical}`` map, then every call to
+    ``find_all`` walks the text a single time regardless of how many terms
+    the taxonomy holds. A hit is only reported where ``\\b<term>\\b`` would
+    have matched, so results line up with the old per-term regex search.
+    Terms are matched case-insensitively; callers pass lowercased text.
+    ``terms`` may also be ``(term, canonical)`` pairs, to give one term
+    several canonicals.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out", "_terms")
+
+    def __init__(self, terms: Union[Dict[str, str], Iterable[Tuple[str, str]]]) -> None:
+        # node 0 is the root; each node keeps its own transition dict
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        # term index -> (term length, canonical, starts on word char, ends on word char)
+        self._terms: List[Tuple[int, str, bool, bool]] = []
+
+        for term, canonical in terms.items() if isinstance(terms, dict) else terms:
+            self._add(term.lower(), canonical)
+
+        self._build_links()
+
+    # =============================
+    # Construction
+    # =============================
+    def _add(self, term: str, canonical: str) -> None:
+        if not term:
+            return
+
+        node = 0
+        for ch in term:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+
+        self._out[node] = self._out[node] + (len(self._terms),)
+        self._terms.append(
+            (len(term), canonical, _is_word_char(term[0]), _is_word_char(term[-1]))
+        )
+
+    def _build_links(self) -> None:
+        queue: List[int] = list(self._goto[0].values())
+        head = 0
+
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+
+                # inherit matches that end here through the suffix link
+                if self._out[self._fail[child]]:
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    # =============================
+    # Matching
+    # =============================
+    def find_all(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield ``(start, end, canonical)`` for every word-bounded hit."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        terms = self._terms
+        size = len(text)
+
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            if not out[node]:
+                continue
+
+            end = i + 1
+            for index in out[node]:
+                length, canonical, starts_word, ends_word = terms[index]
+                start = end - length
+
+                before = _is_word_char(text[start - 1]) if start > 0 else False
+                after = _is_word_char(text[end]) if end < size else False
+
+                if before != starts_word and after != ends_word:
+                    yield start, end, canonical
+
+    def find_occurrences(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield ``(start, end, canonical)`` for every hit, inside other words too."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        terms = self._terms
+
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            for index in out[node]:
+                length, canonical, _, _ = terms[index]
+                yield i + 1 - length, i + 1, canonical
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of canonical skills present in ``text``."""
+        return {canonical for _, _, canonical in self.find_all(text)}
+
+
+def contains_term(text: str, term: str) -> bool:
+    """True where ``\\b<term>\\b`` would match ``text``, via ``str.find``.
+
+    Same boundary rule as ``SkillMatcher.find_all``; cheaper when only a
+    handful of terms need checking.
+    """
+    if not term:
+        return False
+
+    starts_word = _is_word_char(term[0])
+    ends_word = _is_word_char(term[-1])
+    size = len(text)
+
+    start = text.find(term)
+    while start != -1:
+        end = start + len(term)
+        before = _is_word_char(text[start - 1]) if start > 0 else False
+        after = _is_word_char(text[end]) if end < size else False
+        if before != starts_word and after != ends_word:
+            return True
+        start = text.find(term, start + 1)
+
+    return False
+
+
+def build_terms(skills: List[str], aliases: Dict[str, List[str]]) -> Dict[str, str]:
+    """``{term: canonical}`` for skills and aliases; a skill name beats an alias."""
+    terms: Dict[str, str] = {}
+
+    for skill in skills:
+        terms[skill.lower()] = skill
+
+    for canonical, names in aliases.items():
+        for alias in names:
+            terms.setdefault(alias.lower(), canonical)
+
+    return terms
+
+
+def build_matcher(skills: List[str], aliases: Dict[str, List[str]]) -> SkillMatcher:
+    """Compile canonical skills plus their aliases into one matcher."""
+    return SkillMatcher(build_terms(skills, aliases))
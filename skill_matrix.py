@@ -0,0 +1,140 @@
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+
+from ats_engine import SKILL_NORMALIZATION
+from ats_weighted_skill import WeightedSkillMatcher
+
+# rows are unpacked this many at a time before the matmul, which bounds the
+# temporary float32 block to roughly CHUNK_ROWS * vocabulary * 4 bytes
+CHUNK_ROWS = 8192
+
+
+class _Vocabulary:
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+
+    def add(self, skills: Iterable[str]) -> List[int]:
+        ids = []
+        for skill in skills:
+            ids.append(self.index.setdefault(skill, len(self.index)))
+        return ids
+
+
+def _pack(rows: List[List[int]], width: int) -> np.ndarray:
+    """Set bits straight into the packed layout ``np.unpackbits`` expects."""
+    packed = np.zeros((len(rows), (width + 7) // 8), dtype=np.uint8)
+
+    row_ids = np.repeat(np.arange(len(rows)), [len(ids) for ids in rows])
+    bit_ids = np.fromiter((i for ids in rows for i in ids), dtype=np.int64, count=len(row_ids))
+    masks = (0x80 >> (bit_ids & 7)).astype(np.uint8)
+    np.bitwise_or.at(packed, (row_ids, bit_ids >> 3), masks)
+
+    return packed
+
+
+def _overlap_counts(candidates: np.ndarray, jds: np.ndarray, width: int) -> np.ndarray:
+    """popcount(candidate & jd) for every pair, as one matmul per row chunk."""
+    jd_bits = np.unpackbits(jds, axis=1, count=width).astype(np.float32).T
+    counts = np.empty((candidates.shape[0], jds.shape[0]), dtype=np.int32)
+
+    for start in range(0, candidates.shape[0], CHUNK_ROWS):
+        block = np.unpackbits(candidates[start:start + CHUNK_ROWS], axis=1, count=width)
+        counts[start:start + CHUNK_ROWS] = block.astype(np.float32) @ jd_bits
+
+    return counts
+
+
+def _percent(counts: np.ndarray, totals: np.ndarray, empty: float) -> np.ndarray:
+    # same operation order as the per-pair engines: (matched / total) * 100
+    safe_totals = np.maximum(totals, 1).astype(np.float64)
+    scores = (counts / safe_totals) * 100
+    return np.where(totals == 0, empty, scores)
+
+
+def _percent_one(matched: int, total: int, empty: float) -> float:
+    if total == 0:
+        return empty
+    return (int(matched) / int(total)) * 100
+
+
+class SkillMatrix:
+    """Skill scores for a whole candidates x JDs grid at once.
+
+    Candidate skill lists and JD skill groups are encoded as packed bit
+    vectors over a shared vocabulary; matched counts for every pair come
+    from a single popcount-by-matmul. The score arrays are unrounded and
+    equal, pair for pair, to what ``WeightedSkillMatcher`` and
+    ``ATSEngine.compute_skill_match`` compute before rounding.
+    """
+
+    def __init__(
+        self,
+        candidate_skills: Sequence[Iterable[str]],
+        jd_data: Sequence[Mapping[str, Any]],
+    ) -> None:
+        vocab = _Vocabulary()
+
+        # WeightedSkillMatcher only lowercases; ATSEngine also strips and
+        # folds aliases, so candidates get one encoding per convention
+        weighted_rows = [vocab.add({s.lower() for s in skills}) for skills in candidate_skills]
+        ats_rows = [
+            vocab.add(
+                {
+                    SKILL_NORMALIZATION.get(s.lower().strip(), s.lower().strip())
+                    for s in skills
+                }
+            )
+            for skills in candidate_skills
+        ]
+        required_rows = [vocab.add({s.lower() for s in jd["required_skills"]}) for jd in jd_data]
+        preferred_rows = [vocab.add({s.lower() for s in jd["preferred_skills"]}) for jd in jd_data]
+        jd_rows = [vocab.add({s.lower().strip() for s in jd["skills"]}) for jd in jd_data]
+
+        width = max(len(vocab.index), 1)
+        self.vocabulary: Dict[str, int] = vocab.index
+
+        weighted_bits = _pack(weighted_rows, width)
+        ats_bits = _pack(ats_rows, width)
+
+        self.required_total = np.array([len(r) for r in required_rows], dtype=np.int32)
+        self.preferred_total = np.array([len(r) for r in preferred_rows], dtype=np.int32)
+        self.jd_total = np.array([len(r) for r in jd_rows], dtype=np.int32)
+
+        self.required_matched = _overlap_counts(weighted_bits, _pack(required_rows, width), width)
+        self.preferred_matched = _overlap_counts(weighted_bits, _pack(preferred_rows, width), width)
+        self.jd_matched = _overlap_counts(ats_bits, _pack(jd_rows, width), width)
+
+    # =============================
+    # Grid scores (candidates x JDs)
+    # =============================
+    def required_score(self) -> np.ndarray:
+        return _percent(self.required_matched, self.required_total, 100.0)
+
+    def preferred_score(self) -> np.ndarray:
+        return _percent(self.preferred_matched, self.preferred_total, 100.0)
+
+    def final_skill_score(self) -> np.ndarray:
+        return (0.7 * self.required_score()) + (0.3 * self.preferred_score())
+
+    def skill_match_percent(self) -> np.ndarray:
+        return _percent(self.jd_matched, self.jd_total, 0.0)
+
+    # =============================
+    # Per-pair views (dict shape of the per-pair engines)
+    # =============================
+    def weighted_skill(self, candidate: int, jd: int) -> Dict[str, Any]:
+        req_score = _percent_one(
+            self.required_matched[candidate, jd], self.required_total[jd], 100.0
+        )
+        pref_score = _percent_one(
+            self.preferred_matched[candidate, jd], self.preferred_total[jd], 100.0
+        )
+        final_skill_score = (0.7 * req_score) + (0.3 * pref_score)
+
+        return {
+            "required_score": round(req_score, 2),
+            "preferred_score": round(pref_score, 2),
+            "final_skill_score": round(final_skill_score, 2),
+            "strength": WeightedSkillMatcher.label(final_skill_score),
+        }
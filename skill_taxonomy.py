@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from atomic_file import write_atomic
+from skill_matcher import SkillMatcher, build_matcher
+
+TAXONOMY_PATH = Path(__file__).resolve().parent / "data" / "skill_taxonomy.json"
+
+# bump whenever SkillTaxonomy / SkillMatcher change shape so stale pickles are ignored
+COMPILER_VERSION = 1
+
+
+def _default_cache_dir() -> Path:
+    configured = os.environ.get("RESUMELYTICS_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "resumelytics"
+
+
+class SkillTaxonomy:
+    """Canonical skills, their aliases and the compiled matcher built from them."""
+
+    __slots__ = ("skills", "aliases", "normalization", "matcher", "version")
+
+    def __init__(self, aliases: Dict[str, List[str]], version: str) -> None:
+        self.skills: Tuple[str, ...] = tuple(sorted(aliases))
+        self.aliases: Dict[str, Tuple[str, ...]] = {
+            skill: tuple(names) for skill, names in sorted(aliases.items()) if names
+        }
+        # alias -> canonical, the shape the ATS engines normalize with
+        self.normalization: Dict[str, str] = {
+            alias: skill for skill, names in self.aliases.items() for alias in names
+        }
+        self.matcher: SkillMatcher = build_matcher(list(self.skills), self.aliases)
+        self.version: str = version
+
+
+def _read_aliases(raw: bytes) -> Dict[str, List[str]]:
+    data = json.loads(raw.decode("utf-8"))
+
+    aliases: Dict[str, List[str]] = {}
+    for skill, names in data.get("skills", {}).items():
+        canonical = skill.lower().strip()
+        if canonical:
+            aliases[canonical] = [n.lower().strip() for n in names if n.strip()]
+
+    return aliases
+
+
+def load_taxonomy(
+    path: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+) -> SkillTaxonomy:
+    """Load the taxonomy data file, reusing a compiled pickle when one exists.
+
+    The pickle is keyed by a hash of the data file plus ``COMPILER_VERSION``,
+    so editing the JSON simply produces a new cache entry. Cache read/write
+    failures fall back to compiling in memory.
+    """
+    raw = Path(path or TAXONOMY_PATH).read_bytes()
+    digest = hashlib.sha256(raw)
+    digest.update(str(COMPILER_VERSION).encode("ascii"))
+    version = digest.hexdigest()[:16]
+
+    cache_file = Path(cache_dir or _default_cache_dir()) / f"taxonomy-{version}.pickle"
+
+    try:
+        with cache_file.open("rb") as handle:
+            cached = pickle.load(handle)
+        if isinstance(cached, SkillTaxonomy) and cached.version == version:
+            return cached
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    taxonomy = SkillTaxonomy(_read_aliases(raw), version)
+
+    try:
+        write_atomic(cache_file, pickle.dumps(taxonomy, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+    return taxonomy
+
+
+@lru_cache(maxsize=None)
+def get_taxonomy() -> SkillTaxonomy:
+    """Process-wide taxonomy; forked workers inherit the loaded instance."""
+    return load_taxonomy()
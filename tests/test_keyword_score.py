@@ -0,0 +1,70 @@
+"""Keyword score: aliases count, skills buried inside other words don't."""
+import random
+
+import pytest
+
+from resume_parser import ResumeParser
+from skill_taxonomy import get_taxonomy
+from weighted_ats import WeightedATSEngine
+
+# (resume text, required skills, preferred skills, intended keyword score)
+CASES = [
+    ("Python and Docker in production.", ["python"], ["docker"], 100.0),
+    ("Python only.", ["python"], ["docker"], 66.67),
+    ("Docker only.", ["python"], ["docker"], 33.33),
+    ("Shipped services on K8s with TF modules.", ["kubernetes"], ["terraform"], 100.0),
+    ("Frontend in JS, infra on AWS.", ["javascript"], ["amazon web services"], 100.0),
+    ("Built CI with GH Actions.", [], ["github actions"], 100.0),
+    ("Owned the data platform and its roadmap.", ["terraform"], [], 0.0),
+    ("Parsed JSON payloads.", ["javascript"], [], 0.0),
+    ("Reviewed contracts under employment laws.", ["amazon web services"], [], 0.0),
+    ("Tuned MySQL and PostgreSQL.", ["sql"], [], 0.0),
+    ("Wrote SQL against MySQL.", ["sql"], [], 100.0),
+    ("Wore a helmet on site.", [], ["helm"], 0.0),
+    ("Deployed with Helm.", [], ["helm"], 100.0),
+    ("Pythonic code, python3 scripts.", ["python"], [], 0.0),
+    ("Used python\nand docker", ["python", "docker"], [], 100.0),
+    ("Go language services.", ["golang"], [], 100.0),
+    # skills outside the taxonomy fall back to a word-bounded text search
+    ("Systems work in Rust.", ["rust"], [], 100.0),
+    ("Trusted by the team.", ["rust"], [], 0.0),
+    # required skills given as aliases
+    ("Infra on AWS.", ["aws"], [], 100.0),
+    ("Anything at all.", [], [], 0.0),
+    ("", ["python"], [], 0.0),
+]
+
+
+def _keyword_score(resume_text, required, preferred, **extra) -> float:
+    engine = WeightedATSEngine(100.0, None, None, resume_text, required, preferred, **extra)
+    return round(engine.scores()[3], 2)
+
+
+@pytest.mark.parametrize("resume_text, required, preferred, intended", CASES)
+def test_intended_score(resume_text, required, preferred, intended):
+    assert _keyword_score(resume_text, required, preferred) == intended
+
+
+@pytest.mark.parametrize("resume_text, required, preferred, intended", CASES)
+def test_parsed_skills_give_the_same_score(resume_text, required, preferred, intended):
+    skills = ResumeParser(resume_text).parse()["skills"]
+    assert _keyword_score(resume_text, required, preferred, resume_terms=skills) == intended
+
+
+def test_text_lookup_matches_parsed_skills():
+    # the engine's own text lookup must agree with the parsed term set
+    rng = random.Random(3)
+    taxonomy = get_taxonomy()
+    terms = list(taxonomy.skills) + list(taxonomy.normalization)
+    filler = ["platform", "laws", "json", "mysql", "helmet", "and", "with", "team", "python3"]
+    for _ in range(300):
+        words = rng.sample(terms, 6) + rng.sample(filler, 4)
+        rng.shuffle(words)
+        text = " ".join(word.upper() if rng.random() < 0.2 else word for word in words)
+        required = rng.sample(terms, 3)
+        preferred = rng.sample(terms, 3)
+
+        skills = ResumeParser(text).parse()["skills"]
+        assert _keyword_score(text, required, preferred) == _keyword_score(
+            text, required, preferred, resume_terms=skills
+        ), text
@@ -0,0 +1,83 @@
+"""``SkillMatrix`` must score every pair exactly as the set-based engines do."""
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import skill_matrix
+from ats_engine import ATSEngine, SKILL_NORMALIZATION
+from ats_weighted_skill import WeightedSkillMatcher, skill_scores
+from skill_matrix import SkillMatrix
+from skill_taxonomy import get_taxonomy
+
+
+def _random_grid(seed: int, candidates: int, jds: int):
+    rng = random.Random(seed)
+    skills = list(get_taxonomy().skills)
+    # aliases and case/whitespace variants exercise both encodings
+    vocabulary = skills + list(SKILL_NORMALIZATION) + [" Python ", "JAVA", "react"]
+
+    candidate_skills = [rng.sample(vocabulary, rng.randint(0, 10)) for _ in range(candidates)]
+    jd_data: List[Dict[str, Any]] = []
+    for _ in range(jds):
+        picked = rng.sample(skills, rng.randint(0, 8))
+        split = rng.randint(0, len(picked))
+        jd_data.append(
+            {
+                "skills": sorted(picked),
+                "required_skills": sorted(picked[:split]),
+                "preferred_skills": sorted(picked[split:]),
+            }
+        )
+    return candidate_skills, jd_data
+
+
+def _assert_parity(candidate_skills, jd_data) -> None:
+    matrix = SkillMatrix(candidate_skills, jd_data)
+    required = matrix.required_score()
+    preferred = matrix.preferred_score()
+    final = matrix.final_skill_score()
+    match_percent = matrix.skill_match_percent()
+
+    for c, skills in enumerate(candidate_skills):
+        for j, jd in enumerate(jd_data):
+            weighted = WeightedSkillMatcher(jd["required_skills"], jd["preferred_skills"], skills)
+            assert matrix.weighted_skill(c, j) == weighted.compute(), (c, j)
+
+            expected = skill_scores(
+                len(weighted.required),
+                len(weighted.required & weighted.candidate),
+                len(weighted.preferred),
+                len(weighted.preferred & weighted.candidate),
+            )
+            assert (required[c, j], preferred[c, j], final[c, j]) == expected, (c, j)
+
+            ats = ATSEngine(jd["skills"], skills).compute_skill_match()
+            assert round(float(match_percent[c, j]), 2) == ats["skill_match_percent"], (c, j)
+
+
+def test_random_grid_matches_set_scorers():
+    _assert_parity(*_random_grid(seed=11, candidates=300, jds=20))
+
+
+def test_parity_across_row_chunks(monkeypatch):
+    # several unpack/matmul chunks, the last one partial
+    monkeypatch.setattr(skill_matrix, "CHUNK_ROWS", 7)
+    _assert_parity(*_random_grid(seed=5, candidates=50, jds=6))
+
+
+def test_edge_cases():
+    candidate_skills = [[], ["Python", "python", " PYTHON "], ["sql", "docker"]]
+    jd_data = [
+        {"skills": [], "required_skills": [], "preferred_skills": []},
+        {"skills": ["python"], "required_skills": ["Python"], "preferred_skills": []},
+        {"skills": ["sql", "go"], "required_skills": [], "preferred_skills": ["SQL", "go"]},
+    ]
+    _assert_parity(candidate_skills, jd_data)
+
+
+def test_empty_candidate_list():
+    matrix = SkillMatrix([], [{"skills": ["sql"], "required_skills": ["sql"], "preferred_skills": []}])
+    assert matrix.final_skill_score().shape == (0, 1)
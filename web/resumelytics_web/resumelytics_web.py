@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
 import reflex as rx
 
@@ -12,7 +18,88 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
-from scoring_service import evaluate_resume_against_jd
+from eligibility_engine import EligibilityEngine
+from format_readers import SNIFF_BYTES, candidate_readers
+from resume_reader import MAX_UPLOAD_BYTES, UPLOAD_EXTENSIONS, ResumeReader, upload_cache
+from scoring_service import score_parsed
+from scoring_session import ScoringSession
+
+# one incremental session per browser tab, so an edit re-parses only the
+# paragraphs that changed. Sessions aren't serializable state; they live here,
+# least recently used dropped first.
+MAX_SESSIONS = 256
+_SESSIONS: "OrderedDict[str, ScoringSession]" = OrderedDict()
+_SESSIONS_LOCK = threading.Lock()
+
+# scoring runs here, off the event loop, shared by every tab. Threads rather
+# than processes: the sessions above live in this process.
+POOL_SIZE = max(1, int(os.environ.get("RESUMELYTICS_WEB_WORKERS", str(os.cpu_count() or 1))))
+_POOL = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="resumelytics-score")
+_in_flight = 0
+_IN_FLIGHT_LOCK = threading.Lock()
+
+# text inputs report a change once typing pauses this long, so "Score as you
+# type" queues one run per pause rather than one per keystroke
+INPUT_DEBOUNCE_MS = int(os.environ.get("RESUMELYTICS_WEB_DEBOUNCE_MS", "400"))
+
+# text extracted from dropped files, keyed by content hash, so the same file
+# dropped again (in any tab, or after a restart) skips extraction
+UPLOAD_CACHE_PATH = os.environ.get("RESUMELYTICS_EXTRACTION_CACHE") or str(
+    Path(os.environ.get("RESUMELYTICS_CACHE_DIR") or Path.home() / ".cache" / "resumelytics") / "uploads.db"
+)
+
+
+def _session_for(token: str) -> ScoringSession:
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(token)
+        if session is None:
+            session = _SESSIONS[token] = ScoringSession()
+            while len(_SESSIONS) > MAX_SESSIONS:
+                _SESSIONS.popitem(last=False)
+        else:
+            _SESSIONS.move_to_end(token)
+        return session
+
+
+def queue_depth() -> int:
+    """Scoring jobs queued or running in the pool, across all tabs."""
+    return _in_flight
+
+
+def _finished(_: Any) -> None:
+    global _in_flight
+    with _IN_FLIGHT_LOCK:
+        _in_flight -= 1
+
+
+async def _run_in_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    global _in_flight
+    with _IN_FLIGHT_LOCK:
+        _in_flight += 1
+    future = _POOL.submit(fn, *args)
+    future.add_done_callback(_finished)
+    return await asyncio.wrap_future(future)
+
+
+def _eligibility_stage(
+    token: str,
+    resume_text: str,
+    jd_text: str,
+    candidate_experience: Optional[int],
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    resume_data, jd_data = _session_for(token).parse(resume_text, jd_text, candidate_experience)
+    candidate_profile = {"experience": resume_data.get("experience"), "skills": resume_data["skills"]}
+    return resume_data, jd_data, EligibilityEngine(jd_data, candidate_profile).evaluate()
+
+
+def _extract_upload(upload: BinaryIO, filename: str) -> str:
+    reader = ResumeReader.from_upload(
+        upload, filename, cache=upload_cache(UPLOAD_CACHE_PATH), max_bytes=MAX_UPLOAD_BYTES
+    )
+    # the rule /score/upload applies: a reader claims the name or the first bytes
+    if not candidate_readers(filename, reader.data[:SNIFF_BYTES]):
+        raise ValueError(f"Unsupported file format. Use one of: {', '.join(UPLOAD_EXTENSIONS)}")
+    return reader.extract_text() or ""
 
 
 class AppState(rx.State):
@@ -26,63 +113,144 @@ class AppState(rx.State):
     strength_text: str = "No signal"
     skill_preview: List[str] = []
     required_preview: List[str] = []
+    live_scoring: bool = False
+    # bumped per run; a run whose number is stale drops its results
+    score_run: int = 0
+    # a snapshot taken while this tab's last run was scoring, not a live count
+    queue_depth: int = 0
+    pool_size: int = POOL_SIZE
 
-    def set_resume_text(self, value: str) -> None:
+    def set_resume_text(self, value: str):
         self.resume_text = value
+        if self.live_scoring:
+            return AppState.score
 
-    def set_jd_text(self, value: str) -> None:
+    def set_jd_text(self, value: str):
         self.jd_text = value
+        if self.live_scoring:
+            return AppState.score
 
-    def set_experience_text(self, value: str) -> None:
-        self.experience_text = value
-
-    def score(self) -> None:
-        self.error_text = ""
-        self.eligibility_text = "Analyzing..."
-        self.score_text = "--"
-        self.strength_text = "No signal"
+    def set_live_scoring(self, value: bool):
+        self.live_scoring = value
+        if value:
+            return AppState.score
 
-        if not self.resume_text.strip() or not self.jd_text.strip():
-            self.error_text = "Resume and JD text are required."
-            self.eligibility_text = "Missing required text"
-            return
-
-        candidate_experience = None
-        if self.experience_text.strip():
-            try:
-                candidate_experience = int(self.experience_text.strip())
-            except ValueError:
-                self.error_text = "Experience must be a whole number."
-                self.eligibility_text = "Invalid experience value"
-                return
-
-        result: Dict[str, Any] = evaluate_resume_against_jd(
-            resume_text=self.resume_text,
-            jd_text=self.jd_text,
-            candidate_experience=candidate_experience,
-        )
-        self.result_json = json.dumps(result, indent=2)
+    def set_experience_text(self, value: str):
+        self.experience_text = value
+        if self.live_scoring:
+            return AppState.score
 
-        eligibility = result.get("eligibility", {})
+    def _show_eligibility(
+        self,
+        resume_data: Dict[str, Any],
+        jd_data: Dict[str, Any],
+        eligibility: Dict[str, Any],
+    ) -> None:
         eligible = bool(eligibility.get("eligible"))
         reason = str(eligibility.get("reason", ""))
         self.eligibility_text = (
             f"Eligible: {reason}" if eligible else f"Blocked: {reason}"
         )
 
-        candidate_data = result.get("candidate_data", {})
-        jd_data = result.get("jd_data", {})
-        self.skill_preview = candidate_data.get("skills", [])[:6]
+        self.skill_preview = resume_data.get("skills", [])[:6]
         self.required_preview = jd_data.get("required_skills", [])[:6]
 
+        if eligible:
+            self.score_text = "..."
+        else:
+            self.score_text = "0"
+            self.strength_text = "Ineligible"
+
+    def _show_scores(self, result: Dict[str, Any]) -> None:
+        self.result_json = json.dumps(result, indent=2)
+
         weighted_ats = result.get("weighted_ats")
         if weighted_ats:
             self.score_text = str(weighted_ats.get("final_ats_score", "--"))
             self.strength_text = str(weighted_ats.get("strength", "No signal"))
-        elif not eligible:
-            self.score_text = "0"
-            self.strength_text = "Ineligible"
 
+    def _show_failure(self, exc: Exception) -> None:
+        self.error_text = f"Scoring failed: {type(exc).__name__}: {exc}"
+        self.eligibility_text = "Scoring failed"
+        self.score_text = "--"
+        self.strength_text = "No signal"
+        self.queue_depth = queue_depth()
+
+    async def handle_upload(self, files: List[rx.UploadFile]):
+        """Extract a dropped resume file into the resume box, in the shared pool."""
+        if not files:
+            return
+        upload = files[0]
+        filename = upload.name or ""
+
+        try:
+            text = await _run_in_pool(_extract_upload, upload.file, filename)
+        except Exception as exc:  # noqa: BLE001 - shown to the user instead
+            self.error_text = f"Could not read {filename}: {exc}"
+            return
+
+        self.error_text = ""
+        self.resume_text = text.strip()
+        if self.live_scoring:
+            return AppState.score
+
+    @rx.event(background=True)
+    async def score(self):
+        """Score in the shared pool, pushing eligibility first, then the weighted scores."""
+        async with self:
+            self.score_run += 1
+            run = self.score_run
+
+            self.error_text = ""
+            self.eligibility_text = "Analyzing..."
+            self.score_text = "--"
+            self.strength_text = "No signal"
+
+            if not self.resume_text.strip() or not self.jd_text.strip():
+                self.error_text = "Resume and JD text are required."
+                self.eligibility_text = "Missing required text"
+                return
+
+            candidate_experience = None
+            if self.experience_text.strip():
+                try:
+                    candidate_experience = int(self.experience_text.strip())
+                except ValueError:
+                    self.error_text = "Experience must be a whole number."
+                    self.eligibility_text = "Invalid experience value"
+                    return
+
+            token = self.router.session.client_token
+            resume_text = self.resume_text
+            jd_text = self.jd_text
+            # counting this run, which is about to be queued
+            self.queue_depth = queue_depth() + 1
+
+        try:
+            resume_data, jd_data, eligibility = await _run_in_pool(
+                _eligibility_stage, token, resume_text, jd_text, candidate_experience
+            )
+            async with self:
+                if self.score_run != run:
+                    return
+                self._show_eligibility(resume_data, jd_data, eligibility)
+                self.queue_depth = queue_depth()
+
+            # reuse the verdict shown above; an ineligible pair returns at once,
+            # so only the weighted scores go back to the pool
+            scoring = partial(score_parsed, resume_text, resume_data, jd_data, eligibility=eligibility)
+            result = await _run_in_pool(scoring) if eligibility["eligible"] else scoring()
+        except Exception as exc:  # noqa: BLE001 - shown to the user instead
+            async with self:
+                if self.score_run == run:
+                    self._show_failure(exc)
+            return
+
+        async with self:
+            if self.score_run != run:
+                return
+            self._show_scores(result)
+            self.queue_depth = queue_depth()
 
 def _nav() -> rx.Component:
     return rx.box(
@@ -224,10 +392,27 @@ def _form_panel() -> rx.Component:
             rx.grid(
                 rx.vstack(
                     rx.text("Resume Content", class_name="field-label"),
+                    rx.upload(
+                        rx.text("Drop a PDF, DOCX, ODT, RTF, HTML or TXT resume here, or click to choose one"),
+                        id="resume_upload",
+                        accept={
+                            "application/pdf": [".pdf"],
+                            "application/vnd.openxmlformats-officedocument.wordprocessingml.document": [".docx"],
+                            "application/vnd.oasis.opendocument.text": [".odt"],
+                            "application/rtf": [".rtf"],
+                            "text/html": [".html", ".htm", ".xhtml"],
+                            "text/plain": [".txt", ".text"],
+                        },
+                        max_files=1,
+                        max_size=MAX_UPLOAD_BYTES,
+                        on_drop=AppState.handle_upload(rx.upload_files(upload_id="resume_upload")),
+                        class_name="input-inline code-font",
+                    ),
                     rx.text_area(
                         placeholder="Paste your complete resume text...",
                         value=AppState.resume_text,
                         on_change=AppState.set_resume_text,
+                        debounce_timeout=INPUT_DEBOUNCE_MS,
                         class_name="input-surface code-font",
                     ),
                     rx.text("Job Description", class_name="field-label"),
@@ -235,6 +420,7 @@ def _form_panel() -> rx.Component:
                         placeholder="Paste target JD text...",
                         value=AppState.jd_text,
                         on_change=AppState.set_jd_text,
+                        debounce_timeout=INPUT_DEBOUNCE_MS,
                         class_name="input-surface code-font",
                     ),
                     rx.text("Experience (Optional, years)", class_name="field-label"),
@@ -242,6 +428,7 @@ def _form_panel() -> rx.Component:
                         placeholder="e.g. 3",
                         value=AppState.experience_text,
                         on_change=AppState.set_experience_text,
+                        debounce_timeout=INPUT_DEBOUNCE_MS,
                         class_name="input-inline code-font",
                     ),
                     rx.button(
@@ -249,6 +436,19 @@ def _form_panel() -> rx.Component:
                         on_click=AppState.score,
                         class_name="primary-btn pulse-on-hover",
                     ),
+                    rx.checkbox(
+                        "Score as you type",
+                        checked=AppState.live_scoring,
+                        on_change=AppState.set_live_scoring,
+                        class_name="field-label",
+                    ),
+                    rx.text(
+                        AppState.queue_depth,
+                        " scoring jobs in flight on ",
+                        AppState.pool_size,
+                        " workers, as of this tab's last run",
+                        class_name="result-placeholder",
+                    ),
                     rx.cond(
                         AppState.error_text != "",
                         rx.text(AppState.error_text, class_name="error-text"),
@@ -1,13 +1,55 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+from patterns import TOKEN_RE
+from prepared import Document, PreparedDocument, prepare
+from skill_matcher import build_terms, contains_term
+from skill_taxonomy import get_taxonomy
+
+SKILL_NORMALIZATION: Dict[str, str] = get_taxonomy().normalization
+TAXONOMY_SKILLS = frozenset(get_taxonomy().skills)
+
+
+def _terms_by_skill() -> Dict[str, Tuple[str, ...]]:
+    taxonomy = get_taxonomy()
+    by_skill: Dict[str, List[str]] = {}
+    for term, canonical in build_terms(list(taxonomy.skills), taxonomy.aliases).items():
+        by_skill.setdefault(canonical, []).append(term)
+    return {skill: tuple(terms) for skill, terms in by_skill.items()}
+
+
+# canonical skill -> every term the skill matcher maps to it
+SKILL_TERMS: Dict[str, Tuple[str, ...]] = _terms_by_skill()
+
+
+def keyword_terms(resume_text: Document) -> Set[str]:
+    """Canonical skills the keyword score finds in ``resume_text``.
+
+    The same word-bounded, alias-aware scan ``ResumeParser.extract_skills``
+    runs, so a parsed resume's ``skills`` is this set and can be passed to
+    ``WeightedATSEngine`` as ``resume_terms``.
+    """
+    return set(prepare(resume_text).skills)
+
+
+def experience_score(candidate_experience: int | None, required_experience: int | None) -> float:
+    if required_experience is None:
+        return 100.0
+
+    if candidate_experience is None:
+        return 50.0
+
+    if candidate_experience >= required_experience:
+        return 100.0
+
+    gap = required_experience - candidate_experience
+    penalty = min(gap * 20, 100)
+    return max(0.0, 100 - penalty)
+
+
+def final_score_upper_bound(skill_match_percent: float, exp_score: float) -> float:
+    """Best ``final_ats_score`` reachable before the keyword score is known."""
+    return 0.40 * skill_match_percent + 0.25 * exp_score + 0.20 * 100 + 0.15 * 100
 
-SKILL_NORMALIZATION = {
-    "aws": "amazon web services",
-    "k8s": "kubernetes",
-    "github action": "github actions",
-    "gh actions": "github actions",
-    "js": "javascript",
-    "tf": "terraform",
-}
 
 class WeightedATSEngine:
     def __init__(
@@ -15,17 +57,21 @@ class WeightedATSEngine:
         skill_match_percent: float,
         candidate_experience: int | None,
         required_experience: int | None,
-        resume_text: str,
+        resume_text: Document,
         required_skills: List[str],
         preferred_skills: List[str],
+        resume_terms: Optional[Iterable[str]] = None,
     ) -> None:
         self.skill_match_percent = skill_match_percent
         self.candidate_experience = candidate_experience
         self.required_experience = required_experience
-        self.resume_text = resume_text.lower()
-        # normalize resume aliases
-        for alias, canonical in SKILL_NORMALIZATION.items():
-            self.resume_text = self.resume_text.replace(alias, canonical)
+        self.resume_text = resume_text
+        # canonical skills in the resume (the parsed skills). Without them each
+        # JD skill's terms are looked up in the text, which beats scanning the
+        # text for the whole taxonomy when only a few skills are asked about
+        self.resume_terms: Optional[Set[str]] = (
+            set(resume_terms) if resume_terms is not None else None
+        )
 
         # normalize skill groups
         self.required_skills = [s.lower() for s in required_skills]
@@ -35,22 +81,40 @@ class WeightedATSEngine:
     # Experience Score
     # =============================
     def _experience_score(self) -> float:
-        if self.required_experience is None:
-            return 100.0
-
-        if self.candidate_experience is None:
-            return 50.0
-
-        if self.candidate_experience >= self.required_experience:
-            return 100.0
-
-        gap = self.required_experience - self.candidate_experience
-        penalty = min(gap * 20, 100)
-        return max(0.0, 100 - penalty)
+        return experience_score(self.candidate_experience, self.required_experience)
 
     # =============================
     # 🔥 NEW: Weighted Keyword Score
     # =============================
+    def _document(self) -> PreparedDocument:
+        document = self.resume_text = prepare(self.resume_text)
+        return document
+
+    def _has_skill(self, canonical: str) -> bool:
+        if self.resume_terms is not None:
+            return canonical in self.resume_terms
+        if not self.resume_text:
+            return False
+        text = self._document().text
+        return any(contains_term(text, term) for term in SKILL_TERMS.get(canonical, ()))
+
+    def _has_keyword(self, skill: str) -> bool:
+        if self.resume_terms is not None and skill in self.resume_terms:
+            return True
+        if skill in TAXONOMY_SKILLS:
+            return self._has_skill(skill)
+        if skill in SKILL_NORMALIZATION:
+            return self._has_skill(SKILL_NORMALIZATION[skill])
+        if not self.resume_text:
+            return False
+
+        # a skill outside the taxonomy isn't in any term set: look for it
+        # in the text with the same word boundaries
+        document = self._document()
+        if TOKEN_RE.fullmatch(skill):
+            return skill in document.words
+        return contains_term(document.text, skill)
+
     def _keyword_score(self) -> float:
         total_weight = 0
         hits = 0
@@ -58,13 +122,13 @@ class WeightedATSEngine:
         # required skills → weight 2
         for skill in self.required_skills:
             total_weight += 2
-            if skill in self.resume_text:
+            if self._has_keyword(skill):
                 hits += 2
 
         # preferred skills → weight 1
         for skill in self.preferred_skills:
             total_weight += 1
-            if skill in self.resume_text:
+            if self._has_keyword(skill):
                 hits += 1
 
         if total_weight == 0:
@@ -75,7 +139,8 @@ class WeightedATSEngine:
     # =============================
     # Final Weighted Score
     # =============================
-    def compute(self) -> Dict[str, Any]:
+    def scores(self) -> Tuple[float, float, float, float]:
+        """Unrounded ``(final, skill, experience, keyword)`` scores."""
         skill_score = self.skill_match_percent
         exp_score = self._experience_score()
         keyword_score = self._keyword_score()
@@ -86,16 +151,21 @@ class WeightedATSEngine:
             + 0.20 * keyword_score
             + 0.15 * 100  # resume quality placeholder
         )
+        return final_score, skill_score, exp_score, keyword_score
+
+    def compute(self) -> Dict[str, Any]:
+        final_score, skill_score, exp_score, keyword_score = self.scores()
 
         return {
             "final_ats_score": round(final_score, 2),
             "skill_score": round(skill_score, 2),
             "experience_score": round(exp_score, 2),
             "keyword_score": round(keyword_score, 2),
-            "strength": self._label(final_score),
+            "strength": self.label(final_score),
         }
 
-    def _label(self, score: float) -> str:
+    @staticmethod
+    def label(score: float) -> str:
         if score >= 80:
             return "Excellent Fit"
         if score >= 65: